@@ -0,0 +1,147 @@
+"""
+Benchmark: sync vs. asyncio malfunction reporting against a slow backend
+
+Creates one report per station through CreateMalfunctionReportUseCase
+(sequentially, as the Streamlit UI does) and through
+AsyncCreateMalfunctionReportUseCase with a range of in-flight request
+limits. Both run against in-process in-memory repositories that add a
+fixed simulated latency to every repository call, standing in for a
+networked database; the sync side sleeps, the async side awaits.
+
+Run from the project root:
+    python -m benchmarks.bench_async_use_cases [--requests 400] [--latency-ms 5] [--concurrency 1 10 50 200]
+"""
+import argparse
+import asyncio
+import time
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.threaded_async_station_repository import ThreadedAsyncStationRepository
+from contexts.reporting.application.dtos.create_report_dto import CreateReportRequest
+from contexts.reporting.application.use_cases.async_create_malfunction_report_use_case import AsyncCreateMalfunctionReportUseCase
+from contexts.reporting.application.use_cases.create_malfunction_report_use_case import CreateMalfunctionReportUseCase
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.services.async_malfunction_report_service import AsyncMalfunctionReportService
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.infrastructure.repositories.threaded_async_report_repository import ThreadedAsyncReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class SleepingRepository:
+    """Sync stand-in: every repository call blocks for `latency` seconds first"""
+    
+    def __init__(self, inner, latency: float):
+        self._inner = inner
+        self._latency = latency
+    
+    def __getattr__(self, name):
+        method = getattr(self._inner, name)
+        
+        def call(*args, **kwargs):
+            time.sleep(self._latency)
+            return method(*args, **kwargs)
+        
+        return call
+
+
+class LatentAsyncStationRepository(ThreadedAsyncStationRepository):
+    """Async stand-in: awaits `latency` seconds, then calls the in-memory repository inline"""
+    
+    def __init__(self, inner, latency: float):
+        super().__init__(inner)
+        self._latency = latency
+    
+    async def _run(self, method, *args):
+        await asyncio.sleep(self._latency)
+        return method(*args)
+
+
+class LatentAsyncReportRepository(ThreadedAsyncReportRepository):
+    """Async stand-in for the report repository, see LatentAsyncStationRepository"""
+    
+    def __init__(self, inner, latency: float):
+        super().__init__(inner)
+        self._latency = latency
+    
+    async def _run(self, method, *args):
+        await asyncio.sleep(self._latency)
+        return method(*args)
+
+
+def make_station_repository(stations: int) -> InMemoryStationRepository:
+    repository = InMemoryStationRepository()
+    repository.save_all(
+        OperationalStation(station_id=StationId(f"BENCH-{i:06d}"), name=f"Station {i}", postal_code="10115")
+        for i in range(stations)
+    )
+    return repository
+
+
+def make_requests(count: int):
+    return [
+        CreateReportRequest(
+            station_id=f"BENCH-{i:06d}",
+            malfunction_type=MalfunctionType.NOT_CHARGING,
+            description="Charger does not start a session."
+        )
+        for i in range(count)
+    ]
+
+
+def run_sync(requests, latency: float) -> float:
+    service = MalfunctionReportService(
+        SleepingRepository(InMemoryReportRepository(), latency),
+        SleepingRepository(make_station_repository(len(requests)), latency)
+    )
+    use_case = CreateMalfunctionReportUseCase(service)
+    
+    start = time.perf_counter()
+    for request in requests:
+        assert use_case.execute(request).success
+    return time.perf_counter() - start
+
+
+async def run_async(requests, latency: float, concurrency: int) -> float:
+    service = AsyncMalfunctionReportService(
+        LatentAsyncReportRepository(InMemoryReportRepository(), latency),
+        LatentAsyncStationRepository(make_station_repository(len(requests)), latency)
+    )
+    use_case = AsyncCreateMalfunctionReportUseCase(service)
+    in_flight = asyncio.Semaphore(concurrency)
+    
+    async def one(request):
+        async with in_flight:
+            response = await use_case.execute(request)
+        assert response.success
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(one(request) for request in requests))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200])
+    args = parser.parse_args()
+    
+    latency = args.latency_ms / 1000
+    requests = make_requests(args.requests)
+    # submit + process = 5 repository round trips per request
+    print(f"\n{args.requests:,} create-report requests, {args.latency_ms:g} ms per repository call")
+    
+    elapsed = run_sync(requests, latency)
+    baseline = args.requests / elapsed
+    print(f"  sync, sequential      : {elapsed * 1000:8.1f} ms  {baseline:8.1f} req/s")
+    
+    for concurrency in args.concurrency:
+        elapsed = asyncio.run(run_async(requests, latency, concurrency))
+        throughput = args.requests / elapsed
+        print(f"  async, {concurrency:4d} in flight : {elapsed * 1000:8.1f} ms  {throughput:8.1f} req/s  {throughput / baseline:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
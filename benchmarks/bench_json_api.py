@@ -0,0 +1,137 @@
+"""
+Benchmark: JSON API requests per second over keep-alive connections
+
+Starts presentation.api.ApiServer on a loopback port in front of
+synthetic Berlin stations, then has a number of client threads each issue
+requests over one persistent HTTP/1.1 connection. The "sqlite" backend is
+the wiring build_system() serves in production (cluster-indexed SQLite
+stations, SQLite reports) on files in a temporary directory; "in_memory"
+shows the cost of HTTP and routing alone.
+
+Run from the project root:
+    python -m benchmarks.bench_json_api [--stations 5000] [--requests 2000] [--clients 1 4 16]
+                                        [--backends in_memory sqlite]
+"""
+import argparse
+import http.client
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, Tuple
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.repositories.i_station_repository import IStationRepository
+from contexts.discovery.infrastructure.repositories.cluster_indexed_station_repository import ClusterIndexedStationRepository
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import SqliteStationRepository
+from contexts.discovery.infrastructure.spatial.station_cluster_index import GridStationClusterIndex
+from contexts.reporting.domain.repositories.i_report_repository import IReportRepository
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.infrastructure.repositories.sqlite_report_repository import SqliteReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+from presentation.api import ApiServer, build_api
+
+
+TARGETS = [
+    "/stations/BENCH-000042",
+    "/stations/nearest?lat=52.52&lon=13.40&k=5",
+    "/stations?postal_code=10115",
+]
+
+
+Repositories = Tuple[IStationRepository, IReportRepository]
+
+
+@contextmanager
+def in_memory_repositories(directory: Path) -> Iterator[Repositories]:
+    yield InMemoryStationRepository(), InMemoryReportRepository()
+
+
+@contextmanager
+def sqlite_repositories(directory: Path) -> Iterator[Repositories]:
+    """Same repositories as build_system(), on files under `directory`"""
+    stations = SqliteStationRepository(directory / "stations.sqlite3")
+    reports = SqliteReportRepository(directory / "reports.sqlite3")
+    try:
+        yield ClusterIndexedStationRepository(stations, GridStationClusterIndex()), reports
+    finally:
+        reports.close()
+        stations.close()
+
+
+BACKENDS: Dict[str, Callable[[Path], ContextManager[Repositories]]] = {
+    "in_memory": in_memory_repositories,
+    "sqlite": sqlite_repositories,
+}
+
+
+def load_stations(repository: IStationRepository, stations: int) -> None:
+    repository.save_all(
+        OperationalStation(
+            station_id=StationId(f"BENCH-{i:06d}"),
+            name=f"Station {i}",
+            postal_code=str(10115 + i % 60),
+            latitude=52.40 + (i % 100) * 0.003,
+            longitude=13.20 + (i // 100 % 100) * 0.005
+        )
+        for i in range(stations)
+    )
+
+
+def run_clients(port: int, clients: int, requests_per_client: int) -> float:
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        try:
+            for i in range(requests_per_client):
+                connection.request("GET", TARGETS[i % len(TARGETS)])
+                response = connection.getresponse()
+                response.read()
+                assert response.status == 200, response.status
+        finally:
+            connection.close()
+    
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_backend(backend: str, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory, BACKENDS[backend](Path(directory)) as (station_repo, report_repo):
+        load_stations(station_repo, args.stations)
+        service = MalfunctionReportService(report_repo, station_repo)
+        server = ApiServer(("127.0.0.1", 0), build_api(service, station_repo))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        
+        print(f"\n{backend}: {args.stations:,} stations, {args.requests:,} GET requests per run, keep-alive connections")
+        try:
+            for clients in args.clients:
+                per_client = max(args.requests // clients, 1)
+                elapsed = run_clients(server.server_port, clients, per_client)
+                total = per_client * clients
+                print(f"  {clients:3d} client(s): {elapsed * 1000:8.1f} ms  {total / elapsed:8.1f} req/s")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stations", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["in_memory", "sqlite"])
+    args = parser.parse_args()
+    
+    for backend in args.backends:
+        run_backend(backend, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: single-process vs. multi-process national register ingestion
+
+Times LadesaeulenregisterLoader.stream_national_stations on a synthetic
+national register for a range of worker counts and checks that every run
+produces the same station IDs as the single-process run.
+
+Run from the project root:
+    python -m benchmarks.bench_parallel_register [--rows 400000] [--workers 1 2 4 8 16]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_register_prefilter import write_synthetic_register
+from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    args = parser.parse_args()
+    
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "Ladesaeulenregister.csv"
+        write_synthetic_register(csv_path, args.rows)
+        loader = LadesaeulenregisterLoader(csv_path=csv_path)
+        
+        results = []
+        reference_ids = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            ids = [s.station_id.value for s in loader.stream_national_stations(workers=workers)]
+            elapsed = time.perf_counter() - start
+            
+            if reference_ids is None:
+                reference_ids = ids
+            assert ids == reference_ids, f"{workers} workers produced different station IDs"
+            results.append((workers, elapsed))
+    
+    baseline = results[0][1]
+    print(f"\nSynthetic register: {args.rows:,} rows, {len(reference_ids):,} unique stations, {cores} cores")
+    for workers, elapsed in results:
+        print(f"  {workers:2d} worker(s): {elapsed * 1000:8.1f} ms   speedup {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: full DictReader parse vs. memory-mapped byte prefilter
+
+Generates a synthetic Ladesaeulenregister-sized CSV (national register,
+~4% Berlin rows, a few quoted multi-line fields) and times how long each
+ingestion path takes to produce the Berlin stations.
+
+Run from the project root:
+    python -m benchmarks.bench_register_prefilter [--rows 100000] [--repeat 3]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+
+
+COLUMNS = [
+    "Betreiber", "Straße", "Hausnummer", "Adresszusatz", "Postleitzahl", "Ort", "Bundesland",
+    "Kreis/kreisfreie Stadt", "Breitengrad", "Längengrad", "Inbetriebnahmedatum",
+    "Nennleistung Ladeeinrichtung [kW]", "Art der Ladeeinrichung", "Anzahl Ladepunkte",
+    "Steckertypen1", "P1 [kW]", "Public Key1", "Steckertypen2", "P2 [kW]", "Public Key2",
+]
+
+REGIONS = [
+    ("München", "Bayern", "80"), ("Hamburg", "Hamburg", "20"), ("Köln", "Nordrhein-Westfalen", "50"),
+    ("Stuttgart", "Baden-Württemberg", "70"), ("Leipzig", "Sachsen", "04"), ("Hannover", "Niedersachsen", "30"),
+    ("Dresden", "Sachsen", "01"), ("Frankfurt am Main", "Hessen", "60"),
+]
+OPERATORS = ["EnBW mobility+ AG & Co. KG", "Allego GmbH", "Tesla Germany GmbH", "Stadtwerke", "IONITY GmbH"]
+
+
+def write_synthetic_register(path: Path, rows: int, berlin_share: float = 0.04, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(";".join(COLUMNS) + "\n")
+        for i in range(rows):
+            if rng.random() < berlin_share:
+                ort, land, prefix = "Berlin", "Berlin", rng.choice(["10", "12", "13", "14"])
+            else:
+                ort, land, prefix = rng.choice(REGIONS)
+            
+            operator = rng.choice(OPERATORS)
+            if i % 997 == 0:
+                # Occasional quoted field with an embedded newline and escaped quotes
+                operator = f'"{operator}\nNiederlassung ""Nord"""'
+            
+            values = [
+                operator, f"Teststraße {i % 300}", str(i % 120), "", f"{prefix}{rng.randint(100, 999)}",
+                ort, land, ort, f"{rng.uniform(47.3, 55.0):.6f}".replace(".", ","),
+                f"{rng.uniform(5.9, 15.0):.6f}".replace(".", ","), "01.01.2022", "22", "Normalladeeinrichtung",
+                "2", "AC Steckdose Typ 2", "22", "", "AC Steckdose Typ 2", "22", "",
+            ]
+            file.write(";".join(values) + "\n")
+
+
+def time_path(csv_path: Path, use_prefilter: bool, repeat: int):
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        loader = LadesaeulenregisterLoader(csv_path=csv_path, use_prefilter=use_prefilter)
+        start = time.perf_counter()
+        count = sum(1 for _ in loader.stream_berlin_stations())
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "Ladesaeulenregister.csv"
+        write_synthetic_register(csv_path, args.rows)
+        size_mb = csv_path.stat().st_size / 1e6
+        
+        full_time, full_count = time_path(csv_path, use_prefilter=False, repeat=args.repeat)
+        fast_time, fast_count = time_path(csv_path, use_prefilter=True, repeat=args.repeat)
+    
+    assert full_count == fast_count, "paths disagree on the number of Berlin stations"
+    
+    print(f"\nSynthetic register: {args.rows:,} rows, {size_mb:.1f} MB, {full_count:,} Berlin stations")
+    print(f"  full DictReader parse : {full_time * 1000:8.1f} ms")
+    print(f"  mmap byte prefilter   : {fast_time * 1000:8.1f} ms")
+    print(f"  speedup               : {full_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
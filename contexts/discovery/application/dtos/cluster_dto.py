@@ -0,0 +1,38 @@
+"""DTOs for clustered map queries"""
+from dataclasses import dataclass
+from typing import List
+
+from contexts.discovery.domain.value_objects.station_cluster import StationCluster
+from contexts.shared_kernel.common.geo_point import GeoPoint
+
+
+@dataclass(frozen=True)
+class ClusterRequest:
+    """Request DTO for the station clusters of a map view at one zoom level"""
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+    zoom: int
+    
+    def __post_init__(self):
+        """Validate DTO fields"""
+        # GeoPoint validates the coordinate ranges of both corners
+        GeoPoint(self.min_lat, self.min_lon)
+        GeoPoint(self.max_lat, self.max_lon)
+        
+        if self.min_lat > self.max_lat or self.min_lon > self.max_lon:
+            raise ValueError("Viewport minimum must not exceed maximum")
+        
+        if self.zoom < 0:
+            raise ValueError("Zoom level cannot be negative")
+
+
+@dataclass(frozen=True)
+class ClusterResponse:
+    """Response DTO for a clustered map query"""
+    clusters: List[StationCluster]
+    
+    @property
+    def station_count(self) -> int:
+        return sum(cluster.count for cluster in self.clusters)
\ No newline at end of file
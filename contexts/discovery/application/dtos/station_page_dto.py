@@ -0,0 +1,58 @@
+"""DTOs for paginated station searches"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+
+
+MAX_PAGE_SIZE = 100
+
+# Position of a station in a result ordering, e.g. (station_id,) or (distance, station_id)
+SortKey = Tuple
+
+
+def encode_cursor(sort_key: SortKey) -> str:
+    """Opaque cursor pointing just past the station with this sort key"""
+    raw = json.dumps(list(sort_key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Sort key of the last station on the previous page"""
+    try:
+        sort_key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (UnicodeError, binascii.Error, ValueError):
+        raise ValueError("Invalid page cursor")
+    if not isinstance(sort_key, list) or not sort_key:
+        raise ValueError("Invalid page cursor")
+    return tuple(sort_key)
+
+
+@dataclass(frozen=True)
+class StationPageRequest:
+    """Request DTO for one page of a station search"""
+    cursor: Optional[str] = None
+    page_size: int = 20
+    
+    def __post_init__(self):
+        """Validate DTO fields"""
+        if not 0 < self.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+        
+        if self.cursor is not None:
+            decode_cursor(self.cursor)
+
+
+@dataclass(frozen=True)
+class StationPage:
+    """Response DTO for one page of a station search"""
+    stations: List[OperationalStation]
+    total_count: int
+    next_cursor: Optional[str]
+    
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
@@ -0,0 +1,39 @@
+"""DTOs for map viewport queries"""
+from dataclasses import dataclass
+from typing import List
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.shared_kernel.common.geo_point import GeoPoint
+
+
+@dataclass(frozen=True)
+class ViewportRequest:
+    """Request DTO for the stations visible in a map view"""
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+    limit: int = 500
+    
+    def __post_init__(self):
+        """Validate DTO fields"""
+        # GeoPoint validates the coordinate ranges of both corners
+        GeoPoint(self.min_lat, self.min_lon)
+        GeoPoint(self.max_lat, self.max_lon)
+        
+        if self.min_lat > self.max_lat or self.min_lon > self.max_lon:
+            raise ValueError("Viewport minimum must not exceed maximum")
+        
+        if self.limit <= 0:
+            raise ValueError("Limit must be positive")
+
+
+@dataclass(frozen=True)
+class ViewportResponse:
+    """Response DTO for a map viewport query"""
+    stations: List[OperationalStation]
+    truncated: bool
+    
+    @property
+    def count(self) -> int:
+        return len(self.stations)
@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.repositories.i_async_station_repository import IAsyncStationRepository
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.common.postal_code import PostalCode
+from contexts.shared_kernel.common.geo_point import GeoPoint
+from contexts.shared_kernel.common.region import BERLIN, Region
+
+
+class AsyncSearchStationsUseCase:
+    """Asyncio counterpart of SearchStationsUseCase"""
+    
+    def __init__(self, station_repository: IAsyncStationRepository, region: Region = BERLIN):
+        self._repository = station_repository
+        self._region = region
+    
+    async def execute_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        """Search stations by postal code"""
+        postal_code_vo = PostalCode(postal_code, self._region)
+        return await self._repository.find_by_postal_code(postal_code_vo.value)
+    
+    async def execute_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        """Find the k stations closest to a location"""
+        if k <= 0:
+            raise ValueError("Number of stations must be positive")
+        
+        point = GeoPoint(latitude, longitude)
+        return await self._repository.find_nearest(point.latitude, point.longitude, k, status=status)
+    
+    async def execute_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        """Find all stations within a radius (in meters) of a location"""
+        if meters <= 0:
+            raise ValueError("Radius must be positive")
+        
+        point = GeoPoint(latitude, longitude)
+        return await self._repository.find_within_radius(point.latitude, point.longitude, meters)
+    
+    async def execute_by_id(self, station_id: str) -> OperationalStation:
+        """Get specific station by ID"""
+        station = await self._repository.find_by_id(StationId(station_id))
+        
+        if not station:
+            raise ValueError(f"Station {station_id} not found")
+        
+        return station
+    
+    async def execute_all(self) -> List[OperationalStation]:
+        """Get all stations"""
+        return await self._repository.find_all()
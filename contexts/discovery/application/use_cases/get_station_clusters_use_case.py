@@ -0,0 +1,21 @@
+"""Use case for the station clusters shown on a map view"""
+from ..dtos.cluster_dto import ClusterRequest, ClusterResponse
+from ...domain.repositories.i_station_cluster_index import IStationClusterIndex
+
+
+class GetStationClustersUseCase:
+    """Use Case: Summarize the stations inside the current map bounds as clusters"""
+    
+    def __init__(self, cluster_index: IStationClusterIndex):
+        self._cluster_index = cluster_index
+    
+    def execute(self, request: ClusterRequest) -> ClusterResponse:
+        """Execute the use case for one map viewport and zoom level"""
+        clusters = self._cluster_index.clusters(
+            request.zoom,
+            request.min_lat,
+            request.min_lon,
+            request.max_lat,
+            request.max_lon
+        )
+        return ClusterResponse(clusters=clusters)
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Use case for fetching the stations visible in a map view"""
+from ..dtos.viewport_dto import ViewportRequest, ViewportResponse
+from ...domain.repositories.i_station_repository import IStationRepository
+
+
+class GetStationsInViewportUseCase:
+    """Use Case: Fetch only the stations inside the current map bounds"""
+    
+    def __init__(self, station_repository: IStationRepository):
+        self._repository = station_repository
+    
+    def execute(self, request: ViewportRequest) -> ViewportResponse:
+        """Execute the use case for one map viewport"""
+        # Ask for one extra station to learn whether the view was cut off
+        stations = self._repository.find_in_bbox(
+            request.min_lat,
+            request.min_lon,
+            request.max_lat,
+            request.max_lon,
+            limit=request.limit + 1
+        )
+        
+        return ViewportResponse(
+            stations=stations[:request.limit],
+            truncated=len(stations) > request.limit
+        )
@@ -1,25 +1,93 @@
-from typing import List
+import heapq
+from operator import itemgetter
+from typing import Callable, Iterable, List, Optional
 
+from ..dtos.station_page_dto import SortKey, StationPage, StationPageRequest, decode_cursor, encode_cursor
 from ...domain.entities.operational_station import OperationalStation
 from ...domain.repositories.i_station_repository import IStationRepository
+from ...domain.value_objects.station_status import StationStatus
 from contexts.shared_kernel.common.station_id import StationId
 from contexts.shared_kernel.common.postal_code import PostalCode  # ← ADD THIS
+from contexts.shared_kernel.common.geo_point import GeoPoint, haversine_meters
+from contexts.shared_kernel.common.region import BERLIN, Region
 
 
 class SearchStationsUseCase:
     """Use case for searching charging stations"""
     
-    def __init__(self, station_repository: IStationRepository):
+    def __init__(self, station_repository: IStationRepository, region: Region = BERLIN):
         self._repository = station_repository
+        # Postal codes are validated against the ranges of the region being served
+        self._region = region
     
     def execute_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
         """Search stations by postal code"""
         # PostalCode value object handles all validation
-        postal_code_vo = PostalCode(postal_code)
+        postal_code_vo = PostalCode(postal_code, self._region)
         
         # Use the validated value
         return self._repository.find_by_postal_code(postal_code_vo.value)
     
+    def execute_by_postal_code_page(
+        self,
+        postal_code: str,
+        page: StationPageRequest = StationPageRequest(),
+        operational_only: bool = False
+    ) -> StationPage:
+        """One page of the stations in a postal code, ordered by station ID"""
+        return self.paginate_by_station_id(
+            self.execute_by_postal_code(postal_code), page, operational_only=operational_only
+        )
+    
+    def paginate_by_station_id(
+        self,
+        stations: List[OperationalStation],
+        page: StationPageRequest = StationPageRequest(),
+        operational_only: bool = False
+    ) -> StationPage:
+        """One page of stations the caller already fetched, ordered by station ID"""
+        if operational_only:
+            stations = [station for station in stations if station.is_operational]
+        return _paginate(stations, page, _by_station_id)
+    
+    def execute_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        """Find the k stations closest to a location"""
+        if k <= 0:
+            raise ValueError("Number of stations must be positive")
+        
+        point = GeoPoint(latitude, longitude)
+        return self._repository.find_nearest(point.latitude, point.longitude, k, status=status)
+    
+    def execute_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        """Find all stations within a radius (in meters) of a location"""
+        if meters <= 0:
+            raise ValueError("Radius must be positive")
+        
+        point = GeoPoint(latitude, longitude)
+        return self._repository.find_within_radius(point.latitude, point.longitude, meters)
+    
+    def execute_within_radius_page(
+        self,
+        latitude: float,
+        longitude: float,
+        meters: float,
+        page: StationPageRequest = StationPageRequest()
+    ) -> StationPage:
+        """One page of the stations within a radius, nearest first"""
+        stations = self.execute_within_radius(latitude, longitude, meters)
+        # Station ID breaks distance ties, so every station has a distinct position
+        sort_key = lambda station: (
+            haversine_meters(latitude, longitude, station.latitude, station.longitude),
+            station.station_id.value
+        )
+        return _paginate(stations, page, sort_key)
+    
     def execute_by_id(self, station_id: str) -> OperationalStation:
         """Get specific station by ID"""
         station_id_vo = StationId(station_id)
@@ -32,4 +100,47 @@ class SearchStationsUseCase:
     
     def execute_all(self) -> List[OperationalStation]:
         """Get all stations"""
-        return self._repository.find_all()
\ No newline at end of file
+        return self._repository.find_all()
+    
+    def execute_all_page(
+        self,
+        page: StationPageRequest = StationPageRequest(),
+        operational_only: bool = False
+    ) -> StationPage:
+        """One page of all stations, ordered by station ID"""
+        stations = self._repository.find_all()
+        if operational_only:
+            stations = [station for station in stations if station.is_operational]
+        return _paginate(stations, page, _by_station_id)
+
+
+def _by_station_id(station: OperationalStation) -> SortKey:
+    return (station.station_id.value,)
+
+
+def _paginate(
+    stations: List[OperationalStation],
+    page: StationPageRequest,
+    sort_key: Callable[[OperationalStation], SortKey]
+) -> StationPage:
+    """
+    Keyset pagination: the cursor holds the sort key of the last station
+    shown, so a page starts right after it even when stations were added
+    or removed in between. Only page_size + 1 stations are ever ordered.
+    """
+    keyed: Iterable = ((sort_key(station), station) for station in stations)
+    if page.cursor is not None:
+        after = decode_cursor(page.cursor)
+        try:
+            keyed = [(key, station) for key, station in keyed if key > after]
+        except TypeError:
+            raise ValueError("Page cursor does not belong to this search")
+    
+    window = heapq.nsmallest(page.page_size + 1, keyed, key=itemgetter(0))
+    shown = window[:page.page_size]
+    next_cursor = encode_cursor(shown[-1][0]) if len(window) > page.page_size else None
+    return StationPage(
+        stations=[station for _, station in shown],
+        total_count=len(stations),
+        next_cursor=next_cursor
+    )
@@ -16,7 +16,8 @@ class OperationalStation:  # Renamed from ChargingStation
         postal_code: str,
         address: Optional[str] = None,
         latitude: Optional[float] = None,
-        longitude: Optional[float] = None
+        longitude: Optional[float] = None,
+        status: StationStatus = StationStatus.AVAILABLE
     ):
         self._station_id = station_id
         self._name = name
@@ -24,11 +25,20 @@ class OperationalStation:  # Renamed from ChargingStation
         self._address = address
         self._latitude = latitude
         self._longitude = longitude
-        self._status = StationStatus.AVAILABLE
+        self._status = status
         self._created_at = datetime.now()
         self._updated_at = datetime.now()
     
     
+    def __eq__(self, other: object) -> bool:
+        """Entities are equal when they share an identity, whatever their current state"""
+        if not isinstance(other, OperationalStation):
+            return NotImplemented
+        return self._station_id == other._station_id
+    
+    def __hash__(self) -> int:
+        return hash(self._station_id)
+    
     @property
     def station_id(self) -> StationId:
         return self._station_id
@@ -0,0 +1,105 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Iterable, Set
+
+from ..entities.operational_station import OperationalStation
+from ..value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class IAsyncStationRepository(ABC):
+    """
+    Asyncio counterpart of IStationRepository
+    
+    Same contract, method for method, for backends that do I/O (a remote
+    database, a service call) and should not block the event loop.
+    """
+    
+    @abstractmethod
+    async def save(self, station: OperationalStation) -> None:
+        pass
+    
+    @abstractmethod
+    async def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        """Bulk upsert, returning how many were saved"""
+        pass
+    
+    @abstractmethod
+    async def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        """Atomic compare-and-set of station statuses, see IStationRepository"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        pass
+    
+    @abstractmethod
+    async def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        """The stations with these ids in one lookup; unknown ids are left out"""
+        pass
+    
+    @abstractmethod
+    async def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        pass
+    
+    @abstractmethod
+    async def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        """Stations currently in one status"""
+        pass
+    
+    @abstractmethod
+    async def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        """Up to k stations closest to the point, nearest first, optionally only in one status"""
+        pass
+    
+    @abstractmethod
+    async def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        """Stations within `meters` of the point, nearest first"""
+        pass
+    
+    @abstractmethod
+    async def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        """Stations inside the bounding box (bounds inclusive), at most `limit` of them"""
+        pass
+    
+    @abstractmethod
+    async def find_all(self) -> List[OperationalStation]:
+        pass
+    
+    @abstractmethod
+    async def exists(self, station_id: StationId) -> bool:
+        pass
+    
+    @abstractmethod
+    async def count(self) -> int:
+        pass
+    
+    @abstractmethod
+    async def count_by_status(self) -> Dict[StationStatus, int]:
+        pass
+    
+    @abstractmethod
+    async def postal_code_version(self, postal_code: str) -> int:
+        """Change counter for one postal code, see IStationRepository"""
+        pass
+    
+    @abstractmethod
+    async def postal_code_versions(self) -> Dict[str, int]:
+        pass
\ No newline at end of file
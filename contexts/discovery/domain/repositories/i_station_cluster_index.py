@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+from ..entities.operational_station import OperationalStation
+from ..value_objects.station_cluster import StationCluster
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class IStationClusterIndex(ABC):
+    """Read model of station clusters per map zoom level"""
+    
+    @abstractmethod
+    def rebuild(self, stations: Iterable[OperationalStation]) -> int:
+        """Replace the whole index, returning how many stations it now holds"""
+        pass
+    
+    @abstractmethod
+    def upsert(self, station: OperationalStation) -> None:
+        """Add a station, or apply a change of its status or position"""
+        pass
+    
+    @abstractmethod
+    def remove(self, station_id: StationId) -> None:
+        pass
+    
+    @abstractmethod
+    def clusters(
+        self,
+        zoom: int,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float
+    ) -> List[StationCluster]:
+        """Clusters at a zoom level whose cells overlap the bounding box"""
+        pass
\ No newline at end of file
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Set
 
 from ..entities.operational_station import OperationalStation
+from ..value_objects.station_status import StationStatus
 from contexts.shared_kernel.common.station_id import StationId
 
 
@@ -12,18 +13,100 @@ class IStationRepository(ABC):
     def save(self, station: OperationalStation) -> None:
         pass
     
+    @abstractmethod
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        """Bulk upsert; consumes the iterable lazily and returns how many were saved"""
+        pass
+    
+    @abstractmethod
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        """
+        Atomically move every listed station that is currently in one of
+        `from_statuses` to `to_status`, and return the ids that moved.
+        
+        The check and the write happen together in the store, so of several
+        writers (threads or processes) racing for the same transition
+        exactly one sees the station move.
+        """
+        pass
+    
     @abstractmethod
     def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
         pass
     
+    @abstractmethod
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        """The stations with these ids in one lookup; unknown ids are left out"""
+        pass
+    
     @abstractmethod
     def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
         pass
     
+    @abstractmethod
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        """Stations currently in one status"""
+        pass
+    
+    @abstractmethod
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        """Up to k stations closest to the point, nearest first, optionally only in one status"""
+        pass
+    
+    @abstractmethod
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        """Stations within `meters` of the point, nearest first"""
+        pass
+    
+    @abstractmethod
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        """Stations inside the bounding box (bounds inclusive), at most `limit` of them"""
+        pass
+    
     @abstractmethod
     def find_all(self) -> List[OperationalStation]:
         pass
     
     @abstractmethod
     def exists(self, station_id: StationId) -> bool:
+        pass
+    
+    @abstractmethod
+    def count(self) -> int:
+        pass
+    
+    @abstractmethod
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        pass
+    
+    @abstractmethod
+    def postal_code_version(self, postal_code: str) -> int:
+        """
+        Change counter for one postal code: grows whenever a save adds a
+        station to it, moves one out of it, or changes the status of one
+        of its stations; 0 while nothing has been saved there
+        """
+        pass
+    
+    @abstractmethod
+    def postal_code_versions(self) -> Dict[str, int]:
+        """Every postal code's change counter, for spotting changes made elsewhere"""
         pass
\ No newline at end of file
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .station_status import StationStatus
+
+
+@dataclass(frozen=True)
+class StationCluster:
+    """
+    Value Object for the stations that share one map cell at one zoom level.
+    
+    Positioned at the centroid of its stations; carries how many of them
+    are in each status so a map can colour or label the cluster without
+    loading the stations themselves.
+    """
+    zoom: int
+    latitude: float
+    longitude: float
+    available: int
+    in_use: int
+    defective: int
+    maintenance: int
+    # Set when the cluster holds exactly one station
+    station_id: Optional[str] = None
+    
+    @property
+    def count(self) -> int:
+        return self.available + self.in_use + self.defective + self.maintenance
+    
+    @property
+    def is_single_station(self) -> bool:
+        return self.station_id is not None
+    
+    def count_for(self, status: StationStatus) -> int:
+        return {
+            StationStatus.AVAILABLE: self.available,
+            StationStatus.IN_USE: self.in_use,
+            StationStatus.DEFECTIVE: self.defective,
+            StationStatus.MAINTENANCE: self.maintenance,
+        }[status]
\ No newline at end of file
@@ -7,3 +7,6 @@ class StationStatus(Enum):
     IN_USE = "in_use"
     DEFECTIVE = "defective"
     MAINTENANCE = "maintenance"
+
+# Stations a malfunction can still be reported for (see OperationalStation.is_operational)
+OPERATIONAL_STATUSES = frozenset({StationStatus.AVAILABLE, StationStatus.IN_USE})
@@ -1,125 +1,466 @@
 import csv
-from typing import List
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
 # NEW IMPORTS - only change these lines!
 from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.repositories.i_station_repository import IStationRepository
 from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.common.region import BERLIN, Region
+from .station_snapshot import StationSnapshot, StationSnapshotCache, station_to_row
+
+
+DEFAULT_CSV_PATH = Path("contexts/shared_kernel/datasets/Ladesaeulenregister.csv")
+NATIONAL_ID_PREFIX = "DE"
+
+
+class StationRecord(NamedTuple):
+    """
+    Normalized register row, ready to become an OperationalStation
+    
+    A NamedTuple rather than a dataclass: records are created and pickled
+    across processes once per register row, and tuples are far cheaper at both.
+    """
+    postal_code: str
+    street: str
+    house_number: str
+    name: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    
+    @property
+    def address(self) -> Optional[str]:
+        return f"{self.street} {self.house_number}".strip() if self.street else None
+    
+    @property
+    def location_key(self) -> str:
+        return f"{self.postal_code}-{self.street}-{self.house_number}"
+
+
+# ---------------------------------------------------------------------------
+# Pipeline stages - each one consumes and yields lazily, so rows are never
+# collected into a list between stages
+# ---------------------------------------------------------------------------
+
+def read_rows(csv_path: Path) -> Iterator[Dict[str, str]]:
+    """Stage 1: Stream raw rows from the register CSV"""
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        # Detect delimiter
+        sample = file.read(2048)
+        file.seek(0)
+        delimiter = ';' if sample.count(';') > sample.count(',') else ','
+        
+        reader = csv.DictReader(file, delimiter=delimiter)
+        
+        print(f"📋 CSV Columns found: {len(reader.fieldnames or [])} columns")
+        
+        yield from reader
+
+
+def read_rows_prefiltered(csv_path: Path, needle: str) -> Iterator[Dict[str, str]]:
+    """
+    Stage 1 (fast path): Stream only rows whose raw bytes contain `needle`
+    
+    The file is memory-mapped and searched for the needle at the byte level,
+    so non-matching records never reach the CSV parser. Record boundaries
+    track quote parity, so quoted fields containing newlines stay intact.
+    This yields a superset of the rows filter_region keeps, in file order.
+    """
+    with open(csv_path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            return
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header, delimiter, header_end = _read_header(data)
+            
+            print(f"📋 CSV Columns found: {len(header)} columns")
+            
+            candidates = _candidate_records(data, header_end, needle.encode('utf-8'))
+            lines = (line for record in candidates for line in _text_lines(record))
+            yield from csv.DictReader(lines, fieldnames=header, delimiter=delimiter)
+
+
+def _read_header(data: mmap.mmap) -> Tuple[List[str], str, int]:
+    """Header fields, detected delimiter and the offset where the body starts"""
+    # Detect delimiter
+    sample = data[:2048].decode('utf-8', errors='ignore')
+    delimiter = ';' if sample.count(';') > sample.count(',') else ','
+    
+    header_end = _record_end(data, 0)
+    header = next(csv.reader(_text_lines(data[:header_end]), delimiter=delimiter))
+    return header, delimiter, header_end
+
+
+def _text_lines(raw: bytes) -> io.StringIO:
+    """Decode raw record bytes into lines the way a text-mode file would"""
+    return io.StringIO(raw.decode('utf-8'), newline=None)
+
+
+def _record_end(data: mmap.mmap, start: int) -> int:
+    """Offset just past the record starting at `start` (a quote-balanced run of lines)"""
+    in_quotes = False
+    position = start
+    size = len(data)
+    
+    while position < size:
+        newline = data.find(b'\n', position)
+        line_end = size if newline == -1 else newline + 1
+        if data[position:line_end].count(b'"') % 2:
+            in_quotes = not in_quotes
+        position = line_end
+        if not in_quotes:
+            break
+    
+    return position
+
+
+def _record_start_before(data: mmap.mmap, boundary: int, limit: int) -> int:
+    """Start of the record containing offset `limit`, walking forward from a known boundary"""
+    while True:
+        end = _record_end(data, boundary)
+        if end > limit or end >= len(data):
+            return boundary
+        boundary = end
+
+
+def _candidate_records(data: mmap.mmap, start: int, needle: bytes) -> Iterator[bytes]:
+    """Raw bytes of every record at or after `start` that contains `needle`"""
+    boundary = start
+    
+    while True:
+        hit = data.find(needle, boundary)
+        if hit == -1:
+            return
+        
+        line_start = data.rfind(b'\n', boundary, hit) + 1 or boundary
+        if data.find(b'"', boundary, line_start) == -1:
+            # No quotes in between, so every newline up to here ends a record
+            record_start = line_start
+        else:
+            record_start = _record_start_before(data, boundary, line_start)
+        
+        record_end = _record_end(data, record_start)
+        yield data[record_start:record_end]
+        boundary = record_end
+
+
+def split_record_ranges(csv_path: Path, parts: int) -> Tuple[List[str], str, List[Tuple[int, int]]]:
+    """
+    Split the register body into up to `parts` record-aligned byte ranges
+    
+    Cut points are moved forward to the next record boundary (tracking quote
+    parity), so no record - including quoted multi-line ones - is split.
+    Returns the header, the delimiter and the (start, end) ranges in file order.
+    """
+    with open(csv_path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            return [], ',', []
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header, delimiter, body_start = _read_header(data)
+            size = len(data)
+            step = max((size - body_start) // max(parts, 1), 1)
+            
+            ranges = []
+            start = body_start
+            while start < size:
+                target = start + step
+                if target >= size:
+                    break
+                
+                newline = data.find(b'\n', target)
+                if newline == -1:
+                    break
+                
+                # start is a record boundary, so an odd quote count up to the
+                # end of this line means we are inside a quoted field - keep
+                # extending line by line until the quotes balance
+                cut = newline + 1
+                in_quotes = data[start:cut].count(b'"') % 2 == 1
+                while in_quotes and cut < size:
+                    newline = data.find(b'\n', cut)
+                    line_end = size if newline == -1 else newline + 1
+                    in_quotes ^= data[cut:line_end].count(b'"') % 2 == 1
+                    cut = line_end
+                
+                ranges.append((start, cut))
+                start = cut
+            
+            if start < size:
+                ranges.append((start, size))
+            return header, delimiter, ranges
+
+
+def _parse_range(task: Tuple[str, List[str], str, int, int, Optional[Union[str, Region]]]) -> List[tuple]:
+    """Worker: read, (optionally) region-filter, normalize and locally dedupe one byte range"""
+    csv_path, header, delimiter, start, end, region = task
+    with open(csv_path, 'rb') as file:
+        file.seek(start)
+        raw = file.read(end - start)
+    
+    rows = csv.DictReader(_text_lines(raw), fieldnames=header, delimiter=delimiter)
+    if region is not None:
+        rows = filter_region(rows, region)
+    # Dropping in-chunk duplicates early is safe: the first occurrence in the
+    # first chunk holding a location is also its first occurrence overall.
+    # Plain tuples pickle much faster than NamedTuple instances.
+    return [tuple(record) for record in dedupe_locations(normalize_rows(rows))]
+
+
+def parse_records_parallel(
+    csv_path: Path,
+    workers: Optional[int] = None,
+    region: Optional[Union[str, Region]] = None,
+    chunks_per_worker: int = 4
+) -> Iterator[StationRecord]:
+    """
+    Stages 1-3 across processes: parse record-aligned byte ranges in a
+    ProcessPoolExecutor and yield the normalized records in file order,
+    so dedupe and ID assignment downstream match a single-process run.
+    """
+    workers = workers or os.cpu_count() or 1
+    header, delimiter, ranges = split_record_ranges(csv_path, workers * chunks_per_worker)
+    tasks = [(str(csv_path), header, delimiter, start, end, region) for start, end in ranges]
+    
+    print(f"📋 CSV Columns found: {len(header)} columns, {len(tasks)} chunks on {workers} workers")
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() returns results in submission order, whatever order workers finish in
+        for records in pool.map(_parse_range, tasks):
+            yield from map(StationRecord._make, records)
+
+
+def filter_region(
+    rows: Iterable[Dict[str, str]],
+    region: Union[str, Region] = "Berlin"
+) -> Iterator[Dict[str, str]]:
+    """Stage 2: Keep only rows whose city or federal state matches the region"""
+    if isinstance(region, str):
+        name = region
+        matches = lambda ort, bundesland: name in ort or name in bundesland
+    else:
+        matches = region.matches
+    
+    for row in rows:
+        ort = (row.get('Ort') or '').strip()
+        bundesland = (row.get('Bundesland') or '').strip()
+        
+        if matches(ort, bundesland):
+            yield row
+
+
+def _parse_coordinate(value: Optional[str]) -> Optional[float]:
+    """Parse a German-formatted decimal coordinate"""
+    if not value:
+        return None
+    try:
+        return float(value.replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def normalize_rows(rows: Iterable[Dict[str, str]]) -> Iterator[StationRecord]:
+    """Stage 3: Turn raw rows into StationRecords, skipping unusable rows"""
+    for row in rows:
+        try:
+            # Get postal code
+            postal_code = row.get('Postleitzahl', '').strip()
+            if not postal_code:
+                continue
+            
+            street = row.get('Straße', row.get('Strasse', '')).strip()
+            house_num = row.get('Hausnummer', '').strip()
+            
+            # Create name
+            operator = row.get('Betreiber', '').strip()
+            name = operator if operator else f"Station {postal_code}"
+            if len(name) > 100:
+                name = name[:97] + "..."
+            
+            yield StationRecord(
+                postal_code=postal_code,
+                street=street,
+                house_number=house_num,
+                name=name,
+                latitude=_parse_coordinate(row.get('Breitengrad', '')),
+                longitude=_parse_coordinate(row.get('Längengrad', ''))
+            )
+        
+        except Exception:
+            continue
+
+
+def dedupe_locations(records: Iterable[StationRecord]) -> Iterator[StationRecord]:
+    """Stage 4: Drop records for a location that has already been seen"""
+    seen_locations = set()
+    for record in records:
+        if record.location_key in seen_locations:
+            continue
+        seen_locations.add(record.location_key)
+        yield record
+
+
+def build_stations(records: Iterable[StationRecord], id_prefix: str = "BERLIN") -> Iterator[OperationalStation]:
+    """Stage 5: Build OperationalStation entities with sequential IDs, skipping rows they reject"""
+    station_counter = 1
+    for record in records:
+        try:
+            station = OperationalStation(
+                station_id=StationId(f"{id_prefix}-{record.postal_code}-{station_counter:04d}"),
+                name=record.name,
+                postal_code=record.postal_code,
+                address=record.address,
+                latitude=record.latitude,
+                longitude=record.longitude
+            )
+        except Exception:
+            # One bad register row (e.g. a postal code too long for a station ID) must not abort the load
+            continue
+        
+        station_counter += 1
+        yield station
 
 
 class LadesaeulenregisterLoader:
     """Loader for German Ladesaeulenregister CSV format"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        csv_path: Optional[Path] = None,
+        snapshot_cache: Optional[StationSnapshotCache] = None,
+        use_prefilter: bool = True
+    ):
         """Initialize loader and find the CSV file"""
-        self.csv_path = Path("contexts/shared_kernel/datasets/Ladesaeulenregister.csv")
+        self.csv_path = Path(csv_path) if csv_path else DEFAULT_CSV_PATH
+        self._snapshot_cache = snapshot_cache
+        self._use_prefilter = use_prefilter
         
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV not found at: {self.csv_path}")
         
         print(f"📂 Found CSV at: {self.csv_path}")
     
+    def stream_berlin_stations(self) -> Iterator[OperationalStation]:
+        """Lazily yield Berlin charging stations, one row at a time"""
+        if self._snapshot_cache is None:
+            return self._parse_berlin_stations()
+        
+        snapshot = self._snapshot_cache.load(self.csv_path)
+        if snapshot is not None:
+            return snapshot.stations()
+        
+        return self._parse_and_snapshot()
+    
+    def stream_region_stations(self, region: Region) -> Iterator[OperationalStation]:
+        """
+        Lazily yield the stations of one region, IDs prefixed with region.id_prefix
+        
+        Berlin goes through the snapshot cache; other regions are parsed
+        on demand, prefiltered on the region's name where it has a single one.
+        """
+        if region == BERLIN:
+            return self.stream_berlin_stations()
+        return self._parse_region_stations(region)
+    
+    def stream_national_stations(self, workers: Optional[int] = None) -> Iterator[OperationalStation]:
+        """
+        Yield stations from every Bundesland
+        
+        workers=1 parses in-process; otherwise byte ranges are parsed on
+        `workers` processes (default: all cores). Both give identical IDs.
+        """
+        if workers == 1:
+            records = normalize_rows(read_rows(self.csv_path))
+        else:
+            records = parse_records_parallel(self.csv_path, workers)
+        return build_stations(dedupe_locations(records), id_prefix=NATIONAL_ID_PREFIX)
+    
+    def load_national_into(self, repository: IStationRepository, workers: Optional[int] = None) -> int:
+        """Stream stations from every Bundesland into a repository"""
+        count = repository.save_all(self.stream_national_stations(workers))
+        print(f"✅ Loaded {count} stations nationwide")
+        return count
+    
+    def load_snapshot(self) -> StationSnapshot:
+        """Get parsed stations and derived indexes, reusing the cached snapshot when fresh"""
+        if self._snapshot_cache is not None:
+            snapshot = self._snapshot_cache.load(self.csv_path)
+            if snapshot is not None:
+                return snapshot
+        
+        snapshot = StationSnapshot.from_rows(
+            [station_to_row(station) for station in self._parse_berlin_stations()]
+        )
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.write(self.csv_path, snapshot)
+        return snapshot
+    
+    def _parse_berlin_stations(self) -> Iterator[OperationalStation]:
+        return self._parse_region_stations(BERLIN)
+    
+    def _parse_region_stations(self, region: Region) -> Iterator[OperationalStation]:
+        needle = region.search_term
+        if self._use_prefilter and needle is not None:
+            rows = read_rows_prefiltered(self.csv_path, needle)
+        else:
+            rows = read_rows(self.csv_path)
+        region_rows = filter_region(rows, region)
+        records = dedupe_locations(normalize_rows(region_rows))
+        return build_stations(records, id_prefix=region.id_prefix)
+    
+    def _parse_and_snapshot(self) -> Iterator[OperationalStation]:
+        """Parse the CSV and write a snapshot once the stream is fully consumed"""
+        rows = []
+        for station in self._parse_berlin_stations():
+            rows.append(station_to_row(station))
+            yield station
+        
+        self._snapshot_cache.write(self.csv_path, StationSnapshot.from_rows(rows))
+    
+    def load_into(self, repository: IStationRepository) -> int:
+        """Stream Berlin stations straight into a repository"""
+        count = repository.save_all(self.stream_berlin_stations())
+        print(f"✅ Loaded {count} Berlin stations")
+        return count
+    
     def load_berlin_stations(self) -> List[OperationalStation]:
         """Load all Berlin charging stations"""
-        stations = []
-        seen_locations = set()
-        station_counter = 1
-        
-        with open(self.csv_path, 'r', encoding='utf-8') as file:
-            # Detect delimiter
-            sample = file.read(2048)
-            file.seek(0)
-            delimiter = ';' if sample.count(';') > sample.count(',') else ','
-            
-            reader = csv.DictReader(file, delimiter=delimiter)
-            
-            print(f"📋 CSV Columns found: {len(reader.fieldnames)} columns")
-            
-            for row in reader:
-                try:
-                    # Filter for Berlin
-                    ort = row.get('Ort', '').strip()
-                    bundesland = row.get('Bundesland', '').strip()
-                    
-                    if 'Berlin' not in ort and 'Berlin' not in bundesland:
-                        continue
-                    
-                    # Get postal code
-                    postal_code = row.get('Postleitzahl', '').strip()
-                    if not postal_code:
-                        continue
-                    
-                    # Build address
-                    street = row.get('Straße', row.get('Strasse', '')).strip()
-                    house_num = row.get('Hausnummer', '').strip()
-                    address = f"{street} {house_num}".strip() if street else None
-                    
-                    # Unique location check
-                    location_key = f"{postal_code}-{street}-{house_num}"
-                    if location_key in seen_locations:
-                        continue
-                    seen_locations.add(location_key)
-                    
-                    # Create name
-                    operator = row.get('Betreiber', '').strip()
-                    name = operator if operator else f"Station {postal_code}"
-                    if len(name) > 100:
-                        name = name[:97] + "..."
-                    
-                    # Get coordinates
-                    lat = row.get('Breitengrad', '')
-                    lon = row.get('Längengrad', '')
-                    
-                    latitude = None
-                    longitude = None
-                    
-                    if lat:
-                        try:
-                            latitude = float(lat.replace(',', '.'))
-                        except:
-                            pass
-                    
-                    if lon:
-                        try:
-                            longitude = float(lon.replace(',', '.'))
-                        except:
-                            pass
-                    
-                    # Create station
-                    station_id = f"BERLIN-{postal_code}-{station_counter:04d}"
-                    station_counter += 1
-                    
-                    station = OperationalStation(
-                        station_id=StationId(station_id),
-                        name=name,
-                        postal_code=postal_code,
-                        address=address,
-                        latitude=latitude,
-                        longitude=longitude
-                    )
-                    
-                    stations.append(station)
-                    
-                except Exception:
-                    continue
-        
+        stations = list(self.stream_berlin_stations())
         print(f"✅ Loaded {len(stations)} Berlin stations")
         return stations
     
     def get_summary(self) -> dict:
         """Get summary statistics"""
-        stations = self.load_berlin_stations()
+        if self._snapshot_cache is not None:
+            snapshot = self.load_snapshot()
+            return self._summarize(
+                total=len(snapshot.rows),
+                postal_codes={code: len(ids) for code, ids in snapshot.postal_code_index.items()},
+                stations_with_coords=snapshot.stations_with_coordinates
+            )
         
+        total = 0
         postal_codes = {}
-        for station in stations:
-            postal_codes[station.postal_code] = postal_codes.get(station.postal_code, 0) + 1
+        stations_with_coords = 0
         
-        stations_with_coords = sum(1 for s in stations if s.latitude and s.longitude)
+        for station in self.stream_berlin_stations():
+            total += 1
+            postal_codes[station.postal_code] = postal_codes.get(station.postal_code, 0) + 1
+            if station.latitude and station.longitude:
+                stations_with_coords += 1
         
+        return self._summarize(total, postal_codes, stations_with_coords)
+    
+    @staticmethod
+    def _summarize(total: int, postal_codes: Dict[str, int], stations_with_coords: int) -> dict:
         return {
-            'total_berlin_stations': len(stations),
+            'total_berlin_stations': total,
             'unique_postal_codes': len(postal_codes),
             'stations_per_postal_code': dict(sorted(postal_codes.items())),
             'stations_with_coordinates': stations_with_coords,
-            'coverage_percentage': round((stations_with_coords / len(stations) * 100), 1) if stations else 0
+            'coverage_percentage': round((stations_with_coords / total * 100), 1) if total else 0
         }
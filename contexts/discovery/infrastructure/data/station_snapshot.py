@@ -0,0 +1,141 @@
+"""Binary snapshot cache for parsed Ladesaeulenregister stations"""
+import hashlib
+import os
+import pickle
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.shared_kernel.common.station_id import StationId
+
+
+# station_id, name, postal_code, address, latitude, longitude
+StationRow = Tuple[str, str, str, Optional[str], Optional[float], Optional[float]]
+
+DEFAULT_SNAPSHOT_PATH = Path("contexts/shared_kernel/datasets/Ladesaeulenregister.snapshot")
+
+_MAGIC = b"EVSNAP01"
+_FORMAT_VERSION = 1
+# magic, format version, source size, source mtime (ns), source blake2b digest
+_HEADER = struct.Struct("<8sHQq32s")
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Identity of the CSV a snapshot was built from"""
+    size: int
+    mtime_ns: int
+    content_hash: bytes
+    
+    @classmethod
+    def of(cls, path: Path) -> "SourceFingerprint":
+        stat = path.stat()
+        return cls(stat.st_size, stat.st_mtime_ns, _hash_file(path))
+
+
+@dataclass
+class StationSnapshot:
+    """Parsed stations plus the indexes derived from them"""
+    rows: List[StationRow]
+    postal_code_index: Dict[str, List[int]] = field(default_factory=dict)
+    
+    @classmethod
+    def from_rows(cls, rows: List[StationRow]) -> "StationSnapshot":
+        index: Dict[str, List[int]] = {}
+        for position, row in enumerate(rows):
+            index.setdefault(row[2], []).append(position)
+        return cls(rows=rows, postal_code_index=index)
+    
+    def stations(self) -> Iterator[OperationalStation]:
+        """Rebuild OperationalStation entities from the stored rows"""
+        for station_id, name, postal_code, address, latitude, longitude in self.rows:
+            yield OperationalStation(
+                station_id=StationId(station_id),
+                name=name,
+                postal_code=postal_code,
+                address=address,
+                latitude=latitude,
+                longitude=longitude
+            )
+    
+    @property
+    def stations_with_coordinates(self) -> int:
+        return sum(1 for row in self.rows if row[4] and row[5])
+
+
+def station_to_row(station: OperationalStation) -> StationRow:
+    return (
+        station.station_id.value,
+        station.name,
+        station.postal_code,
+        station.address,
+        station.latitude,
+        station.longitude,
+    )
+
+
+def _hash_file(path: Path, chunk_size: int = 1 << 20) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class StationSnapshotCache:
+    """
+    Stores parsed stations next to the register CSV so later starts can skip parsing.
+    
+    A snapshot is reused when the source size matches and either its mtime
+    or its content hash matches; anything else counts as a changed source.
+    """
+    
+    def __init__(self, snapshot_path: Path):
+        self.snapshot_path = Path(snapshot_path)
+    
+    def load(self, source_path: Path) -> Optional[StationSnapshot]:
+        """Return the cached snapshot for source_path, or None if missing or stale"""
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                header = file.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return None
+                
+                magic, version, size, mtime_ns, content_hash = _HEADER.unpack(header)
+                if magic != _MAGIC or version != _FORMAT_VERSION:
+                    return None
+                
+                stat = Path(source_path).stat()
+                if stat.st_size != size:
+                    return None
+                if stat.st_mtime_ns != mtime_ns and _hash_file(Path(source_path)) != content_hash:
+                    return None
+                
+                rows, postal_code_index = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        
+        return StationSnapshot(rows=rows, postal_code_index=postal_code_index)
+    
+    def write(self, source_path: Path, snapshot: StationSnapshot) -> None:
+        """Atomically write a snapshot for source_path"""
+        fingerprint = SourceFingerprint.of(Path(source_path))
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            fingerprint.size,
+            fingerprint.mtime_ns,
+            fingerprint.content_hash,
+        )
+        
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as file:
+            file.write(header)
+            pickle.dump(
+                (snapshot.rows, snapshot.postal_code_index),
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, self.snapshot_path)
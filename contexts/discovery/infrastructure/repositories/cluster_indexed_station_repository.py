@@ -0,0 +1,141 @@
+import threading
+from typing import Optional, List, Dict, Iterable, Set
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from ...domain.repositories.i_station_repository import IStationRepository
+from ...domain.repositories.i_station_cluster_index import IStationClusterIndex
+
+
+class ClusterIndexedStationRepository(IStationRepository):
+    """
+    Station repository decorator that keeps a cluster index up to date
+    
+    Every station saved through it is applied to the index once the wrapped
+    repository has committed it, so a status change moves one count per
+    zoom level instead of triggering a rebuild. Changes other processes make
+    to a shared store are picked up by refresh(), which re-indexes only the
+    postal codes whose change counter moved.
+    
+    Startup: wrap the repository, load it, then call build_index().
+    Before reading clusters: call refresh().
+    """
+    
+    def __init__(self, inner: IStationRepository, cluster_index: IStationClusterIndex):
+        self._inner = inner
+        self._cluster_index = cluster_index
+        # Postal code versions the index is known to reflect
+        self._indexed_versions: Dict[str, int] = {}
+        self._refresh_lock = threading.Lock()
+    
+    @property
+    def cluster_index(self) -> IStationClusterIndex:
+        return self._cluster_index
+    
+    def build_index(self) -> int:
+        """Index every stored station; returns how many were indexed"""
+        with self._refresh_lock:
+            # Versions first: a change landing during find_all is indexed again by the next refresh
+            self._indexed_versions = self._inner.postal_code_versions()
+            return self._cluster_index.rebuild(self._inner.find_all())
+    
+    def refresh(self) -> int:
+        """Re-index postal codes changed in the store since the last look; returns stations re-indexed"""
+        with self._refresh_lock:
+            versions = self._inner.postal_code_versions()
+            refreshed = 0
+            for postal_code, version in versions.items():
+                if self._indexed_versions.get(postal_code) == version:
+                    continue
+                for station in self._inner.find_by_postal_code(postal_code):
+                    self._cluster_index.upsert(station)
+                    refreshed += 1
+            self._indexed_versions = versions
+            return refreshed
+    
+    # ------------------------------------------------------------------
+    # IStationRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, station: OperationalStation) -> None:
+        self._inner.save(station)
+        self._cluster_index.upsert(station)
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        # The wrapped repository still streams the stations; they are indexed
+        # only once it has committed them, so a failed save leaves no trace
+        saved: List[OperationalStation] = []
+        
+        def collected():
+            for station in stations:
+                saved.append(station)
+                yield station
+        
+        count = self._inner.save_all(collected())
+        for station in saved:
+            self._cluster_index.upsert(station)
+        return count
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        moved = self._inner.transition_status(station_ids, from_statuses, to_status)
+        for station in self._inner.find_by_ids(moved).values():
+            self._cluster_index.upsert(station)
+        return moved
+    
+    def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        return self._inner.find_by_id(station_id)
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        return self._inner.find_by_ids(station_ids)
+    
+    def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        return self._inner.find_by_postal_code(postal_code)
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        return self._inner.find_by_status(status)
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        return self._inner.find_nearest(latitude, longitude, k, status=status)
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        return self._inner.find_within_radius(latitude, longitude, meters)
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        return self._inner.find_in_bbox(min_lat, min_lon, max_lat, max_lon, limit)
+    
+    def find_all(self) -> List[OperationalStation]:
+        return self._inner.find_all()
+    
+    def exists(self, station_id: StationId) -> bool:
+        return self._inner.exists(station_id)
+    
+    def count(self) -> int:
+        return self._inner.count()
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        return self._inner.count_by_status()
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        return self._inner.postal_code_version(postal_code)
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        return self._inner.postal_code_versions()
\ No newline at end of file
@@ -0,0 +1,263 @@
+from typing import Optional, List, Dict, Iterable, Set
+
+import numpy as np
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from ...domain.repositories.i_station_repository import IStationRepository
+from ..spatial.geo_grid_index import GeoGridIndex
+
+
+_STATUS_CODES: Dict[StationStatus, int] = {status: code for code, status in enumerate(StationStatus)}
+_STATUSES: List[StationStatus] = list(StationStatus)
+
+
+class _InternTable:
+    """Maps repeated strings (postal codes, operators) to small integer ids"""
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._values: List[str] = []
+    
+    def intern(self, value: str) -> int:
+        existing = self._ids.get(value)
+        if existing is not None:
+            return existing
+        
+        new_id = len(self._values)
+        self._ids[value] = new_id
+        self._values.append(value)
+        return new_id
+    
+    def lookup(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+    
+    def value(self, interned_id: int) -> str:
+        return self._values[interned_id]
+
+
+class ColumnarStationRepository(IStationRepository):
+    """
+    Array-backed implementation of station repository
+    
+    Stations are stored as parallel typed columns (float64 coordinates,
+    uint8 status codes, interned postal code and operator name ids) rather
+    than one OperationalStation per charge point. Entities are only built
+    as views when a caller asks for them; saving a view writes it back.
+    Counts, filters and bounding-box selections run as vectorized NumPy
+    operations over the columns.
+    """
+    
+    def __init__(self, initial_capacity: int = 1024):
+        capacity = max(initial_capacity, 1)
+        self._size = 0
+        self._row_by_id: Dict[str, int] = {}
+        self._station_ids: List[str] = []
+        self._addresses: List[Optional[str]] = []
+        
+        self._postal_codes = _InternTable()
+        self._names = _InternTable()
+        self._spatial_index = GeoGridIndex()
+        # Change counters per postal code, bumped when a station arrives, leaves or changes status
+        self._postal_code_versions: Dict[str, int] = {}
+        
+        self._latitude = np.full(capacity, np.nan, dtype=np.float64)
+        self._longitude = np.full(capacity, np.nan, dtype=np.float64)
+        self._status = np.zeros(capacity, dtype=np.uint8)
+        self._postal_code_ids = np.zeros(capacity, dtype=np.uint32)
+        self._name_ids = np.zeros(capacity, dtype=np.uint32)
+    
+    # ------------------------------------------------------------------
+    # IStationRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, station: OperationalStation) -> None:
+        key = station.station_id.value
+        row = self._row_by_id.get(key)
+        
+        if row is None:
+            row = self._append_row(key)
+            self._bump_postal_code_version(station.postal_code)
+        else:
+            previous_postal_code = self._postal_codes.value(int(self._postal_code_ids[row]))
+            if previous_postal_code != station.postal_code:
+                self._bump_postal_code_version(previous_postal_code)
+                self._bump_postal_code_version(station.postal_code)
+            elif self._status[row] != _STATUS_CODES[station.status]:
+                self._bump_postal_code_version(station.postal_code)
+        
+        self._write_row(row, station)
+        self._spatial_index.upsert(key, station.latitude, station.longitude)
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        count = 0
+        for station in stations:
+            self.save(station)
+            count += 1
+        return count
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        allowed = {_STATUS_CODES[status] for status in from_statuses}
+        moved: Set[StationId] = set()
+        for station_id in station_ids:
+            row = self._row_by_id.get(station_id.value)
+            if row is None or self._status[row] not in allowed:
+                continue
+            self._status[row] = _STATUS_CODES[to_status]
+            self._bump_postal_code_version(self._postal_codes.value(int(self._postal_code_ids[row])))
+            moved.add(station_id)
+        return moved
+    
+    def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        row = self._row_by_id.get(station_id.value)
+        if row is None:
+            return None
+        return self._view(row)
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        found = {}
+        for station_id in station_ids:
+            row = self._row_by_id.get(station_id.value)
+            if row is not None:
+                found[station_id] = self._view(row)
+        return found
+    
+    def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        postal_code_id = self._postal_codes.lookup(postal_code)
+        if postal_code_id is None:
+            return []
+        
+        rows = np.flatnonzero(self._postal_code_ids[:self._size] == postal_code_id)
+        return self._views(rows)
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        predicate = None
+        if status is not None:
+            code = _STATUS_CODES[status]
+            predicate = lambda key: self._status[self._row_by_id[key]] == code
+        
+        hits = self._spatial_index.nearest(latitude, longitude, k, predicate)
+        return [self._view(self._row_by_id[key]) for key, _ in hits]
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        hits = self._spatial_index.within_radius(latitude, longitude, meters)
+        return [self._view(self._row_by_id[key]) for key, _ in hits]
+    
+    def find_all(self) -> List[OperationalStation]:
+        return [self._view(row) for row in range(self._size)]
+    
+    def exists(self, station_id: StationId) -> bool:
+        return station_id.value in self._row_by_id
+    
+    def count(self) -> int:
+        return self._size
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        counts = np.bincount(self._status[:self._size], minlength=len(_STATUSES))
+        return {status: int(counts[code]) for status, code in _STATUS_CODES.items()}
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        return self._postal_code_versions.get(postal_code, 0)
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        return dict(self._postal_code_versions)
+    
+    # ------------------------------------------------------------------
+    # Vectorized queries
+    # ------------------------------------------------------------------
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        rows = np.flatnonzero(self._status[:self._size] == _STATUS_CODES[status])
+        return self._views(rows)
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        """Stations whose coordinates fall inside the box (bounds inclusive)"""
+        rows = self._rows_in_bbox(min_lat, min_lon, max_lat, max_lon)
+        if limit is not None:
+            rows = rows[:limit]
+        return self._views(rows)
+    
+    def count_in_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> int:
+        return int(self._rows_in_bbox(min_lat, min_lon, max_lat, max_lon).size)
+    
+    # ------------------------------------------------------------------
+    # Column management
+    # ------------------------------------------------------------------
+    
+    def _rows_in_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> np.ndarray:
+        lat = self._latitude[:self._size]
+        lon = self._longitude[:self._size]
+        # NaN (missing coordinates) compares False, so those rows drop out
+        mask = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        return np.flatnonzero(mask)
+    
+    def _bump_postal_code_version(self, postal_code: str) -> None:
+        self._postal_code_versions[postal_code] = self._postal_code_versions.get(postal_code, 0) + 1
+    
+    def _append_row(self, key: str) -> int:
+        if self._size == len(self._status):
+            self._grow()
+        
+        row = self._size
+        self._size += 1
+        self._row_by_id[key] = row
+        self._station_ids.append(key)
+        self._addresses.append(None)
+        return row
+    
+    def _grow(self) -> None:
+        new_capacity = len(self._status) * 2
+        
+        def grown(column: np.ndarray, fill) -> np.ndarray:
+            bigger = np.full(new_capacity, fill, dtype=column.dtype)
+            bigger[:len(column)] = column
+            return bigger
+        
+        self._latitude = grown(self._latitude, np.nan)
+        self._longitude = grown(self._longitude, np.nan)
+        self._status = grown(self._status, 0)
+        self._postal_code_ids = grown(self._postal_code_ids, 0)
+        self._name_ids = grown(self._name_ids, 0)
+    
+    def _write_row(self, row: int, station: OperationalStation) -> None:
+        self._latitude[row] = np.nan if station.latitude is None else station.latitude
+        self._longitude[row] = np.nan if station.longitude is None else station.longitude
+        self._status[row] = _STATUS_CODES[station.status]
+        self._postal_code_ids[row] = self._postal_codes.intern(station.postal_code)
+        self._name_ids[row] = self._names.intern(station.name)
+        self._addresses[row] = station.address
+    
+    def _views(self, rows: np.ndarray) -> List[OperationalStation]:
+        return [self._view(int(row)) for row in rows]
+    
+    def _view(self, row: int) -> OperationalStation:
+        latitude = self._latitude[row]
+        longitude = self._longitude[row]
+        return OperationalStation(
+            station_id=StationId(self._station_ids[row]),
+            name=self._names.value(int(self._name_ids[row])),
+            postal_code=self._postal_codes.value(int(self._postal_code_ids[row])),
+            address=self._addresses[row],
+            latitude=None if np.isnan(latitude) else float(latitude),
+            longitude=None if np.isnan(longitude) else float(longitude),
+            status=_STATUSES[self._status[row]]
+        )
@@ -1,31 +1,193 @@
-from typing import Optional, List, Dict
+from itertools import islice
+from typing import Optional, List, Dict, Iterable, Set
 
 from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
 from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.read_write_lock import ReadWriteLock
 from ...domain.repositories.i_station_repository import IStationRepository
+from ..spatial.geo_grid_index import GeoGridIndex
+
+
+_SAVE_CHUNK_SIZE = 1000
 
 
 class InMemoryStationRepository(IStationRepository):
-    """In-memory implementation of station repository"""
+    """
+    In-memory implementation of station repository
+    
+    Safe to share between threads: queries run concurrently under the read
+    side of a reader/writer lock, saves are serialized under the write side.
+    """
     
     def __init__(self):
+        self._lock = ReadWriteLock()
         self._stations: Dict[str, OperationalStation] = {}
+        # Secondary index: postal code -> ordered set of station ids (dict keys keep insertion order)
+        self._postal_code_index: Dict[str, Dict[str, None]] = {}
+        # Status membership: ordered set of station ids per status, moved on every status transition
+        self._status_by_id: Dict[str, StationStatus] = {}
+        self._ids_by_status: Dict[StationStatus, Dict[str, None]] = {status: {} for status in StationStatus}
+        # Change counters per postal code, bumped when a station arrives, leaves or changes status
+        self._postal_code_versions: Dict[str, int] = {}
+        self._spatial_index = GeoGridIndex()
     
     def save(self, station: OperationalStation) -> None:
-        key = station.station_id.value
-        self._stations[key] = station
+        with self._lock.write_locked():
+            self._save(station)
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        # Lock per chunk: the stream stays lazy, a slow producer (CSV parsing)
+        # never holds the write lock, and readers get in between chunks
+        count = 0
+        iterator = iter(stations)
+        while True:
+            chunk = list(islice(iterator, _SAVE_CHUNK_SIZE))
+            if not chunk:
+                return count
+            with self._lock.write_locked():
+                for station in chunk:
+                    self._save(station)
+            count += len(chunk)
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        allowed = set(from_statuses)
+        moved: Set[StationId] = set()
+        with self._lock.write_locked():
+            for station_id in station_ids:
+                station = self._stations.get(station_id.value)
+                if station is None or station.status not in allowed:
+                    continue
+                # Replace rather than mutate, so entities handed out earlier keep what they showed
+                self._save(OperationalStation(
+                    station_id=station.station_id,
+                    name=station.name,
+                    postal_code=station.postal_code,
+                    address=station.address,
+                    latitude=station.latitude,
+                    longitude=station.longitude,
+                    status=to_status
+                ))
+                moved.add(station_id)
+        return moved
     
     def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
-        return self._stations.get(station_id.value)
+        with self._lock.read_locked():
+            return self._stations.get(station_id.value)
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        with self._lock.read_locked():
+            found = {}
+            for station_id in station_ids:
+                station = self._stations.get(station_id.value)
+                if station is not None:
+                    found[station_id] = station
+            return found
     
     def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
-        return [
-            station for station in self._stations.values()
-            if station.postal_code == postal_code
-        ]
+        with self._lock.read_locked():
+            station_ids = self._postal_code_index.get(postal_code, {})
+            return [self._stations[key] for key in station_ids]
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        with self._lock.read_locked():
+            return [self._stations[key] for key in self._ids_by_status[status]]
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        predicate = None
+        if status is not None:
+            predicate = lambda key: self._stations[key].status == status
+        
+        with self._lock.read_locked():
+            hits = self._spatial_index.nearest(latitude, longitude, k, predicate)
+            return [self._stations[key] for key, _ in hits]
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        with self._lock.read_locked():
+            hits = self._spatial_index.within_radius(latitude, longitude, meters)
+            return [self._stations[key] for key, _ in hits]
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        with self._lock.read_locked():
+            keys = self._spatial_index.in_bbox(min_lat, min_lon, max_lat, max_lon, limit)
+            return [self._stations[key] for key in keys]
     
     def find_all(self) -> List[OperationalStation]:
-        return list(self._stations.values())
+        with self._lock.read_locked():
+            return list(self._stations.values())
     
     def exists(self, station_id: StationId) -> bool:
-        return station_id.value in self._stations
+        with self._lock.read_locked():
+            return station_id.value in self._stations
+    
+    def count(self) -> int:
+        with self._lock.read_locked():
+            return len(self._stations)
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        with self._lock.read_locked():
+            return {status: len(ids) for status, ids in self._ids_by_status.items()}
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        with self._lock.read_locked():
+            return self._postal_code_versions.get(postal_code, 0)
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        with self._lock.read_locked():
+            return dict(self._postal_code_versions)
+    
+    def _save(self, station: OperationalStation) -> None:
+        """Apply a save; the caller holds the write lock"""
+        key = station.station_id.value
+        previous = self._stations.get(key)
+        
+        if previous is not None and previous.postal_code != station.postal_code:
+            self._unindex_postal_code(previous.postal_code, key)
+            self._bump_postal_code_version(previous.postal_code)
+            self._bump_postal_code_version(station.postal_code)
+        elif previous is None:
+            self._bump_postal_code_version(station.postal_code)
+        
+        self._stations[key] = station
+        self._postal_code_index.setdefault(station.postal_code, {})[key] = None
+        self._spatial_index.upsert(key, station.latitude, station.longitude)
+        
+        previous_status = self._status_by_id.get(key)
+        if previous_status != station.status:
+            if previous_status is not None:
+                del self._ids_by_status[previous_status][key]
+            self._ids_by_status[station.status][key] = None
+            self._status_by_id[key] = station.status
+            if previous is not None:
+                self._bump_postal_code_version(station.postal_code)
+    
+    def _bump_postal_code_version(self, postal_code: str) -> None:
+        self._postal_code_versions[postal_code] = self._postal_code_versions.get(postal_code, 0) + 1
+    
+    def _unindex_postal_code(self, postal_code: str, key: str) -> None:
+        """Remove a station id from the postal code index"""
+        bucket = self._postal_code_index.get(postal_code)
+        if bucket is None:
+            return
+        
+        bucket.pop(key, None)
+        if not bucket:
+            del self._postal_code_index[postal_code]
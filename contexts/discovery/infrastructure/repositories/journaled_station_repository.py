@@ -0,0 +1,188 @@
+import threading
+from typing import Optional, List, Dict, Iterable, Set
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.event_journal import EventJournal
+from ...domain.repositories.i_station_repository import IStationRepository
+
+
+STATUS_CHANGED = "station_status_changed"
+
+
+class JournaledStationRepository(IStationRepository):
+    """
+    Station repository decorator that journals every status transition
+    
+    Station master data comes from the register; what the register cannot
+    restore is status (DEFECTIVE after a report, AVAILABLE after repair).
+    Each save that changes a station's status is appended to the journal
+    before it reaches the wrapped repository, and every `snapshot_every`
+    events the non-available statuses are snapshotted and the log compacted.
+    
+    Startup: load the register into the repository, then call recover().
+    """
+    
+    def __init__(self, inner: IStationRepository, journal: EventJournal, snapshot_every: int = 1000):
+        if snapshot_every <= 0:
+            raise ValueError("Snapshot interval must be positive")
+        
+        self._inner = inner
+        self._journal = journal
+        self._snapshot_every = snapshot_every
+        # Keeps journal order and repository order identical for concurrent saves
+        self._write_lock = threading.Lock()
+        # Last journaled status per station; absent means AVAILABLE, as loaded from the register
+        self._status_by_id: Dict[str, StationStatus] = {}
+    
+    def recover(self) -> int:
+        """Restore statuses from the latest snapshot plus later events; returns events replayed"""
+        after_seq = 0
+        snapshot = self._journal.latest_snapshot()
+        if snapshot is not None:
+            after_seq, state = snapshot
+            for station_id, status in state["statuses"].items():
+                self._apply(station_id, StationStatus(status))
+        
+        replayed = 0
+        for event in self._journal.read(after_seq):
+            if event.event_type == STATUS_CHANGED:
+                self._apply(event.data["station_id"], StationStatus(event.data["status"]))
+                replayed += 1
+        return replayed
+    
+    def snapshot(self) -> int:
+        """Snapshot the current statuses and compact the journal"""
+        statuses = {
+            station_id: status.value
+            for station_id, status in self._status_by_id.items()
+            if status != StationStatus.AVAILABLE
+        }
+        return self._journal.write_snapshot({"statuses": statuses})
+    
+    # ------------------------------------------------------------------
+    # IStationRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, station: OperationalStation) -> None:
+        with self._write_lock:
+            self._record(station, sync=True)
+            self._inner.save(station)
+            self._maybe_snapshot()
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        def recorded():
+            for station in stations:
+                self._record(station, sync=False)
+                yield station
+        
+        with self._write_lock:
+            count = self._inner.save_all(recorded())
+            self._journal.flush()
+            self._maybe_snapshot()
+        return count
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        with self._write_lock:
+            moved = self._inner.transition_status(station_ids, from_statuses, to_status)
+            # Only transitions that happened are journaled
+            for station_id in sorted(moved, key=lambda station_id: station_id.value):
+                self._journal.append(
+                    STATUS_CHANGED, {"station_id": station_id.value, "status": to_status.value}, sync=False
+                )
+                self._status_by_id[station_id.value] = to_status
+            if moved:
+                self._journal.flush()
+                self._maybe_snapshot()
+        return moved
+    
+    def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        return self._inner.find_by_id(station_id)
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        return self._inner.find_by_ids(station_ids)
+    
+    def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        return self._inner.find_by_postal_code(postal_code)
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        return self._inner.find_by_status(status)
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        return self._inner.find_nearest(latitude, longitude, k, status=status)
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        return self._inner.find_within_radius(latitude, longitude, meters)
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        return self._inner.find_in_bbox(min_lat, min_lon, max_lat, max_lon, limit)
+    
+    def find_all(self) -> List[OperationalStation]:
+        return self._inner.find_all()
+    
+    def exists(self, station_id: StationId) -> bool:
+        return self._inner.exists(station_id)
+    
+    def count(self) -> int:
+        return self._inner.count()
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        return self._inner.count_by_status()
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        return self._inner.postal_code_version(postal_code)
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        return self._inner.postal_code_versions()
+    
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+    
+    def _record(self, station: OperationalStation, sync: bool) -> None:
+        key = station.station_id.value
+        if self._status_by_id.get(key, StationStatus.AVAILABLE) == station.status:
+            return
+        
+        self._journal.append(STATUS_CHANGED, {"station_id": key, "status": station.status.value}, sync=sync)
+        self._status_by_id[key] = station.status
+    
+    def _apply(self, station_id: str, status: StationStatus) -> None:
+        """Write a recovered status straight into the wrapped repository"""
+        self._status_by_id[station_id] = status
+        station = self._inner.find_by_id(StationId(station_id))
+        if station is None or station.status == status:
+            return
+        
+        self._inner.save(OperationalStation(
+            station_id=station.station_id,
+            name=station.name,
+            postal_code=station.postal_code,
+            address=station.address,
+            latitude=station.latitude,
+            longitude=station.longitude,
+            status=status
+        ))
+    
+    def _maybe_snapshot(self) -> None:
+        if self._journal.events_since_snapshot >= self._snapshot_every:
+            self.snapshot()
@@ -0,0 +1,259 @@
+import heapq
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.common.region import Region
+from contexts.shared_kernel.common.geo_point import haversine_meters
+from ...domain.repositories.i_station_repository import IStationRepository
+from .in_memory_station_repository import InMemoryStationRepository
+
+
+PartitionLoader = Callable[[Region], Iterable[OperationalStation]]
+
+
+class RegionPartitionedStationRepository(IStationRepository):
+    """
+    Station repository split into one partition per region
+    
+    A partition is only loaded (through `partition_loader`) the first time
+    a query needs it: postal code lookups route by the region's postal
+    ranges, id lookups and saves by the region's id prefix, and spatial
+    queries by the region's bounds. Regions nobody asks about stay unloaded.
+    
+    find_all, find_by_status, count and count_by_status cover the loaded
+    partitions only;
+    call load_all() first for network-wide figures.
+    
+    Regions must not share postal codes: overlapping regions (München and
+    Bayern, or any region and Germany) would load the same stations twice
+    under different id prefixes.
+    """
+    
+    def __init__(
+        self,
+        regions: Sequence[Region],
+        partition_loader: PartitionLoader,
+        partition_factory: Callable[[], IStationRepository] = InMemoryStationRepository
+    ):
+        if not regions:
+            raise ValueError("At least one region is required")
+        
+        for i, region in enumerate(regions):
+            for other in regions[i + 1:]:
+                if region.overlaps(other):
+                    raise ValueError(f"Regions {region.key} and {other.key} have overlapping postal code ranges")
+        
+        self._regions = list(regions)
+        self._partition_loader = partition_loader
+        self._partition_factory = partition_factory
+        self._partitions: Dict[str, IStationRepository] = {}
+        # Serializes lazy loads, so concurrent first queries parse a region once
+        self._load_lock = threading.Lock()
+        # Longest prefix first, so "BERLIN-" is never shadowed by a shorter prefix
+        self._by_prefix = sorted(self._regions, key=lambda region: len(region.id_prefix), reverse=True)
+    
+    # ------------------------------------------------------------------
+    # Partition management
+    # ------------------------------------------------------------------
+    
+    @property
+    def regions(self) -> List[Region]:
+        return list(self._regions)
+    
+    @property
+    def loaded_regions(self) -> List[Region]:
+        return [region for region in self._regions if region.key in self._partitions]
+    
+    def is_loaded(self, region: Region) -> bool:
+        return region.key in self._partitions
+    
+    def load_all(self) -> None:
+        for region in self._regions:
+            self._partition(region)
+    
+    def region_for_postal_code(self, postal_code: str) -> Optional[Region]:
+        for region in self._regions:
+            if region.contains_postal_code(postal_code):
+                return region
+        return None
+    
+    def region_for_station_id(self, station_id: StationId) -> Optional[Region]:
+        for region in self._by_prefix:
+            if station_id.value.startswith(f"{region.id_prefix}-"):
+                return region
+        return None
+    
+    def _partition(self, region: Region) -> IStationRepository:
+        partition = self._partitions.get(region.key)
+        if partition is not None:
+            return partition
+        
+        with self._load_lock:
+            partition = self._partitions.get(region.key)
+            if partition is None:
+                partition = self._partition_factory()
+                partition.save_all(self._partition_loader(region))
+                # Published only once fully loaded, so the unlocked lookup above never sees half a partition
+                self._partitions[region.key] = partition
+        return partition
+    
+    def _loaded_partitions(self) -> List[IStationRepository]:
+        return [self._partitions[region.key] for region in self.loaded_regions]
+    
+    # ------------------------------------------------------------------
+    # IStationRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, station: OperationalStation) -> None:
+        region = self.region_for_station_id(station.station_id) or self.region_for_postal_code(station.postal_code)
+        if region is None:
+            raise ValueError(f"No partition for station {station.station_id}")
+        self._partition(region).save(station)
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        count = 0
+        for station in stations:
+            self.save(station)
+            count += 1
+        return count
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        from_statuses = list(from_statuses)
+        ids_by_region: Dict[str, List[StationId]] = {}
+        regions: Dict[str, Region] = {}
+        for station_id in station_ids:
+            region = self.region_for_station_id(station_id)
+            if region is not None:
+                ids_by_region.setdefault(region.key, []).append(station_id)
+                regions[region.key] = region
+        
+        moved: Set[StationId] = set()
+        for key, region_ids in ids_by_region.items():
+            moved |= self._partition(regions[key]).transition_status(region_ids, from_statuses, to_status)
+        return moved
+    
+    def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        region = self.region_for_station_id(station_id)
+        if region is None:
+            return None
+        return self._partition(region).find_by_id(station_id)
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        # One bulk lookup per region the ids belong to
+        ids_by_region: Dict[str, List[StationId]] = {}
+        regions: Dict[str, Region] = {}
+        for station_id in station_ids:
+            region = self.region_for_station_id(station_id)
+            if region is not None:
+                ids_by_region.setdefault(region.key, []).append(station_id)
+                regions[region.key] = region
+        
+        found: Dict[StationId, OperationalStation] = {}
+        for key, region_ids in ids_by_region.items():
+            found.update(self._partition(regions[key]).find_by_ids(region_ids))
+        return found
+    
+    def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        region = self.region_for_postal_code(postal_code)
+        if region is None:
+            return []
+        return self._partition(region).find_by_postal_code(postal_code)
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        stations: List[OperationalStation] = []
+        for partition in self._loaded_partitions():
+            stations.extend(partition.find_by_status(status))
+        return stations
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        if k <= 0:
+            return []
+        
+        # Visit regions closest-first; stop once the k-th hit beats the next region's bounds
+        candidates = []
+        for region in sorted(self._regions, key=lambda region: region.distance_to(latitude, longitude)):
+            if len(candidates) >= k and candidates[k - 1][0] <= region.distance_to(latitude, longitude):
+                break
+            
+            for station in self._partition(region).find_nearest(latitude, longitude, k, status=status):
+                distance = haversine_meters(latitude, longitude, station.latitude, station.longitude)
+                candidates.append((distance, station.station_id.value, station))
+            candidates = heapq.nsmallest(k, candidates, key=lambda hit: (hit[0], hit[1]))
+        
+        return [station for _, _, station in candidates]
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        hits = []
+        for region in self._regions:
+            if region.distance_to(latitude, longitude) > meters:
+                continue
+            for station in self._partition(region).find_within_radius(latitude, longitude, meters):
+                distance = haversine_meters(latitude, longitude, station.latitude, station.longitude)
+                hits.append((distance, station.station_id.value, station))
+        
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+        return [station for _, _, station in hits]
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        stations: List[OperationalStation] = []
+        for region in self._regions:
+            if not region.intersects(min_lat, min_lon, max_lat, max_lon):
+                continue
+            remaining = None if limit is None else limit - len(stations)
+            stations.extend(self._partition(region).find_in_bbox(min_lat, min_lon, max_lat, max_lon, remaining))
+            if limit is not None and len(stations) >= limit:
+                break
+        return stations
+    
+    def find_all(self) -> List[OperationalStation]:
+        stations: List[OperationalStation] = []
+        for partition in self._loaded_partitions():
+            stations.extend(partition.find_all())
+        return stations
+    
+    def exists(self, station_id: StationId) -> bool:
+        region = self.region_for_station_id(station_id)
+        return region is not None and self._partition(region).exists(station_id)
+    
+    def count(self) -> int:
+        return sum(partition.count() for partition in self._loaded_partitions())
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        counts = {status: 0 for status in StationStatus}
+        for partition in self._loaded_partitions():
+            for status, count in partition.count_by_status().items():
+                counts[status] += count
+        return counts
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        region = self.region_for_postal_code(postal_code)
+        if region is None:
+            return 0
+        return self._partition(region).postal_code_version(postal_code)
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        versions: Dict[str, int] = {}
+        for partition in self._loaded_partitions():
+            versions.update(partition.postal_code_versions())
+        return versions
@@ -0,0 +1,346 @@
+import math
+from pathlib import Path
+from typing import Optional, List, Dict, Iterable, Set, Tuple, Union
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.common.geo_point import EARTH_RADIUS_METERS, haversine_meters
+from contexts.shared_kernel.infrastructure.sqlite_connections import SqliteConnections
+from ...domain.repositories.i_station_repository import IStationRepository
+
+
+DEFAULT_DATABASE_PATH = Path("contexts/shared_kernel/datasets/stations.sqlite3")
+
+# Search radius the nearest-station query starts from before doubling
+_INITIAL_NEAREST_RADIUS_METERS = 500.0
+_HALF_EARTH_CIRCUMFERENCE_METERS = math.pi * EARTH_RADIUS_METERS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stations (
+    id          INTEGER PRIMARY KEY,
+    station_id  TEXT NOT NULL UNIQUE,
+    name        TEXT NOT NULL,
+    postal_code TEXT NOT NULL,
+    address     TEXT,
+    latitude    REAL,
+    longitude   REAL,
+    status      TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_stations_postal_code ON stations (postal_code);
+CREATE INDEX IF NOT EXISTS idx_stations_status ON stations (status);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS station_locations USING rtree (
+    id,
+    min_lat, max_lat,
+    min_lon, max_lon
+);
+
+-- Keep the R*Tree in step with the coordinates of every station row
+CREATE TRIGGER IF NOT EXISTS stations_location_insert AFTER INSERT ON stations
+WHEN new.latitude IS NOT NULL AND new.longitude IS NOT NULL
+BEGIN
+    INSERT INTO station_locations VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+END;
+
+CREATE TRIGGER IF NOT EXISTS stations_location_update AFTER UPDATE OF latitude, longitude ON stations
+BEGIN
+    DELETE FROM station_locations WHERE id = old.id;
+    INSERT INTO station_locations
+    SELECT new.id, new.latitude, new.latitude, new.longitude, new.longitude
+    WHERE new.latitude IS NOT NULL AND new.longitude IS NOT NULL;
+END;
+
+-- Change counter per postal code, bumped when a station arrives, leaves or changes status
+CREATE TABLE IF NOT EXISTS postal_code_versions (
+    postal_code TEXT PRIMARY KEY,
+    version     INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS stations_version_insert AFTER INSERT ON stations
+BEGIN
+    INSERT INTO postal_code_versions VALUES (new.postal_code, 1)
+    ON CONFLICT (postal_code) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS stations_version_update AFTER UPDATE OF status, postal_code ON stations
+WHEN old.status IS NOT new.status OR old.postal_code IS NOT new.postal_code
+BEGIN
+    INSERT INTO postal_code_versions VALUES (old.postal_code, 1)
+    ON CONFLICT (postal_code) DO UPDATE SET version = version + 1;
+    INSERT INTO postal_code_versions SELECT new.postal_code, 1 WHERE new.postal_code IS NOT old.postal_code
+    ON CONFLICT (postal_code) DO UPDATE SET version = version + 1;
+END;
+"""
+
+# Stays below SQLite's default limit of 999 bound parameters per statement
+_MAX_IDS_PER_QUERY = 500
+
+_COLUMNS = "s.station_id, s.name, s.postal_code, s.address, s.latitude, s.longitude, s.status"
+
+_UPSERT = """
+INSERT INTO stations (station_id, name, postal_code, address, latitude, longitude, status)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (station_id) DO UPDATE SET
+    name = excluded.name,
+    postal_code = excluded.postal_code,
+    address = excluded.address,
+    latitude = excluded.latitude,
+    longitude = excluded.longitude,
+    status = excluded.status
+"""
+
+# R*Tree boxes are stored as float32, rounded outward, so box hits are a
+# superset - the exact float64 columns decide membership
+_IN_BOX = f"""
+SELECT {_COLUMNS} FROM station_locations AS l
+JOIN stations AS s ON s.id = l.id
+WHERE l.max_lat >= ? AND l.min_lat <= ? AND l.max_lon >= ? AND l.min_lon <= ?
+  AND s.latitude BETWEEN ? AND ? AND s.longitude BETWEEN ? AND ?
+"""
+
+StationRow = Tuple[str, str, str, Optional[str], Optional[float], Optional[float], str]
+
+
+class SqliteStationRepository(IStationRepository):
+    """
+    SQLite implementation of station repository
+    
+    Stations live in one table with B-tree indexes on postal code and status;
+    coordinates are mirrored into an R*Tree (maintained by triggers) for
+    viewport, radius and nearest-station queries. The database runs in WAL
+    mode so readers (other threads and processes) never block the writer,
+    and bulk loads commit as a single transaction.
+    
+    Safe to share between threads: writes are serialized, and each query
+    borrows a read connection from a small bounded pool, so any number of
+    threads share a few connections.
+    """
+    
+    def __init__(self, database_path: Union[str, Path] = ":memory:"):
+        self._connections = SqliteConnections(database_path, _SCHEMA)
+    
+    def close(self) -> None:
+        self._connections.close()
+    
+    # ------------------------------------------------------------------
+    # IStationRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, station: OperationalStation) -> None:
+        with self._connections.write() as connection:
+            connection.execute(_UPSERT, self._to_row(station))
+    
+    def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        count = 0
+        
+        def rows():
+            nonlocal count
+            for station in stations:
+                count += 1
+                yield self._to_row(station)
+        
+        with self._connections.write() as connection:
+            connection.executemany(_UPSERT, rows())
+        return count
+    
+    def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        keys = list(dict.fromkeys(station_id.value for station_id in station_ids))
+        allowed = [status.value for status in from_statuses]
+        if not keys or not allowed:
+            return set()
+        
+        # The status check lives in the WHERE clause, so a station another
+        # process moved first matches no row - rowcount tells who won
+        sql = f"UPDATE stations SET status = ? WHERE station_id = ? AND status IN ({', '.join('?' * len(allowed))})"
+        moved: Set[StationId] = set()
+        with self._connections.write(immediate=True) as connection:
+            for key in keys:
+                if connection.execute(sql, (to_status.value, key, *allowed)).rowcount:
+                    moved.add(StationId(key))
+        return moved
+    
+    def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        stations = self._query(f"SELECT {_COLUMNS} FROM stations AS s WHERE s.station_id = ?", (station_id.value,))
+        return stations[0] if stations else None
+    
+    def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        keys = list(dict.fromkeys(station_id.value for station_id in station_ids))
+        rows: List[StationRow] = []
+        # One read connection and one IN query per 500 ids, rather than a query per station
+        with self._connections.read() as connection:
+            for start in range(0, len(keys), _MAX_IDS_PER_QUERY):
+                chunk = keys[start:start + _MAX_IDS_PER_QUERY]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(connection.execute(
+                    f"SELECT {_COLUMNS} FROM stations AS s WHERE s.station_id IN ({placeholders})", chunk
+                ).fetchall())
+        
+        stations = (self._to_station(row) for row in rows)
+        return {station.station_id: station for station in stations}
+    
+    def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        return self._query(
+            f"SELECT {_COLUMNS} FROM stations AS s WHERE s.postal_code = ? ORDER BY s.id",
+            (postal_code,)
+        )
+    
+    def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        return self._query(
+            f"SELECT {_COLUMNS} FROM stations AS s WHERE s.status = ? ORDER BY s.id",
+            (status.value,)
+        )
+    
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        if k <= 0:
+            return []
+        
+        # Grow a search box until it holds k stations no farther than its radius
+        meters = _INITIAL_NEAREST_RADIUS_METERS
+        while True:
+            hits = self._hits_within(latitude, longitude, meters, status)
+            if len(hits) >= k or meters >= _HALF_EARTH_CIRCUMFERENCE_METERS:
+                return [station for _, _, station in hits[:k]]
+            meters *= 2
+    
+    def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        if meters < 0:
+            return []
+        return [station for _, _, station in self._hits_within(latitude, longitude, meters)]
+    
+    def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        if min_lat > max_lat or min_lon > max_lon:
+            return []
+        
+        sql = _IN_BOX + " ORDER BY s.id"
+        parameters: tuple = (min_lat, max_lat, min_lon, max_lon, min_lat, max_lat, min_lon, max_lon)
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters += (limit,)
+        return self._query(sql, parameters)
+    
+    def find_all(self) -> List[OperationalStation]:
+        return self._query(f"SELECT {_COLUMNS} FROM stations AS s ORDER BY s.id")
+    
+    def exists(self, station_id: StationId) -> bool:
+        with self._connections.read() as connection:
+            row = connection.execute("SELECT 1 FROM stations WHERE station_id = ?", (station_id.value,)).fetchone()
+        return row is not None
+    
+    def count(self) -> int:
+        with self._connections.read() as connection:
+            return connection.execute("SELECT COUNT(*) FROM stations").fetchone()[0]
+    
+    def count_by_status(self) -> Dict[StationStatus, int]:
+        counts = {status: 0 for status in StationStatus}
+        with self._connections.read() as connection:
+            rows = connection.execute("SELECT status, COUNT(*) FROM stations GROUP BY status").fetchall()
+        for value, count in rows:
+            counts[StationStatus(value)] = count
+        return counts
+    
+    def postal_code_version(self, postal_code: str) -> int:
+        with self._connections.read() as connection:
+            row = connection.execute(
+                "SELECT version FROM postal_code_versions WHERE postal_code = ?", (postal_code,)
+            ).fetchone()
+        return row[0] if row else 0
+    
+    def postal_code_versions(self) -> Dict[str, int]:
+        with self._connections.read() as connection:
+            return dict(connection.execute("SELECT postal_code, version FROM postal_code_versions").fetchall())
+    
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    
+    def _hits_within(
+        self,
+        latitude: float,
+        longitude: float,
+        meters: float,
+        status: Optional[StationStatus] = None
+    ) -> List[Tuple[float, str, OperationalStation]]:
+        """(distance, station id, station) within the radius, nearest first"""
+        min_lat, min_lon, max_lat, max_lon = _bounding_box(latitude, longitude, meters)
+        
+        sql = _IN_BOX
+        parameters: tuple = (min_lat, max_lat, min_lon, max_lon, min_lat, max_lat, min_lon, max_lon)
+        if status is not None:
+            sql += " AND s.status = ?"
+            parameters += (status.value,)
+        
+        hits = []
+        for station in self._query(sql, parameters):
+            distance = haversine_meters(latitude, longitude, station.latitude, station.longitude)
+            if distance <= meters:
+                hits.append((distance, station.station_id.value, station))
+        
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+        return hits
+    
+    def _query(self, sql: str, parameters: tuple = ()) -> List[OperationalStation]:
+        with self._connections.read() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+        return [self._to_station(row) for row in rows]
+    
+    @staticmethod
+    def _to_row(station: OperationalStation) -> StationRow:
+        return (
+            station.station_id.value,
+            station.name,
+            station.postal_code,
+            station.address,
+            station.latitude,
+            station.longitude,
+            station.status.value,
+        )
+    
+    @staticmethod
+    def _to_station(row: StationRow) -> OperationalStation:
+        station_id, name, postal_code, address, latitude, longitude, status = row
+        return OperationalStation(
+            station_id=StationId(station_id),
+            name=name,
+            postal_code=postal_code,
+            address=address,
+            latitude=latitude,
+            longitude=longitude,
+            status=StationStatus(status)
+        )
+
+
+def _bounding_box(latitude: float, longitude: float, meters: float) -> Tuple[float, float, float, float]:
+    """Lat/lon box enclosing the circle of `meters` around a point"""
+    angular = meters / EARTH_RADIUS_METERS
+    lat_span = math.degrees(angular)
+    min_lat, max_lat = max(latitude - lat_span, -90.0), min(latitude + lat_span, 90.0)
+    
+    cos_lat = math.cos(math.radians(latitude))
+    if angular + abs(math.radians(latitude)) >= math.pi / 2 or cos_lat <= 0:
+        return min_lat, -180.0, max_lat, 180.0
+    
+    lon_span = math.degrees(math.asin(min(1.0, math.sin(angular) / cos_lat)))
+    # Boxes crossing the antimeridian fall back to every longitude
+    if longitude - lon_span < -180.0 or longitude + lon_span > 180.0:
+        return min_lat, -180.0, max_lat, 180.0
+    return min_lat, longitude - lon_span, max_lat, longitude + lon_span
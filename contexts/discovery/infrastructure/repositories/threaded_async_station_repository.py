@@ -0,0 +1,96 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, List, Dict, Iterable, Set
+
+from ...domain.entities.operational_station import OperationalStation
+from ...domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from ...domain.repositories.i_station_repository import IStationRepository
+from ...domain.repositories.i_async_station_repository import IAsyncStationRepository
+
+
+class ThreadedAsyncStationRepository(IAsyncStationRepository):
+    """
+    Async view of a synchronous station repository
+    
+    Every call runs on an executor thread, so a blocking backend (SQLite,
+    a slow disk) never stalls the event loop. The wrapped repository must
+    be safe to share between threads, which all the bundled ones are.
+    """
+    
+    def __init__(self, inner: IStationRepository, executor: Optional[Executor] = None):
+        self._inner = inner
+        # None means the event loop's default thread pool
+        self._executor = executor
+    
+    async def save(self, station: OperationalStation) -> None:
+        await self._run(self._inner.save, station)
+    
+    async def save_all(self, stations: Iterable[OperationalStation]) -> int:
+        return await self._run(self._inner.save_all, stations)
+    
+    async def transition_status(
+        self,
+        station_ids: Iterable[StationId],
+        from_statuses: Iterable[StationStatus],
+        to_status: StationStatus
+    ) -> Set[StationId]:
+        return await self._run(self._inner.transition_status, list(station_ids), list(from_statuses), to_status)
+    
+    async def find_by_id(self, station_id: StationId) -> Optional[OperationalStation]:
+        return await self._run(self._inner.find_by_id, station_id)
+    
+    async def find_by_ids(self, station_ids: Iterable[StationId]) -> Dict[StationId, OperationalStation]:
+        # Materialized here: a lazy iterable must not be consumed on the executor thread
+        return await self._run(self._inner.find_by_ids, list(station_ids))
+    
+    async def find_by_postal_code(self, postal_code: str) -> List[OperationalStation]:
+        return await self._run(self._inner.find_by_postal_code, postal_code)
+    
+    async def find_by_status(self, status: StationStatus) -> List[OperationalStation]:
+        return await self._run(self._inner.find_by_status, status)
+    
+    async def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        status: Optional[StationStatus] = None
+    ) -> List[OperationalStation]:
+        return await self._run(self._inner.find_nearest, latitude, longitude, k, status)
+    
+    async def find_within_radius(self, latitude: float, longitude: float, meters: float) -> List[OperationalStation]:
+        return await self._run(self._inner.find_within_radius, latitude, longitude, meters)
+    
+    async def find_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[OperationalStation]:
+        return await self._run(self._inner.find_in_bbox, min_lat, min_lon, max_lat, max_lon, limit)
+    
+    async def find_all(self) -> List[OperationalStation]:
+        return await self._run(self._inner.find_all)
+    
+    async def exists(self, station_id: StationId) -> bool:
+        return await self._run(self._inner.exists, station_id)
+    
+    async def count(self) -> int:
+        return await self._run(self._inner.count)
+    
+    async def count_by_status(self) -> Dict[StationStatus, int]:
+        return await self._run(self._inner.count_by_status)
+    
+    async def postal_code_version(self, postal_code: str) -> int:
+        return await self._run(self._inner.postal_code_version, postal_code)
+    
+    async def postal_code_versions(self) -> Dict[str, int]:
+        return await self._run(self._inner.postal_code_versions)
+    
+    async def _run(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(method, *args))
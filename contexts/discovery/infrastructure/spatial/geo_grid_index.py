@@ -0,0 +1,219 @@
+"""Uniform lat/lon grid index for nearest-station and radius queries"""
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from contexts.shared_kernel.common.geo_point import EARTH_RADIUS_METERS, haversine_meters
+
+
+Cell = Tuple[int, int]
+
+
+class GeoGridIndex:
+    """
+    Buckets station ids into fixed-size lat/lon cells.
+    
+    Radius queries only visit the cells overlapping the search circle, and
+    nearest-neighbour queries walk outward ring by ring until the k-th hit
+    is provably closer than anything in an unvisited ring. With the default
+    0.01° cells (~1.1 km) a dense city averages a handful of stations per
+    cell, so both stay well under a millisecond at national scale.
+    """
+    
+    def __init__(self, cell_size_degrees: float = 0.01):
+        if cell_size_degrees <= 0:
+            raise ValueError("Cell size must be positive")
+        
+        self._cell_size = cell_size_degrees
+        self._cells: Dict[Cell, Dict[str, None]] = {}
+        self._points: Dict[str, Tuple[float, float]] = {}
+        # Occupied cell extent (min_row, max_row, min_col, max_col); only ever grows
+        self._extent: Optional[List[int]] = None
+    
+    def __len__(self) -> int:
+        return len(self._points)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._points
+    
+    def upsert(self, key: str, latitude: Optional[float], longitude: Optional[float]) -> None:
+        """Insert or move a point; missing coordinates remove it from the index"""
+        if latitude is None or longitude is None:
+            self.remove(key)
+            return
+        
+        previous = self._points.get(key)
+        if previous == (latitude, longitude):
+            return
+        if previous is not None:
+            self._discard_from_cell(key, self._cell_of(*previous))
+        
+        cell = self._cell_of(latitude, longitude)
+        self._points[key] = (latitude, longitude)
+        self._cells.setdefault(cell, {})[key] = None
+        self._grow_extent(cell)
+    
+    def remove(self, key: str) -> None:
+        previous = self._points.pop(key, None)
+        if previous is not None:
+            self._discard_from_cell(key, self._cell_of(*previous))
+    
+    def within_radius(self, latitude: float, longitude: float, meters: float) -> List[Tuple[str, float]]:
+        """(key, distance) pairs within the radius, nearest first"""
+        if meters < 0 or self._extent is None:
+            return []
+        
+        lat_span = math.degrees(meters / EARTH_RADIUS_METERS)
+        lon_span = self._longitude_span(latitude, meters)
+        min_row, max_row = self._row_of(latitude - lat_span), self._row_of(latitude + lat_span)
+        min_col, max_col = self._col_of(longitude - lon_span), self._col_of(longitude + lon_span)
+        
+        hits = []
+        for cell in self._cells_in_range(min_row, max_row, min_col, max_col):
+            for key in self._cells[cell]:
+                distance = haversine_meters(latitude, longitude, *self._points[key])
+                if distance <= meters:
+                    hits.append((distance, key))
+        
+        hits.sort()
+        return [(key, distance) for distance, key in hits]
+    
+    def in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """Keys inside the box (bounds inclusive), in cell order, at most `limit` of them"""
+        if self._extent is None or min_lat > max_lat or min_lon > max_lon:
+            return []
+        
+        keys: List[str] = []
+        cells = self._cells_in_range(
+            self._row_of(min_lat), self._row_of(max_lat),
+            self._col_of(min_lon), self._col_of(max_lon)
+        )
+        for cell in sorted(cells):
+            for key in self._cells[cell]:
+                lat, lon = self._points[key]
+                if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                    keys.append(key)
+                    if limit is not None and len(keys) >= limit:
+                        return keys
+        return keys
+    
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        predicate: Optional[Callable[[str], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """Up to k (key, distance) pairs accepted by predicate, nearest first"""
+        if k <= 0 or self._extent is None:
+            return []
+        
+        row, col = self._cell_of(latitude, longitude)
+        min_row, max_row, min_col, max_col = self._extent
+        # Rings closer than the occupied extent are empty, rings past it add nothing
+        first_ring = max(min_row - row, row - max_row, min_col - col, col - max_col, 0)
+        last_ring = max(row - min_row, max_row - row, col - min_col, max_col - col, 0)
+        
+        hits: List[Tuple[float, str]] = []
+        for ring in range(first_ring, last_ring + 1):
+            for cell in self._ring(row, col, ring):
+                for key in self._cells.get(cell, ()):
+                    if predicate is None or predicate(key):
+                        hits.append((haversine_meters(latitude, longitude, *self._points[key]), key))
+            
+            if len(hits) >= k:
+                hits.sort()
+                del hits[k:]
+                # Anything in ring+1 or beyond is at least this far away
+                if hits[-1][0] <= self._covered_meters(latitude, ring):
+                    break
+        
+        hits.sort()
+        return [(key, distance) for distance, key in hits[:k]]
+    
+    # ------------------------------------------------------------------
+    # Grid geometry
+    # ------------------------------------------------------------------
+    
+    def _row_of(self, latitude: float) -> int:
+        return math.floor(latitude / self._cell_size)
+    
+    def _col_of(self, longitude: float) -> int:
+        return math.floor(longitude / self._cell_size)
+    
+    def _cell_of(self, latitude: float, longitude: float) -> Cell:
+        return self._row_of(latitude), self._col_of(longitude)
+    
+    def _longitude_span(self, latitude: float, meters: float) -> float:
+        angular = meters / EARTH_RADIUS_METERS
+        cos_lat = math.cos(math.radians(latitude))
+        if angular + abs(math.radians(latitude)) >= math.pi / 2 or cos_lat <= 0:
+            return 360.0
+        return math.degrees(math.asin(min(1.0, math.sin(angular) / cos_lat)))
+    
+    def _covered_meters(self, latitude: float, ring: int) -> float:
+        """Lower bound on the distance from a point to any cell outside the searched rings"""
+        span = math.radians(ring * self._cell_size)
+        along_meridian = EARTH_RADIUS_METERS * span
+        across_meridian = EARTH_RADIUS_METERS * math.asin(
+            min(1.0, math.sin(min(span, math.pi / 2)) * math.cos(math.radians(latitude)))
+        )
+        return min(along_meridian, across_meridian)
+    
+    def _ring(self, row: int, col: int, ring: int) -> Iterator[Cell]:
+        """Cells at Chebyshev distance `ring` from (row, col), clipped to the occupied extent"""
+        if ring == 0:
+            yield row, col
+            return
+        
+        min_row, max_row, min_col, max_col = self._extent
+        col_lo, col_hi = max(col - ring, min_col), min(col + ring, max_col)
+        for r in (row - ring, row + ring):
+            if min_row <= r <= max_row:
+                for c in range(col_lo, col_hi + 1):
+                    yield r, c
+        
+        row_lo, row_hi = max(row - ring + 1, min_row), min(row + ring - 1, max_row)
+        for c in (col - ring, col + ring):
+            if min_col <= c <= max_col:
+                for r in range(row_lo, row_hi + 1):
+                    yield r, c
+    
+    def _cells_in_range(self, min_row: int, max_row: int, min_col: int, max_col: int) -> Iterator[Cell]:
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            # Huge search window - cheaper to filter the occupied cells
+            for cell in list(self._cells):
+                if min_row <= cell[0] <= max_row and min_col <= cell[1] <= max_col:
+                    yield cell
+            return
+        
+        for r in range(min_row, max_row + 1):
+            for c in range(min_col, max_col + 1):
+                if (r, c) in self._cells:
+                    yield r, c
+    
+    def _grow_extent(self, cell: Cell) -> None:
+        if self._extent is None:
+            self._extent = [cell[0], cell[0], cell[1], cell[1]]
+            return
+        
+        extent = self._extent
+        extent[0] = min(extent[0], cell[0])
+        extent[1] = max(extent[1], cell[0])
+        extent[2] = min(extent[2], cell[1])
+        extent[3] = max(extent[3], cell[1])
+    
+    def _discard_from_cell(self, key: str, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        
+        bucket.pop(key, None)
+        if not bucket:
+            del self._cells[cell]
@@ -0,0 +1,216 @@
+"""Zoom-level hierarchy of station clusters on the Web Mercator tile grid"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.repositories.i_station_cluster_index import IStationClusterIndex
+from contexts.discovery.domain.value_objects.station_cluster import StationCluster
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.read_write_lock import ReadWriteLock
+
+
+Cell = Tuple[int, int]
+
+# Web Mercator stops here; tiles above and below do not exist
+_MAX_MERCATOR_LATITUDE = 85.05112878
+_TILE_PIXELS = 256
+
+
+class _ClusterCell:
+    """Running totals for the stations in one cell"""
+    
+    __slots__ = ("members", "status_counts", "lat_sum", "lon_sum")
+    
+    def __init__(self):
+        self.members: Dict[str, None] = {}
+        self.status_counts: Dict[StationStatus, int] = {status: 0 for status in StationStatus}
+        self.lat_sum = 0.0
+        self.lon_sum = 0.0
+
+
+class GridStationClusterIndex(IStationClusterIndex):
+    """
+    Station clusters for every zoom level, kept as a quadtree of grid cells.
+    
+    At zoom z the Web Mercator world is 256·2^z pixels wide; each level
+    buckets stations into cells of `cell_pixels` screen pixels, and because
+    a cell at z+1 always lies inside exactly one cell at z (its coordinates
+    halved), the levels nest. Each cell keeps its member count per status
+    and coordinate sums for its centroid, so a status change touches one
+    cell per level and a viewport query at any zoom only visits the cells
+    on screen - never the stations themselves.
+    
+    Safe to share between threads.
+    """
+    
+    def __init__(self, min_zoom: int = 0, max_zoom: int = 18, cell_pixels: int = 64):
+        if min_zoom < 0 or max_zoom < min_zoom:
+            raise ValueError("Zoom range must satisfy 0 <= min_zoom <= max_zoom")
+        if cell_pixels <= 0 or _TILE_PIXELS % cell_pixels:
+            raise ValueError("Cell size must divide the 256 pixel tile size")
+        
+        self._min_zoom = min_zoom
+        self._max_zoom = max_zoom
+        self._cells_per_tile = _TILE_PIXELS // cell_pixels
+        self._lock = ReadWriteLock()
+        self._levels: Dict[int, Dict[Cell, _ClusterCell]] = {zoom: {} for zoom in self.zoom_levels}
+        # station id -> (latitude, longitude, status) as last indexed
+        self._stations: Dict[str, Tuple[float, float, StationStatus]] = {}
+    
+    def __len__(self) -> int:
+        with self._lock.read_locked():
+            return len(self._stations)
+    
+    @property
+    def zoom_levels(self) -> range:
+        return range(self._min_zoom, self._max_zoom + 1)
+    
+    # ------------------------------------------------------------------
+    # IStationClusterIndex
+    # ------------------------------------------------------------------
+    
+    def rebuild(self, stations: Iterable[OperationalStation]) -> int:
+        with self._lock.write_locked():
+            self._levels = {zoom: {} for zoom in self.zoom_levels}
+            self._stations = {}
+            for station in stations:
+                self._upsert(station)
+            return len(self._stations)
+    
+    def upsert(self, station: OperationalStation) -> None:
+        with self._lock.write_locked():
+            self._upsert(station)
+    
+    def remove(self, station_id: StationId) -> None:
+        with self._lock.write_locked():
+            self._remove(station_id.value)
+    
+    def clusters(
+        self,
+        zoom: int,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float
+    ) -> List[StationCluster]:
+        if min_lat > max_lat or min_lon > max_lon:
+            return []
+        
+        zoom = min(max(zoom, self._min_zoom), self._max_zoom)
+        # Latitude grows northward, tile rows grow southward
+        min_col, min_row = self._cell_at(_world_position(max_lat, min_lon), zoom)
+        max_col, max_row = self._cell_at(_world_position(min_lat, max_lon), zoom)
+        
+        with self._lock.read_locked():
+            level = self._levels[zoom]
+            if (max_col - min_col + 1) * (max_row - min_row + 1) > len(level):
+                cells = [
+                    (cell, totals) for cell, totals in level.items()
+                    if min_col <= cell[0] <= max_col and min_row <= cell[1] <= max_row
+                ]
+            else:
+                cells = [
+                    ((col, row), level[col, row])
+                    for col in range(min_col, max_col + 1)
+                    for row in range(min_row, max_row + 1)
+                    if (col, row) in level
+                ]
+            
+            return [self._cluster(zoom, cell) for _, cell in sorted(cells, key=lambda item: item[0])]
+    
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    
+    def _upsert(self, station: OperationalStation) -> None:
+        """Apply one station; the caller holds the write lock"""
+        key = station.station_id.value
+        if station.latitude is None or station.longitude is None:
+            self._remove(key)
+            return
+        
+        entry = (station.latitude, station.longitude, station.status)
+        previous = self._stations.get(key)
+        if previous == entry:
+            return
+        
+        if previous is not None and previous[:2] == entry[:2]:
+            # Status change only: shift one count per level, cells stay put
+            position = _world_position(previous[0], previous[1])
+            for zoom in self.zoom_levels:
+                counts = self._levels[zoom][self._cell_at(position, zoom)].status_counts
+                counts[previous[2]] -= 1
+                counts[station.status] += 1
+            self._stations[key] = entry
+            return
+        
+        self._remove(key)
+        position = _world_position(entry[0], entry[1])
+        for zoom in self.zoom_levels:
+            cell = self._levels[zoom].setdefault(self._cell_at(position, zoom), _ClusterCell())
+            cell.members[key] = None
+            cell.status_counts[station.status] += 1
+            cell.lat_sum += entry[0]
+            cell.lon_sum += entry[1]
+        self._stations[key] = entry
+    
+    def _remove(self, key: str) -> None:
+        previous = self._stations.pop(key, None)
+        if previous is None:
+            return
+        
+        latitude, longitude, status = previous
+        position = _world_position(latitude, longitude)
+        for zoom in self.zoom_levels:
+            cell_key = self._cell_at(position, zoom)
+            cell = self._levels[zoom][cell_key]
+            del cell.members[key]
+            if not cell.members:
+                del self._levels[zoom][cell_key]
+                continue
+            cell.status_counts[status] -= 1
+            cell.lat_sum -= latitude
+            cell.lon_sum -= longitude
+    
+    # ------------------------------------------------------------------
+    # Grid geometry
+    # ------------------------------------------------------------------
+    
+    def _cell_at(self, position: Tuple[float, float], zoom: int) -> Cell:
+        # Scaling by a power of two is exact, so a cell's parent is always (col // 2, row // 2)
+        cells = self._cells_per_tile << zoom
+        x, y = position
+        return (
+            min(max(int(x * cells), 0), cells - 1),
+            min(max(int(y * cells), 0), cells - 1),
+        )
+    
+    def _cluster(self, zoom: int, cell: _ClusterCell) -> StationCluster:
+        count = len(cell.members)
+        station_id: Optional[str] = next(iter(cell.members)) if count == 1 else None
+        counts = cell.status_counts
+        if station_id is not None:
+            # Exact position for a lone station, free of summation drift
+            latitude, longitude, _ = self._stations[station_id]
+        else:
+            latitude, longitude = cell.lat_sum / count, cell.lon_sum / count
+        return StationCluster(
+            zoom=zoom,
+            latitude=latitude,
+            longitude=longitude,
+            available=counts[StationStatus.AVAILABLE],
+            in_use=counts[StationStatus.IN_USE],
+            defective=counts[StationStatus.DEFECTIVE],
+            maintenance=counts[StationStatus.MAINTENANCE],
+            station_id=station_id
+        )
+
+
+def _world_position(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Web Mercator position as fractions of the world width and height, origin top-left"""
+    latitude = min(max(latitude, -_MAX_MERCATOR_LATITUDE), _MAX_MERCATOR_LATITUDE)
+    sin_lat = math.sin(math.radians(latitude))
+    x = (longitude + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return x, y
@@ -0,0 +1,39 @@
+"""DTOs for batch malfunction report creation"""
+from dataclasses import dataclass
+from typing import Tuple
+
+from .create_report_dto import CreateReportRequest, CreateReportResponse
+
+
+@dataclass(frozen=True)
+class CreateReportBatchRequest:
+    """Request DTO for creating many malfunction reports at once"""
+    items: Tuple[CreateReportRequest, ...]
+    
+    def __post_init__(self):
+        """Validate DTO fields"""
+        if not self.items:
+            raise ValueError("Batch cannot be empty")
+        
+        if not all(isinstance(item, CreateReportRequest) for item in self.items):
+            raise ValueError("Batch items must be CreateReportRequest instances")
+
+
+@dataclass(frozen=True)
+class CreateReportBatchResponse:
+    """Response DTO for batch report creation, one item per request item"""
+    items: Tuple[CreateReportResponse, ...]
+    
+    @property
+    def succeeded(self) -> int:
+        """Items that opened a ticket of their own"""
+        return sum(1 for item in self.items if item.success and not item.coalesced)
+    
+    @property
+    def coalesced(self) -> int:
+        """Items folded into an earlier item of the batch, whatever its outcome"""
+        return sum(1 for item in self.items if item.coalesced)
+    
+    @property
+    def failed(self) -> int:
+        return len(self.items) - self.succeeded - self.coalesced
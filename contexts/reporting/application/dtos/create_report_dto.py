@@ -31,6 +31,8 @@ class CreateReportResponse:
     ticket_id: Optional[str]
     success: bool
     errors: list[str]
+    # Set on batch items that repeated an earlier item and reuse its report
+    coalesced: bool = False
     
     @property
     def has_errors(self) -> bool:
@@ -0,0 +1,44 @@
+"""Async use case for creating malfunction reports"""
+from ..dtos.create_report_dto import CreateReportRequest, CreateReportResponse
+from contexts.reporting.domain.services.async_malfunction_report_service import AsyncMalfunctionReportService
+
+
+class AsyncCreateMalfunctionReportUseCase:
+    """Use Case: Create and process a malfunction report on an event loop"""
+    
+    def __init__(self, report_service: AsyncMalfunctionReportService):
+        self._report_service = report_service
+    
+    async def execute(self, request: CreateReportRequest) -> CreateReportResponse:
+        """Execute the use case to create a malfunction report"""
+        try:
+            report_id = await self._report_service.submit_malfunction_report(
+                station_id=request.station_id,
+                malfunction_type=request.malfunction_type,
+                description=request.description,
+                reported_by=request.reported_by
+            )
+            
+            processing_result = await self._report_service.process_malfunction_report(report_id)
+            
+            return CreateReportResponse(
+                report_id=str(report_id),
+                ticket_id=str(processing_result.ticket_id) if processing_result.ticket_id else None,
+                success=processing_result.success,
+                errors=processing_result.errors
+            )
+        
+        except ValueError as e:
+            return CreateReportResponse(
+                report_id="",
+                ticket_id=None,
+                success=False,
+                errors=[str(e)]
+            )
+        except Exception as e:
+            return CreateReportResponse(
+                report_id="",
+                ticket_id=None,
+                success=False,
+                errors=[f"Unexpected error: {str(e)}"]
+            )
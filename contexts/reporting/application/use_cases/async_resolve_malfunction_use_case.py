@@ -0,0 +1,55 @@
+"""Async use case for resolving malfunction reports"""
+from uuid import UUID
+from ..dtos.resolve_report_dto import ResolveReportRequest, ResolveReportResponse
+from contexts.reporting.domain.services.async_malfunction_report_service import AsyncMalfunctionReportService
+
+
+class AsyncResolveMalfunctionUseCase:
+    """Use Case: Resolve a malfunction report on an event loop"""
+    
+    def __init__(self, report_service: AsyncMalfunctionReportService):
+        self._report_service = report_service
+    
+    async def execute(self, request: ResolveReportRequest) -> ResolveReportResponse:
+        """Execute the use case to resolve a malfunction"""
+        try:
+            ticket_id = UUID(request.ticket_id)
+            
+            report = await self._report_service.get_report_by_ticket(ticket_id)
+            
+            if not report:
+                return ResolveReportResponse(
+                    success=False,
+                    ticket_id=request.ticket_id,
+                    station_id=None,
+                    message=f"No report found with ticket ID {request.ticket_id}"
+                )
+            
+            station_id = report.station_id.value
+            
+            await self._report_service.resolve_malfunction(
+                ticket_id=ticket_id,
+                operator_notes=request.operator_notes
+            )
+            
+            return ResolveReportResponse(
+                success=True,
+                ticket_id=request.ticket_id,
+                station_id=station_id,
+                message=f"Malfunction resolved for station {station_id}"
+            )
+        
+        except ValueError as e:
+            return ResolveReportResponse(
+                success=False,
+                ticket_id=request.ticket_id,
+                station_id=None,
+                message=str(e)
+            )
+        except Exception as e:
+            return ResolveReportResponse(
+                success=False,
+                ticket_id=request.ticket_id,
+                station_id=None,
+                message=f"Unexpected error: {str(e)}"
+            )
@@ -0,0 +1,49 @@
+"""Use case for creating many malfunction reports in one call"""
+from ..dtos.create_report_batch_dto import CreateReportBatchRequest, CreateReportBatchResponse
+from ..dtos.create_report_dto import CreateReportResponse
+from contexts.reporting.domain.services.malfunction_report_service import (
+    MalfunctionReportService,
+    ReportSubmission,
+)
+
+
+class CreateMalfunctionReportBatchUseCase:
+    """Use Case: Create and process a batch of malfunction reports"""
+    
+    def __init__(self, report_service: MalfunctionReportService):
+        self._report_service = report_service
+    
+    def execute(self, request: CreateReportBatchRequest) -> CreateReportBatchResponse:
+        """Execute the use case; every item gets its own response, in request order"""
+        submissions = [
+            ReportSubmission(
+                station_id=item.station_id,
+                malfunction_type=item.malfunction_type,
+                description=item.description,
+                reported_by=item.reported_by
+            )
+            for item in request.items
+        ]
+        
+        try:
+            results = self._report_service.process_malfunction_report_batch(submissions)
+        except Exception as e:
+            # The service stores a batch all or nothing, so the whole batch failed and can be retried
+            failure = CreateReportResponse(
+                report_id="",
+                ticket_id=None,
+                success=False,
+                errors=[f"Unexpected error, no report of the batch was stored: {str(e)}"]
+            )
+            return CreateReportBatchResponse(items=tuple(failure for _ in request.items))
+        
+        return CreateReportBatchResponse(items=tuple(
+            CreateReportResponse(
+                report_id=str(result.report_id) if result.report_id else "",
+                ticket_id=str(result.ticket_id) if result.ticket_id else None,
+                success=result.success,
+                errors=result.errors,
+                coalesced=result.duplicate
+            )
+            for result in results
+        ))
@@ -16,11 +16,7 @@ class ResolveMalfunctionUseCase:
             ticket_id = UUID(request.ticket_id)
             
             # Get report details before resolution
-            all_reports = self._report_service.get_all_reports()
-            report = next(
-                (r for r in all_reports if r.ticket_id == ticket_id),
-                None
-            )
+            report = self._report_service.get_report_by_ticket(ticket_id)
             
             if not report:
                 return ResolveReportResponse(
@@ -33,6 +33,30 @@ class MalfunctionReport:
         self._created_at = datetime.now()
         self._validation_errors: list[str] = []
     
+    @classmethod
+    def restore(
+        cls,
+        report_id: UUID,
+        station_id: StationId,
+        malfunction_type: MalfunctionType,
+        description: ReportDescription,
+        reported_by: Optional[str],
+        status: ReportStatus,
+        ticket_id: Optional[UUID],
+        created_at: datetime
+    ) -> "MalfunctionReport":
+        """
+        Rebuild a persisted report in the state it was saved in
+        
+        Only repositories should call this; new reports start SUBMITTED
+        through the constructor and move on through the lifecycle methods.
+        """
+        report = cls(report_id, station_id, malfunction_type, description, reported_by)
+        report._status = status
+        report._ticket_id = ticket_id
+        report._created_at = created_at
+        return report
+    
     @property
     def report_id(self) -> UUID:
         """Get report ID"""
@@ -43,6 +67,26 @@ class MalfunctionReport:
         """Get station ID"""
         return self._station_id
     
+    @property
+    def malfunction_type(self) -> MalfunctionType:
+        """Get malfunction type"""
+        return self._malfunction_type
+    
+    @property
+    def description(self) -> ReportDescription:
+        """Get description"""
+        return self._description
+    
+    @property
+    def reported_by(self) -> Optional[str]:
+        """Get reporter, if the report was not anonymous"""
+        return self._reported_by
+    
+    @property
+    def created_at(self) -> datetime:
+        """Get creation time"""
+        return self._created_at
+    
     @property
     def status(self) -> ReportStatus:
         """Get current status"""
@@ -108,10 +152,14 @@ class MalfunctionReport:
         Mark the report as resolved
         
         Raises:
-            ValueError: If report doesn't have a ticket
+            ValueError: If report doesn't have a ticket, or its ticket is no longer open
         """
         if self._ticket_id is None:
             raise ValueError("Cannot resolve report without a ticket")
         
+        # A retried resolve must not restore a station a newer ticket marked defective
+        if self._status != ReportStatus.TICKET_CREATED:
+            raise ValueError(f"Ticket {self._ticket_id} is already {self._status.value}")
+        
         self._status = ReportStatus.RESOLVED
         self._updated_at = datetime.now()
\ No newline at end of file
@@ -9,4 +9,7 @@ class ReportStatus(Enum):
     INVALID = "invalid"
     TICKET_CREATED = "ticket_created"
     RESOLVED = "resolved"
-    CLOSED = "closed"
\ No newline at end of file
+    CLOSED = "closed"
+
+# Reports an operator still has to act on: a ticket exists and is not resolved yet
+OPEN_STATUSES = frozenset({ReportStatus.TICKET_CREATED})
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Iterable
+from uuid import UUID
+
+from ..entities.malfunction_report import MalfunctionReport
+from ..enums.report_status import ReportStatus
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class IAsyncReportRepository(ABC):
+    """Asyncio counterpart of IReportRepository"""
+    
+    @abstractmethod
+    async def save(self, report: MalfunctionReport) -> None:
+        """Save or update a malfunction report"""
+        pass
+    
+    @abstractmethod
+    async def save_all(self, reports: Iterable[MalfunctionReport]) -> int:
+        """Save or update many reports in one bulk write, returning how many were saved"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Find a report by its ID"""
+        pass
+    
+    @abstractmethod
+    async def find_by_ticket_id(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        pass
+    
+    @abstractmethod
+    async def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        """Find all reports for a specific station"""
+        pass
+    
+    @abstractmethod
+    async def find_by_status(self, status: ReportStatus) -> List[MalfunctionReport]:
+        """Find the reports currently in one lifecycle state"""
+        pass
+    
+    @abstractmethod
+    async def find_open(self) -> List[MalfunctionReport]:
+        """Find the reports whose ticket still awaits an operator"""
+        pass
+    
+    @abstractmethod
+    async def find_all(self) -> List[MalfunctionReport]:
+        """Get all reports"""
+        pass
+    
+    @abstractmethod
+    async def count(self) -> int:
+        """Get the total number of reports"""
+        pass
+    
+    @abstractmethod
+    async def count_by_status(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        pass
\ No newline at end of file
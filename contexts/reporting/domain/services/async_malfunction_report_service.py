@@ -0,0 +1,186 @@
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from ..entities.malfunction_report import MalfunctionReport
+from contexts.shared_kernel.common.station_id import StationId
+from ..value_objects.report_description import ReportDescription
+from ..enums.malfunction_type import MalfunctionType
+from ..enums.report_status import ReportStatus
+from ..repositories.i_async_report_repository import IAsyncReportRepository
+from .malfunction_report_service import (
+    BatchItemResult,
+    ProcessingResult,
+    ReportSubmission,
+    claimed_by_previous_status,
+    finish_batch,
+    open_tickets,
+    prepare_batch,
+    validate_batch,
+)
+
+# Cross-context import - use absolute path from project root
+from contexts.discovery.domain.repositories.i_async_station_repository import IAsyncStationRepository
+from contexts.discovery.domain.value_objects.station_status import OPERATIONAL_STATUSES, StationStatus
+from contexts.shared_kernel.infrastructure.striped_lock import AsyncStripedLock
+
+
+class AsyncMalfunctionReportService:
+    """
+    Asyncio counterpart of MalfunctionReportService
+    
+    Same workflow and business rules; repository calls are awaited, so one
+    event loop can keep many reports in flight while the backends do I/O.
+    """
+    
+    def __init__(
+        self,
+        report_repository: IAsyncReportRepository,
+        station_repository: IAsyncStationRepository,
+        station_locks: Optional[AsyncStripedLock] = None
+    ):
+        self._report_repository = report_repository
+        self._station_repository = station_repository
+        # Serializes read-validate-mutate-save sequences per station
+        self._station_locks = station_locks or AsyncStripedLock()
+    
+    async def submit_malfunction_report(
+        self,
+        station_id: str,
+        malfunction_type: MalfunctionType,
+        description: str,
+        reported_by: Optional[str] = None
+    ) -> UUID:
+        """Use Case 1: Submit a new malfunction report, returning its ID"""
+        report = MalfunctionReport(
+            report_id=uuid4(),
+            station_id=StationId(station_id),
+            malfunction_type=malfunction_type,
+            description=ReportDescription(description),
+            reported_by=reported_by
+        )
+        
+        await self._report_repository.save(report)
+        
+        return report.report_id
+    
+    async def process_malfunction_report(self, report_id: UUID) -> ProcessingResult:
+        """Use Case 2: Validate a report, create a ticket and mark the station defective"""
+        report = await self._report_repository.find_by_id(report_id)
+        if not report:
+            return ProcessingResult(
+                success=False,
+                ticket_id=None,
+                errors=[f"Report {report_id} not found"]
+            )
+        
+        async with self._station_locks.lock_for(report.station_id.value):
+            station = await self._station_repository.find_by_id(report.station_id)
+            station_exists = station is not None
+            station_is_operational = station.is_operational if station else False
+            
+            if not report.validate(station_exists, station_is_operational):
+                await self._report_repository.save(report)
+                return ProcessingResult(
+                    success=False,
+                    ticket_id=None,
+                    errors=report.get_validation_errors()
+                )
+            
+            # Claimed atomically in the store, so only one of several services opens a ticket
+            claimed = await self._station_repository.transition_status(
+                [report.station_id], OPERATIONAL_STATUSES, StationStatus.DEFECTIVE
+            )
+            if not claimed:
+                report.validate(station_exists=True, station_is_operational=False)
+                await self._report_repository.save(report)
+                return ProcessingResult(
+                    success=False,
+                    ticket_id=None,
+                    errors=report.get_validation_errors()
+                )
+            
+            ticket_id = uuid4()
+            report.create_ticket(ticket_id)
+            
+            try:
+                await self._report_repository.save(report)
+            except Exception:
+                await self._station_repository.transition_status(
+                    claimed, {StationStatus.DEFECTIVE}, station.status
+                )
+                raise
+        
+        return ProcessingResult(
+            success=True,
+            ticket_id=ticket_id,
+            errors=[]
+        )
+    
+    async def resolve_malfunction(
+        self,
+        ticket_id: UUID,
+        operator_notes: Optional[str] = None
+    ) -> None:
+        """Use Case 3: Resolve a malfunction and restore the station"""
+        report = await self._report_repository.find_by_ticket_id(ticket_id)
+        
+        if not report:
+            raise ValueError(f"No report found with ticket ID {ticket_id}")
+        
+        async with self._station_locks.lock_for(report.station_id.value):
+            station = await self._station_repository.find_by_id(report.station_id)
+            if not station:
+                raise ValueError(f"Station {report.station_id} not found")
+            
+            report.resolve()
+            
+            await self._report_repository.save(report)
+            await self._station_repository.transition_status(
+                [report.station_id], {StationStatus.DEFECTIVE}, StationStatus.AVAILABLE
+            )
+    
+    async def process_malfunction_report_batch(self, submissions: Sequence[ReportSubmission]) -> List[BatchItemResult]:
+        """Use Case 4: Submit and process many reports in one pass"""
+        results, reports, duplicates = prepare_batch(submissions)
+        
+        station_ids = {report.station_id for _, report in reports}
+        async with self._station_locks.locks_for(station_id.value for station_id in station_ids):
+            # One bulk lookup for every station the batch touches
+            stations = await self._station_repository.find_by_ids(station_ids)
+            candidates = validate_batch(reports, stations, results)
+            
+            claimed = await self._station_repository.transition_status(
+                [report.station_id for _, report in candidates], OPERATIONAL_STATUSES, StationStatus.DEFECTIVE
+            )
+            open_tickets(candidates, claimed, results)
+            
+            try:
+                await self._report_repository.save_all([report for _, report in reports])
+            except Exception:
+                for previous_status, claimed_ids in claimed_by_previous_status(stations, claimed).items():
+                    await self._station_repository.transition_status(
+                        claimed_ids, {StationStatus.DEFECTIVE}, previous_status
+                    )
+                raise
+        
+        return finish_batch(results, duplicates)
+    
+    async def get_reports_for_station(self, station_id: str) -> List[MalfunctionReport]:
+        """Get all reports for a specific station"""
+        return await self._report_repository.find_by_station(StationId(station_id))
+    
+    async def get_report_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Get the report a ticket was created for"""
+        return await self._report_repository.find_by_ticket_id(ticket_id)
+    
+    async def get_all_reports(self) -> List[MalfunctionReport]:
+        """Get all malfunction reports"""
+        return await self._report_repository.find_all()
+    
+    async def get_open_reports(self) -> List[MalfunctionReport]:
+        """Get the reports whose ticket still awaits an operator"""
+        return await self._report_repository.find_open()
+    
+    async def get_report_counts(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        return await self._report_repository.count_by_status()
@@ -1,15 +1,19 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
 from ..entities.malfunction_report import MalfunctionReport
 from contexts.shared_kernel.common.station_id import StationId
 from ..value_objects.report_description import ReportDescription
 from ..enums.malfunction_type import MalfunctionType
+from ..enums.report_status import ReportStatus
 from ..repositories.i_report_repository import IReportRepository
 
 # Cross-context import - use absolute path from project root
+from contexts.discovery.domain.entities.operational_station import OperationalStation
 from contexts.discovery.domain.repositories.i_station_repository import IStationRepository
+from contexts.discovery.domain.value_objects.station_status import OPERATIONAL_STATUSES, StationStatus
+from contexts.shared_kernel.infrastructure.striped_lock import StripedLock
 
 @dataclass
 class ProcessingResult:
@@ -18,16 +22,38 @@ class ProcessingResult:
     errors: List[str]
 
 
+@dataclass(frozen=True)
+class ReportSubmission:
+    """One report of a batch, before any validation"""
+    station_id: str
+    malfunction_type: MalfunctionType
+    description: str
+    reported_by: Optional[str] = None
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch item; duplicates share the first occurrence's report"""
+    report_id: Optional[UUID]
+    success: bool
+    ticket_id: Optional[UUID]
+    errors: List[str]
+    duplicate: bool = False
+
+
 class MalfunctionReportService:
     """Domain service for malfunction reporting workflow"""
     
     def __init__(
         self,
         report_repository: IReportRepository,
-        station_repository: IStationRepository
+        station_repository: IStationRepository,
+        station_locks: Optional[StripedLock] = None
     ):
         self._report_repository = report_repository
         self._station_repository = station_repository
+        # Serializes read-validate-mutate-save sequences per station
+        self._station_locks = station_locks or StripedLock()
     
     # ... rest of your existing code
     
@@ -93,33 +119,52 @@ class MalfunctionReportService:
                 errors=[f"Report {report_id} not found"]
             )
         
-        # Check if station exists and is operational
-        station = self._station_repository.find_by_id(report.station_id)
-        station_exists = station is not None
-        station_is_operational = station.is_operational if station else False
-        
-        # Validate report (business rules)
-        is_valid = report.validate(station_exists, station_is_operational)
-        
-        if not is_valid:
-            # Save invalid report
-            self._report_repository.save(report)
-            return ProcessingResult(
-                success=False,
-                ticket_id=None,
-                errors=report.get_validation_errors()
+        # Concurrent reports for the same station validate one after another
+        # within this process; the claim below settles races with other processes
+        with self._station_locks.lock_for(report.station_id.value):
+            # Check if station exists and is operational
+            station = self._station_repository.find_by_id(report.station_id)
+            station_exists = station is not None
+            station_is_operational = station.is_operational if station else False
+            
+            # Validate report (business rules)
+            is_valid = report.validate(station_exists, station_is_operational)
+            
+            if not is_valid:
+                # Save invalid report
+                self._report_repository.save(report)
+                return ProcessingResult(
+                    success=False,
+                    ticket_id=None,
+                    errors=report.get_validation_errors()
+                )
+            
+            # Mark station as defective - atomically in the store, so of two
+            # services sharing a database only one opens a ticket
+            claimed = self._station_repository.transition_status(
+                [report.station_id], OPERATIONAL_STATUSES, StationStatus.DEFECTIVE
             )
-        
-        # Create ticket
-        ticket_id = uuid4()
-        report.create_ticket(ticket_id)
-        
-        # Mark station as defective
-        station.mark_as_defective()
-        
-        # Save all changes
-        self._report_repository.save(report)
-        self._station_repository.save(station)
+            if not claimed:
+                report.validate(station_exists=True, station_is_operational=False)
+                self._report_repository.save(report)
+                return ProcessingResult(
+                    success=False,
+                    ticket_id=None,
+                    errors=report.get_validation_errors()
+                )
+            
+            # Create ticket
+            ticket_id = uuid4()
+            report.create_ticket(ticket_id)
+            
+            try:
+                self._report_repository.save(report)
+            except Exception:
+                # No ticket was stored, so give the station back
+                self._station_repository.transition_status(
+                    claimed, {StationStatus.DEFECTIVE}, station.status
+                )
+                raise
         
         return ProcessingResult(
             success=True,
@@ -140,35 +185,202 @@ class MalfunctionReportService:
             operator_notes: Notes from operator about resolution
         """
         # Find report by ticket ID
-        all_reports = self._report_repository.find_all()
-        report = next(
-            (r for r in all_reports if r.ticket_id == ticket_id),
-            None
-        )
+        report = self._report_repository.find_by_ticket_id(ticket_id)
         
         if not report:
             raise ValueError(f"No report found with ticket ID {ticket_id}")
         
-        # Load station
-        station = self._station_repository.find_by_id(report.station_id)
-        if not station:
-            raise ValueError(f"Station {report.station_id} not found")
+        with self._station_locks.lock_for(report.station_id.value):
+            # Load station
+            station = self._station_repository.find_by_id(report.station_id)
+            if not station:
+                raise ValueError(f"Station {report.station_id} not found")
+            
+            # Mark report as resolved
+            report.resolve()
+            
+            # Restore station to available; a station another ticket already
+            # restored stays as it is
+            self._report_repository.save(report)
+            self._station_repository.transition_status(
+                [report.station_id], {StationStatus.DEFECTIVE}, StationStatus.AVAILABLE
+            )
+    
+    def process_malfunction_report_batch(self, submissions: Sequence[ReportSubmission]) -> List[BatchItemResult]:
+        """
+        Use Case 4: Submit and process many reports in one pass
+        
+        Same business rules as submit + process for each item, in order, but:
+        - items repeating an earlier (station, type, description) are
+          coalesced into the earlier report instead of creating another
+        - each station is looked up once, however many items name it
+        - the stations are claimed in one atomic bulk transition and the
+          reports persisted in one bulk write
         
-        # Mark report as resolved
-        report.resolve()
+        The batch is stored all or nothing: if the reports cannot be saved,
+        the claimed stations are released again before the error propagates.
         
-        # Restore station to available
-        station.mark_as_available()
+        Args:
+            submissions: Reports in the order they should be processed
         
-        # Save changes
-        self._report_repository.save(report)
-        self._station_repository.save(station)
+        Returns:
+            One BatchItemResult per submission, in the same order
+        """
+        results, reports, duplicates = prepare_batch(submissions)
+        
+        station_ids = {report.station_id for _, report in reports}
+        with self._station_locks.locks_for(station_id.value for station_id in station_ids):
+            # One bulk lookup for every station the batch touches
+            stations = self._station_repository.find_by_ids(station_ids)
+            candidates = validate_batch(reports, stations, results)
+            
+            claimed = self._station_repository.transition_status(
+                (report.station_id for _, report in candidates), OPERATIONAL_STATUSES, StationStatus.DEFECTIVE
+            )
+            open_tickets(candidates, claimed, results)
+            
+            try:
+                self._report_repository.save_all(report for _, report in reports)
+            except Exception:
+                for previous_status, claimed_ids in claimed_by_previous_status(stations, claimed).items():
+                    self._station_repository.transition_status(claimed_ids, {StationStatus.DEFECTIVE}, previous_status)
+                raise
+        
+        return finish_batch(results, duplicates)
     
     def get_reports_for_station(self, station_id: str) -> List[MalfunctionReport]:
         """Get all reports for a specific station"""
         station_id_vo = StationId(station_id)
         return self._report_repository.find_by_station(station_id_vo)
     
+    def get_report_by_ticket(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Get the report a ticket was created for"""
+        return self._report_repository.find_by_ticket_id(ticket_id)
+    
     def get_all_reports(self) -> List[MalfunctionReport]:
         """Get all malfunction reports"""
-        return self._report_repository.find_all()
\ No newline at end of file
+        return self._report_repository.find_all()
+    
+    def get_open_reports(self) -> List[MalfunctionReport]:
+        """Get the reports whose ticket still awaits an operator"""
+        return self._report_repository.find_open()
+    
+    def get_report_counts(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        return self._report_repository.count_by_status()
+
+
+# ----------------------------------------------------------------------
+# Batch steps, shared with the async service
+# ----------------------------------------------------------------------
+
+BatchReports = List[Tuple[int, MalfunctionReport]]
+
+
+def prepare_batch(
+    submissions: Sequence[ReportSubmission]
+) -> Tuple[List[Optional[BatchItemResult]], BatchReports, List[Tuple[int, int]]]:
+    """
+    Build a report per distinct submission
+    
+    Returns the result slots (filled for items that failed value object
+    validation), the (index, report) pairs to process, and (index, first
+    index) pairs for items coalesced into an earlier one.
+    """
+    results: List[Optional[BatchItemResult]] = [None] * len(submissions)
+    first_index_by_key: Dict[Tuple[str, MalfunctionType, str], int] = {}
+    reports: BatchReports = []
+    duplicates: List[Tuple[int, int]] = []
+    
+    for index, submission in enumerate(submissions):
+        try:
+            station_id_vo = StationId(submission.station_id)
+            description_vo = ReportDescription(submission.description)
+        except ValueError as error:
+            results[index] = BatchItemResult(None, False, None, [str(error)])
+            continue
+        
+        key = (station_id_vo.value, submission.malfunction_type, " ".join(description_vo.value.casefold().split()))
+        if key in first_index_by_key:
+            duplicates.append((index, first_index_by_key[key]))
+            continue
+        first_index_by_key[key] = index
+        
+        reports.append((index, MalfunctionReport(
+            report_id=uuid4(),
+            station_id=station_id_vo,
+            malfunction_type=submission.malfunction_type,
+            description=description_vo,
+            reported_by=submission.reported_by
+        )))
+    
+    return results, reports, duplicates
+
+
+def validate_batch(
+    reports: BatchReports,
+    stations: Dict[StationId, OperationalStation],
+    results: List[Optional[BatchItemResult]]
+) -> BatchReports:
+    """
+    Validate the reports in order against the looked-up stations
+    
+    Returns the valid reports, at most one per station: a later report for
+    a station an earlier one is about to mark defective is invalid.
+    """
+    candidates: BatchReports = []
+    reported_station_ids: Set[StationId] = set()
+    
+    for index, report in reports:
+        station = stations.get(report.station_id)
+        station_is_operational = (
+            station is not None and station.is_operational and report.station_id not in reported_station_ids
+        )
+        
+        if not report.validate(station is not None, station_is_operational):
+            results[index] = BatchItemResult(report.report_id, False, None, report.get_validation_errors())
+            continue
+        
+        reported_station_ids.add(report.station_id)
+        candidates.append((index, report))
+    
+    return candidates
+
+
+def open_tickets(
+    candidates: BatchReports,
+    claimed: Set[StationId],
+    results: List[Optional[BatchItemResult]]
+) -> None:
+    """Create tickets for the candidates whose station was claimed; the rest lost it to another writer"""
+    for index, report in candidates:
+        if report.station_id not in claimed:
+            report.validate(station_exists=True, station_is_operational=False)
+            results[index] = BatchItemResult(report.report_id, False, None, report.get_validation_errors())
+            continue
+        
+        ticket_id = uuid4()
+        report.create_ticket(ticket_id)
+        results[index] = BatchItemResult(report.report_id, True, ticket_id, [])
+
+
+def claimed_by_previous_status(
+    stations: Dict[StationId, OperationalStation],
+    claimed: Iterable[StationId]
+) -> Dict[StationStatus, List[StationId]]:
+    """Group claimed stations by the status to restore if their tickets cannot be stored"""
+    grouped: Dict[StationStatus, List[StationId]] = {}
+    for station_id in claimed:
+        grouped.setdefault(stations[station_id].status, []).append(station_id)
+    return grouped
+
+
+def finish_batch(
+    results: List[Optional[BatchItemResult]],
+    duplicates: List[Tuple[int, int]]
+) -> List[BatchItemResult]:
+    """Copy each first occurrence's outcome onto the items coalesced into it"""
+    for index, first_index in duplicates:
+        first = results[first_index]
+        results[index] = BatchItemResult(first.report_id, first.success, first.ticket_id, list(first.errors), duplicate=True)
+    return results
\ No newline at end of file
@@ -1,33 +1,104 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from ...domain.entities.malfunction_report import MalfunctionReport
+from ...domain.enums.report_status import OPEN_STATUSES, ReportStatus
 from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.read_write_lock import ReadWriteLock
 from ...domain.repositories.i_report_repository import IReportRepository
 
 
 class InMemoryReportRepository(IReportRepository):
-    """In-memory implementation of malfunction report repository"""
+    """
+    In-memory implementation of malfunction report repository
+    
+    Safe to share between threads: queries run concurrently under the read
+    side of a reader/writer lock, saves are serialized under the write side.
+    """
     
     def __init__(self):
         """Initialize empty storage"""
+        self._lock = ReadWriteLock()
         self._reports: Dict[UUID, MalfunctionReport] = {}
+        self._ticket_index: Dict[UUID, UUID] = {}
+        # Status membership: ordered set of report ids per status, moved on every status transition
+        self._status_by_id: Dict[UUID, ReportStatus] = {}
+        self._ids_by_status: Dict[ReportStatus, Dict[UUID, None]] = {status: {} for status in ReportStatus}
     
     def save(self, report: MalfunctionReport) -> None:
         """Save or update a malfunction report"""
-        self._reports[report.report_id] = report
+        with self._lock.write_locked():
+            self._save(report)
+    
+    def save_all(self, reports: Iterable[MalfunctionReport]) -> int:
+        """Save or update many reports under a single write lock"""
+        reports = list(reports)
+        with self._lock.write_locked():
+            for report in reports:
+                self._save(report)
+        return len(reports)
     
     def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
         """Find a report by its ID"""
-        return self._reports.get(report_id)
+        with self._lock.read_locked():
+            return self._reports.get(report_id)
+    
+    def find_by_ticket_id(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        with self._lock.read_locked():
+            report_id = self._ticket_index.get(ticket_id)
+            if report_id is None:
+                return None
+            return self._reports.get(report_id)
     
     def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
         """Find all reports for a specific station"""
-        return [
-            report for report in self._reports.values()
-            if report.station_id == station_id
-        ]
+        with self._lock.read_locked():
+            return [
+                report for report in self._reports.values()
+                if report.station_id == station_id
+            ]
+    
+    def find_by_status(self, status: ReportStatus) -> List[MalfunctionReport]:
+        """Find the reports currently in one lifecycle state"""
+        with self._lock.read_locked():
+            return [self._reports[report_id] for report_id in self._ids_by_status[status]]
+    
+    def find_open(self) -> List[MalfunctionReport]:
+        """Find the reports whose ticket still awaits an operator"""
+        with self._lock.read_locked():
+            return [
+                self._reports[report_id]
+                for status in ReportStatus if status in OPEN_STATUSES
+                for report_id in self._ids_by_status[status]
+            ]
     
     def find_all(self) -> List[MalfunctionReport]:
         """Get all reports"""
-        return list(self._reports.values())
\ No newline at end of file
+        with self._lock.read_locked():
+            return list(self._reports.values())
+    
+    def count(self) -> int:
+        """Get the total number of reports"""
+        with self._lock.read_locked():
+            return len(self._reports)
+    
+    def count_by_status(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        with self._lock.read_locked():
+            return {status: len(ids) for status, ids in self._ids_by_status.items()}
+    
+    def _save(self, report: MalfunctionReport) -> None:
+        """Apply a save; the caller holds the write lock"""
+        self._reports[report.report_id] = report
+        
+        if report.ticket_id is not None:
+            self._ticket_index[report.ticket_id] = report.report_id
+        
+        # Move the report between status sets on a transition since its last save
+        previous_status = self._status_by_id.get(report.report_id)
+        if previous_status != report.status:
+            if previous_status is not None:
+                del self._ids_by_status[previous_status][report.report_id]
+            self._ids_by_status[report.status][report.report_id] = None
+            self._status_by_id[report.report_id] = report.status
\ No newline at end of file
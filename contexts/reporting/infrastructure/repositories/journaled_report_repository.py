@@ -0,0 +1,193 @@
+import threading
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+from uuid import UUID
+
+from ...domain.entities.malfunction_report import MalfunctionReport
+from ...domain.enums.malfunction_type import MalfunctionType
+from ...domain.enums.report_status import ReportStatus
+from ...domain.value_objects.report_description import ReportDescription
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.event_journal import EventJournal
+from ...domain.repositories.i_report_repository import IReportRepository
+
+
+REPORT_SUBMITTED = "report_submitted"
+REPORT_STATUS_CHANGED = "report_status_changed"
+
+
+def report_to_record(report: MalfunctionReport) -> Dict[str, Any]:
+    """Full report state as a JSON-friendly dict"""
+    return {
+        "report_id": str(report.report_id),
+        "station_id": report.station_id.value,
+        "malfunction_type": report.malfunction_type.value,
+        "description": report.description.value,
+        "reported_by": report.reported_by,
+        "status": report.status.value,
+        "ticket_id": None if report.ticket_id is None else str(report.ticket_id),
+        "created_at": report.created_at.isoformat(),
+    }
+
+
+def report_from_record(record: Dict[str, Any]) -> MalfunctionReport:
+    return MalfunctionReport.restore(
+        report_id=UUID(record["report_id"]),
+        station_id=StationId(record["station_id"]),
+        malfunction_type=MalfunctionType(record["malfunction_type"]),
+        description=ReportDescription(record["description"]),
+        reported_by=record["reported_by"],
+        status=ReportStatus(record["status"]),
+        ticket_id=None if record["ticket_id"] is None else UUID(record["ticket_id"]),
+        created_at=datetime.fromisoformat(record["created_at"])
+    )
+
+
+class JournaledReportRepository(IReportRepository):
+    """
+    Report repository decorator that journals every report lifecycle change
+    
+    A new report is journaled in full (report_submitted); later saves only
+    record the status and ticket they moved to (report_status_changed).
+    Events are appended before the wrapped repository is updated, and
+    every `snapshot_every` events all reports are snapshotted and the log
+    compacted, so recover() replays at most one interval of events.
+    """
+    
+    def __init__(self, inner: IReportRepository, journal: EventJournal, snapshot_every: int = 1000):
+        if snapshot_every <= 0:
+            raise ValueError("Snapshot interval must be positive")
+        
+        self._inner = inner
+        self._journal = journal
+        self._snapshot_every = snapshot_every
+        # Keeps journal order and repository order identical for concurrent saves
+        self._write_lock = threading.Lock()
+        # Last journaled (status, ticket_id) per report
+        self._state_by_id: Dict[UUID, Tuple[ReportStatus, Optional[UUID]]] = {}
+    
+    def recover(self) -> int:
+        """Rebuild reports from the latest snapshot plus later events; returns events replayed"""
+        after_seq = 0
+        snapshot = self._journal.latest_snapshot()
+        if snapshot is not None:
+            after_seq, state = snapshot
+            for record in state["reports"]:
+                self._restore(report_from_record(record))
+        
+        replayed = 0
+        for event in self._journal.read(after_seq):
+            if event.event_type == REPORT_SUBMITTED:
+                self._restore(report_from_record(event.data))
+            elif event.event_type == REPORT_STATUS_CHANGED:
+                self._apply_status_change(event.data)
+            else:
+                continue
+            replayed += 1
+        return replayed
+    
+    def snapshot(self) -> int:
+        """Snapshot every report and compact the journal"""
+        reports = [report_to_record(report) for report in self._inner.find_all()]
+        return self._journal.write_snapshot({"reports": reports})
+    
+    # ------------------------------------------------------------------
+    # IReportRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, report: MalfunctionReport) -> None:
+        """Journal the change, then save or update the report"""
+        with self._write_lock:
+            self._record(report, sync=True)
+            self._inner.save(report)
+            self._maybe_snapshot()
+    
+    def save_all(self, reports: Iterable[MalfunctionReport]) -> int:
+        """Journal every change with a single fsync, then bulk save"""
+        reports = list(reports)
+        with self._write_lock:
+            for report in reports:
+                self._record(report, sync=False)
+            self._journal.flush()
+            count = self._inner.save_all(reports)
+            self._maybe_snapshot()
+        return count
+    
+    def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Find a report by its ID"""
+        return self._inner.find_by_id(report_id)
+    
+    def find_by_ticket_id(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        return self._inner.find_by_ticket_id(ticket_id)
+    
+    def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        """Find all reports for a specific station"""
+        return self._inner.find_by_station(station_id)
+    
+    def find_by_status(self, status: ReportStatus) -> List[MalfunctionReport]:
+        """Find the reports currently in one lifecycle state"""
+        return self._inner.find_by_status(status)
+    
+    def find_open(self) -> List[MalfunctionReport]:
+        """Find the reports whose ticket still awaits an operator"""
+        return self._inner.find_open()
+    
+    def find_all(self) -> List[MalfunctionReport]:
+        """Get all reports"""
+        return self._inner.find_all()
+    
+    def count(self) -> int:
+        """Get the total number of reports"""
+        return self._inner.count()
+    
+    def count_by_status(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        return self._inner.count_by_status()
+    
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+    
+    def _record(self, report: MalfunctionReport, sync: bool) -> None:
+        current = (report.status, report.ticket_id)
+        previous = self._state_by_id.get(report.report_id)
+        
+        if previous is None:
+            self._journal.append(REPORT_SUBMITTED, report_to_record(report), sync=sync)
+        elif previous != current:
+            self._journal.append(REPORT_STATUS_CHANGED, {
+                "report_id": str(report.report_id),
+                "status": report.status.value,
+                "ticket_id": None if report.ticket_id is None else str(report.ticket_id),
+            }, sync=sync)
+        
+        self._state_by_id[report.report_id] = current
+    
+    def _maybe_snapshot(self) -> None:
+        if self._journal.events_since_snapshot >= self._snapshot_every:
+            self.snapshot()
+    
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+    
+    def _restore(self, report: MalfunctionReport) -> None:
+        self._state_by_id[report.report_id] = (report.status, report.ticket_id)
+        self._inner.save(report)
+    
+    def _apply_status_change(self, data: Dict[str, Any]) -> None:
+        report = self._inner.find_by_id(UUID(data["report_id"]))
+        if report is None:
+            return
+        
+        self._restore(MalfunctionReport.restore(
+            report_id=report.report_id,
+            station_id=report.station_id,
+            malfunction_type=report.malfunction_type,
+            description=report.description,
+            reported_by=report.reported_by,
+            status=ReportStatus(data["status"]),
+            ticket_id=None if data["ticket_id"] is None else UUID(data["ticket_id"]),
+            created_at=report.created_at
+        ))
@@ -0,0 +1,300 @@
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Iterable, Tuple, Union
+from uuid import UUID
+
+from ...domain.entities.malfunction_report import MalfunctionReport
+from ...domain.enums.malfunction_type import MalfunctionType
+from ...domain.enums.report_status import OPEN_STATUSES, ReportStatus
+from ...domain.value_objects.report_description import ReportDescription
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.sqlite_connections import SqliteConnections
+from ...domain.repositories.i_report_repository import IReportRepository
+
+
+DEFAULT_DATABASE_PATH = Path("contexts/shared_kernel/datasets/reports.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id               INTEGER PRIMARY KEY,
+    report_id        TEXT NOT NULL UNIQUE,
+    station_id       TEXT NOT NULL,
+    malfunction_type TEXT NOT NULL,
+    description      TEXT NOT NULL,
+    reported_by      TEXT,
+    status           TEXT NOT NULL,
+    ticket_id        TEXT,
+    created_at       TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_reports_station_id ON reports (station_id);
+CREATE INDEX IF NOT EXISTS idx_reports_ticket_id ON reports (ticket_id) WHERE ticket_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_reports_status ON reports (status);
+CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports (created_at);
+"""
+
+_COLUMNS = "report_id, station_id, malfunction_type, description, reported_by, status, ticket_id, created_at"
+
+_UPSERT = f"""
+INSERT INTO reports ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (report_id) DO UPDATE SET
+    station_id = excluded.station_id,
+    malfunction_type = excluded.malfunction_type,
+    description = excluded.description,
+    reported_by = excluded.reported_by,
+    status = excluded.status,
+    ticket_id = excluded.ticket_id,
+    created_at = excluded.created_at
+"""
+
+ReportRow = Tuple[str, str, str, str, Optional[str], str, Optional[str], str]
+
+_STOP = object()
+
+
+class _PendingWrite:
+    """One save (of one or many rows) waiting for the group commit that makes it durable"""
+    __slots__ = ("rows", "done", "error")
+    
+    def __init__(self, rows: List[ReportRow]):
+        self.rows = rows
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class SqliteReportRepository(IReportRepository):
+    """
+    SQLite implementation of malfunction report repository
+    
+    Reports persist across restarts in a WAL-mode database with indexes on
+    station id, ticket id, status and created_at.
+    
+    Writes use group commit: save() hands its row to a single writer thread
+    and blocks until the row is durable. While one transaction is being
+    fsynced, the saves arriving in the meantime queue up and are committed
+    together by the next one, so a burst of N reports costs a handful of
+    fsyncs instead of N. Every save still returns only after its commit.
+    """
+    
+    def __init__(
+        self,
+        database_path: Union[str, Path] = ":memory:",
+        max_batch_size: int = 256,
+        max_batch_delay: float = 0.0
+    ):
+        """
+        Args:
+            database_path: SQLite file, or ":memory:" for a throwaway database
+            max_batch_size: Most saves coalesced into one transaction
+            max_batch_delay: Seconds the writer lingers for more saves before
+                committing a batch (0 = only coalesce saves already queued)
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        # FULL: every commit fsyncs the WAL, so a returned save survives a crash
+        self._connections = SqliteConnections(database_path, _SCHEMA, synchronous="FULL")
+        
+        self._commit_count = 0
+        self._closed = False
+        # Makes "not closed, so enqueue" atomic against close() queueing _STOP
+        self._state_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._run_writer, name="report-group-commit", daemon=True)
+        self._writer.start()
+    
+    @property
+    def commit_count(self) -> int:
+        """Number of transactions committed so far (one fsync each)"""
+        return self._commit_count
+    
+    def close(self) -> None:
+        """Flush queued saves, stop the writer and close the database"""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        
+        self._writer.join()
+        self._connections.close()
+    
+    # ------------------------------------------------------------------
+    # IReportRepository
+    # ------------------------------------------------------------------
+    
+    def save(self, report: MalfunctionReport) -> None:
+        """Save or update a malfunction report, returning once it is committed"""
+        self._write([self._to_row(report)])
+    
+    def save_all(self, reports: Iterable[MalfunctionReport]) -> int:
+        """Save or update many reports atomically, in a single commit"""
+        rows = [self._to_row(report) for report in reports]
+        if rows:
+            self._write(rows)
+        return len(rows)
+    
+    def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        """Find a report by its ID"""
+        reports = self._query(f"SELECT {_COLUMNS} FROM reports WHERE report_id = ?", (str(report_id),))
+        return reports[0] if reports else None
+    
+    def find_by_ticket_id(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        """Find the report a ticket was created for"""
+        reports = self._query(f"SELECT {_COLUMNS} FROM reports WHERE ticket_id = ?", (str(ticket_id),))
+        return reports[0] if reports else None
+    
+    def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        """Find all reports for a specific station"""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM reports WHERE station_id = ? ORDER BY id",
+            (station_id.value,)
+        )
+    
+    def find_by_status(self, status: ReportStatus) -> List[MalfunctionReport]:
+        """Find the reports currently in one lifecycle state"""
+        return self._query(f"SELECT {_COLUMNS} FROM reports WHERE status = ? ORDER BY id", (status.value,))
+    
+    def find_open(self) -> List[MalfunctionReport]:
+        """Find the reports whose ticket still awaits an operator"""
+        statuses = sorted(status.value for status in OPEN_STATUSES)
+        placeholders = ", ".join("?" * len(statuses))
+        return self._query(
+            f"SELECT {_COLUMNS} FROM reports WHERE status IN ({placeholders}) ORDER BY id",
+            tuple(statuses)
+        )
+    
+    def find_all(self) -> List[MalfunctionReport]:
+        """Get all reports"""
+        return self._query(f"SELECT {_COLUMNS} FROM reports ORDER BY id")
+    
+    def count(self) -> int:
+        """Get the total number of reports"""
+        with self._connections.read() as connection:
+            return connection.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+    
+    def count_by_status(self) -> Dict[ReportStatus, int]:
+        """Get the number of reports in each lifecycle state"""
+        counts = {status: 0 for status in ReportStatus}
+        with self._connections.read() as connection:
+            rows = connection.execute("SELECT status, COUNT(*) FROM reports GROUP BY status").fetchall()
+        for value, count in rows:
+            counts[ReportStatus(value)] = count
+        return counts
+    
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+    
+    def _write(self, rows: List[ReportRow]) -> None:
+        """Queue rows for the writer thread and wait until they are committed"""
+        pending = _PendingWrite(rows)
+        with self._state_lock:
+            if self._closed or not self._writer.is_alive():
+                raise RuntimeError("Report repository is closed")
+            self._queue.put(pending)
+        pending.done.wait()
+        
+        if pending.error is not None:
+            raise pending.error
+    
+    def _run_writer(self) -> None:
+        try:
+            self._write_batches()
+        finally:
+            # Whatever is still queued will never be committed; release its waiters
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP:
+                    item.error = RuntimeError("Report repository is closed")
+                    item.done.set()
+    
+    def _write_batches(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            
+            batch = [first]
+            while len(batch) < self._max_batch_size:
+                try:
+                    if self._max_batch_delay > 0:
+                        item = self._queue.get(timeout=self._max_batch_delay)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._commit(batch)
+    
+    def _commit(self, batch: List[_PendingWrite]) -> None:
+        """Commit a batch in one transaction; on failure retry each save alone"""
+        # Any error, not just sqlite3.Error, goes to the waiting saves: the writer thread must survive it
+        try:
+            self._execute([row for pending in batch for row in pending.rows])
+        except Exception as error:
+            if len(batch) == 1:
+                batch[0].error = error
+            else:
+                # Isolate the failing save instead of failing the whole batch
+                for pending in batch:
+                    try:
+                        self._execute(pending.rows)
+                    except Exception as error:
+                        pending.error = error
+        finally:
+            for pending in batch:
+                pending.done.set()
+    
+    def _execute(self, rows: List[ReportRow]) -> None:
+        with self._connections.write() as connection:
+            connection.executemany(_UPSERT, rows)
+        self._commit_count += 1
+    
+    # ------------------------------------------------------------------
+    # Mapping
+    # ------------------------------------------------------------------
+    
+    def _query(self, sql: str, parameters: tuple = ()) -> List[MalfunctionReport]:
+        with self._connections.read() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+        return [self._to_report(row) for row in rows]
+    
+    @staticmethod
+    def _to_row(report: MalfunctionReport) -> ReportRow:
+        return (
+            str(report.report_id),
+            report.station_id.value,
+            report.malfunction_type.value,
+            report.description.value,
+            report.reported_by,
+            report.status.value,
+            None if report.ticket_id is None else str(report.ticket_id),
+            report.created_at.isoformat(),
+        )
+    
+    @staticmethod
+    def _to_report(row: ReportRow) -> MalfunctionReport:
+        report_id, station_id, malfunction_type, description, reported_by, status, ticket_id, created_at = row
+        return MalfunctionReport.restore(
+            report_id=UUID(report_id),
+            station_id=StationId(station_id),
+            malfunction_type=MalfunctionType(malfunction_type),
+            description=ReportDescription(description),
+            reported_by=reported_by,
+            status=ReportStatus(status),
+            ticket_id=None if ticket_id is None else UUID(ticket_id),
+            created_at=datetime.fromisoformat(created_at)
+        )
@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, List, Dict, Iterable
+from uuid import UUID
+
+from ...domain.entities.malfunction_report import MalfunctionReport
+from ...domain.enums.report_status import ReportStatus
+from contexts.shared_kernel.common.station_id import StationId
+from ...domain.repositories.i_report_repository import IReportRepository
+from ...domain.repositories.i_async_report_repository import IAsyncReportRepository
+
+
+class ThreadedAsyncReportRepository(IAsyncReportRepository):
+    """
+    Async view of a synchronous report repository
+    
+    Calls run on an executor thread; with the SQLite backend concurrent
+    saves from many coroutines still end up sharing group commits.
+    """
+    
+    def __init__(self, inner: IReportRepository, executor: Optional[Executor] = None):
+        self._inner = inner
+        self._executor = executor
+    
+    async def save(self, report: MalfunctionReport) -> None:
+        await self._run(self._inner.save, report)
+    
+    async def save_all(self, reports: Iterable[MalfunctionReport]) -> int:
+        return await self._run(self._inner.save_all, reports)
+    
+    async def find_by_id(self, report_id: UUID) -> Optional[MalfunctionReport]:
+        return await self._run(self._inner.find_by_id, report_id)
+    
+    async def find_by_ticket_id(self, ticket_id: UUID) -> Optional[MalfunctionReport]:
+        return await self._run(self._inner.find_by_ticket_id, ticket_id)
+    
+    async def find_by_station(self, station_id: StationId) -> List[MalfunctionReport]:
+        return await self._run(self._inner.find_by_station, station_id)
+    
+    async def find_by_status(self, status: ReportStatus) -> List[MalfunctionReport]:
+        return await self._run(self._inner.find_by_status, status)
+    
+    async def find_open(self) -> List[MalfunctionReport]:
+        return await self._run(self._inner.find_open)
+    
+    async def find_all(self) -> List[MalfunctionReport]:
+        return await self._run(self._inner.find_all)
+    
+    async def count(self) -> int:
+        return await self._run(self._inner.count)
+    
+    async def count_by_status(self) -> Dict[ReportStatus, int]:
+        return await self._run(self._inner.count_by_status)
+    
+    async def _run(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(method, *args))
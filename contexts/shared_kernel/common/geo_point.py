@@ -0,0 +1,47 @@
+"""GeoPoint Value Object for WGS84 coordinates"""
+import math
+from dataclasses import dataclass
+
+EARTH_RADIUS_METERS = 6_371_008.8
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    """
+    Value Object representing a WGS84 coordinate.
+    
+    Business Rules:
+    - Latitude must be between -90 and 90
+    - Longitude must be between -180 and 180
+    """
+    latitude: float
+    longitude: float
+    
+    def __post_init__(self):
+        """Validate coordinates on creation"""
+        if self.latitude is None or self.longitude is None:
+            raise ValueError("Coordinates cannot be empty")
+        
+        if math.isnan(self.latitude) or math.isnan(self.longitude):
+            raise ValueError("Coordinates must be numbers")
+        
+        if not -90 <= self.latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        
+        if not -180 <= self.longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+    
+    def distance_to(self, other: "GeoPoint") -> float:
+        """Great-circle distance in meters"""
+        return haversine_meters(self.latitude, self.longitude, other.latitude, other.longitude)
+
+
+def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two WGS84 coordinates"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(min(1.0, math.sqrt(a)))
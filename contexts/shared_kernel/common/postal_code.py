@@ -1,18 +1,21 @@
-"""PostalCode Value Object for Berlin postal codes"""
-from dataclasses import dataclass
+"""PostalCode Value Object for German postal codes"""
+from dataclasses import dataclass, field
+
+from .region import BERLIN, Region
 
 
 @dataclass(frozen=True)
 class PostalCode:
     """
-    Value Object representing a Berlin postal code.
+    Value Object representing a postal code inside a region (Berlin by default).
     
     Business Rules:
     - Must be numeric only
     - Must be exactly 5 digits
-    - Must start with '1' (Berlin postal codes: 10xxx-14xxx)
+    - Must fall inside the region's postal ranges (Berlin: 10115-14199)
     """
     value: str
+    region: Region = field(default=BERLIN, compare=False, repr=False)
     
     def __post_init__(self):
         """Validate postal code on creation"""
@@ -25,8 +28,10 @@ class PostalCode:
         if len(self.value) != 5:
             raise ValueError("Postal code must be exactly 5 digits")
         
-        if not self.value.startswith('1'):
-            raise ValueError("Must be a Berlin postal code (starts with 1)")
+        if not self.region.contains_postal_code(self.value):
+            raise ValueError(
+                f"Must be a {self.region.name} postal code ({self.region.describe_postal_ranges()})"
+            )
     
     def __str__(self) -> str:
-        return self.value
\ No newline at end of file
+        return self.value
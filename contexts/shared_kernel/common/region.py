@@ -0,0 +1,174 @@
+"""Region Value Object - a city or Bundesland the network can be partitioned by"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .geo_point import haversine_meters
+
+
+# min_lat, min_lon, max_lat, max_lon
+Bounds = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class Region:
+    """
+    Value Object describing one partition of the charging network.
+    
+    - city_names / state_names are matched as substrings against the
+      register's 'Ort' / 'Bundesland' columns (no names = matches everything)
+    - postal_ranges are inclusive numeric ranges of valid postal codes
+    - id_prefix starts every station ID loaded for this region
+    - bounds is an approximate bounding box, used to decide which partitions
+      a spatial query has to touch (None = consult it for every query)
+    """
+    key: str
+    name: str
+    city_names: Tuple[str, ...]
+    state_names: Tuple[str, ...]
+    postal_ranges: Tuple[Tuple[int, int], ...]
+    id_prefix: str
+    bounds: Optional[Bounds] = None
+    
+    def __post_init__(self):
+        if not self.key or not self.key.strip():
+            raise ValueError("Region key cannot be empty")
+        
+        if not self.postal_ranges:
+            raise ValueError("Region needs at least one postal code range")
+        
+        for low, high in self.postal_ranges:
+            if not 0 <= low <= high <= 99999:
+                raise ValueError(f"Invalid postal code range {low}-{high}")
+    
+    def contains_postal_code(self, postal_code: str) -> bool:
+        """Whether a 5-digit postal code lies in one of the region's ranges"""
+        if len(postal_code) != 5 or not postal_code.isdigit():
+            return False
+        
+        number = int(postal_code)
+        return any(low <= number <= high for low, high in self.postal_ranges)
+    
+    def overlaps(self, other: "Region") -> bool:
+        """Whether any postal code lies in both regions"""
+        return any(
+            low <= other_high and other_low <= high
+            for low, high in self.postal_ranges
+            for other_low, other_high in other.postal_ranges
+        )
+    
+    def matches(self, ort: str, bundesland: str) -> bool:
+        """Whether a register row's city/state columns belong to this region"""
+        if not self.city_names and not self.state_names:
+            return True
+        
+        return (
+            any(name in ort for name in self.city_names)
+            or any(name in bundesland for name in self.state_names)
+        )
+    
+    def intersects(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> bool:
+        """Whether the region's bounds overlap a box (always True without bounds)"""
+        if self.bounds is None:
+            return True
+        
+        south, west, north, east = self.bounds
+        return min_lat <= north and max_lat >= south and min_lon <= east and max_lon >= west
+    
+    def distance_to(self, latitude: float, longitude: float) -> float:
+        """Approximate distance in meters from a point to the region's bounds (0 inside)"""
+        if self.bounds is None:
+            return 0.0
+        
+        south, west, north, east = self.bounds
+        nearest_lat = min(max(latitude, south), north)
+        nearest_lon = min(max(longitude, west), east)
+        if nearest_lat == latitude and nearest_lon == longitude:
+            return 0.0
+        return haversine_meters(latitude, longitude, nearest_lat, nearest_lon)
+    
+    @property
+    def search_term(self) -> Optional[str]:
+        """Single literal every matching row contains, usable as a byte-level prefilter"""
+        names = set(self.city_names) | set(self.state_names)
+        return names.pop() if len(names) == 1 else None
+    
+    def describe_postal_ranges(self) -> str:
+        return ", ".join(
+            f"{low:05d}" if low == high else f"{low:05d}-{high:05d}"
+            for low, high in self.postal_ranges
+        )
+
+
+BERLIN = Region(
+    key="berlin",
+    name="Berlin",
+    city_names=("Berlin",),
+    state_names=("Berlin",),
+    postal_ranges=((10115, 14199),),
+    id_prefix="BERLIN",
+    bounds=(52.3383, 13.0884, 52.6755, 13.7612)
+)
+
+HAMBURG = Region(
+    key="hamburg",
+    name="Hamburg",
+    city_names=("Hamburg",),
+    state_names=("Hamburg",),
+    postal_ranges=((20095, 21149), (22041, 22769), (27499, 27499)),
+    id_prefix="HAMBURG",
+    bounds=(53.3951, 8.4199, 53.9644, 10.3253)
+)
+
+BREMEN = Region(
+    key="bremen",
+    name="Bremen",
+    city_names=("Bremen",),
+    state_names=("Bremen",),
+    postal_ranges=((27568, 27580), (28195, 28779)),
+    id_prefix="BREMEN",
+    bounds=(53.0110, 8.4816, 53.6061, 8.9906)
+)
+
+MUENCHEN = Region(
+    key="muenchen",
+    name="München",
+    city_names=("München",),
+    state_names=(),
+    postal_ranges=((80331, 81929),),
+    id_prefix="MUENCHEN",
+    bounds=(48.0616, 11.3608, 48.2482, 11.7229)
+)
+
+# Bundesland postal ranges and all bounds are approximate at the borders
+BAYERN = Region(
+    key="bayern",
+    name="Bayern",
+    city_names=(),
+    state_names=("Bayern",),
+    postal_ranges=((63739, 63939), (80331, 87789), (88131, 88179), (89231, 89449), (90402, 97909)),
+    id_prefix="BY",
+    bounds=(47.2701, 8.9763, 50.5647, 13.8396)
+)
+
+GERMANY = Region(
+    key="germany",
+    name="Germany",
+    city_names=(),
+    state_names=(),
+    postal_ranges=((1001, 99998),),
+    id_prefix="DE",
+    bounds=(47.2701, 5.8663, 55.0584, 15.0419)
+)
+
+REGIONS: Dict[str, Region] = {
+    region.key: region
+    for region in (BERLIN, HAMBURG, BREMEN, MUENCHEN, BAYERN, GERMANY)
+}
+
+
+def get_region(key: str) -> Region:
+    """Look up a predefined region by key"""
+    region = REGIONS.get(key.lower())
+    if region is None:
+        raise ValueError(f"Unknown region '{key}'")
+    return region
@@ -0,0 +1,279 @@
+"""Append-only, checksummed event journal with snapshots and compaction"""
+import json
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# payload length, crc32 of (seq + payload), sequence number
+_RECORD = struct.Struct("<IIQ")
+# magic, sequence number covered, crc32 of the body
+_SNAPSHOT_HEADER = struct.Struct("<8sQI")
+_SNAPSHOT_MAGIC = b"EVJSNP01"
+
+_SEGMENT_PATTERN = "segment-{:012d}.log"
+_SNAPSHOT_PATTERN = "snapshot-{:012d}.snap"
+
+
+class JournalEvent(NamedTuple):
+    seq: int
+    event_type: str
+    data: Dict[str, Any]
+
+
+class JournalCorruptionError(Exception):
+    """A record before the tail of the journal failed its checksum"""
+
+
+def _encode(event_type: str, data: Dict[str, Any]) -> bytes:
+    return json.dumps([event_type, data], separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _checksum(seq: int, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(struct.pack("<Q", seq)))
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Make a rename or unlink in `directory` durable (no-op where unsupported)"""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+class EventJournal:
+    """
+    Write-ahead journal of state-change events, stored in one directory.
+    
+    Events are appended to segment files as length-prefixed, CRC32-checked
+    records with consecutive sequence numbers. A snapshot captures the full
+    state as of one sequence number and starts a new segment; compaction
+    then deletes every segment and snapshot the latest snapshot supersedes.
+    Recovery is "latest snapshot + events after it", so its cost is bounded
+    by the snapshot interval rather than by how long the service has run.
+    
+    A torn record at the end of the last segment (a crash mid-append) is
+    cut off when the journal is opened; a bad record anywhere else raises
+    JournalCorruptionError rather than silently skipping events.
+    
+    Appends, snapshots and compaction are serialized, so one journal can be
+    shared by threads.
+    """
+    
+    def __init__(self, directory: Union[str, Path], sync: bool = True):
+        """
+        Args:
+            directory: Where segments and snapshots live (created if missing)
+            sync: fsync after every append; False leaves flushing to the OS
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._sync = sync
+        self._segment_file = None
+        self._lock = threading.RLock()
+        
+        self._snapshot_seq = self._latest_snapshot_seq()
+        self._last_seq = self._recover_tail()
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event (0 for an empty journal)"""
+        return self._last_seq
+    
+    @property
+    def events_since_snapshot(self) -> int:
+        return self._last_seq - self._snapshot_seq
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+    
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+    
+    def append(self, event_type: str, data: Dict[str, Any], sync: Optional[bool] = None) -> int:
+        """Durably append one event and return its sequence number"""
+        payload = _encode(event_type, data)
+        with self._lock:
+            seq = self._last_seq + 1
+            file = self._current_segment(seq)
+            file.write(_RECORD.pack(len(payload), _checksum(seq, payload), seq))
+            file.write(payload)
+            file.flush()
+            if self._sync if sync is None else sync:
+                os.fsync(file.fileno())
+            
+            self._last_seq = seq
+            return seq
+    
+    def flush(self) -> None:
+        """fsync everything appended so far (pairs with append(..., sync=False))"""
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.flush()
+                os.fsync(self._segment_file.fileno())
+    
+    def read(self, after_seq: int = 0) -> Iterator[JournalEvent]:
+        """Yield the events with a sequence number above after_seq, in order"""
+        segments = self._segments()
+        for index, (first_seq, path) in enumerate(segments):
+            next_first = segments[index + 1][0] if index + 1 < len(segments) else None
+            if next_first is not None and next_first - 1 <= after_seq:
+                continue
+            
+            events, _ = self._read_segment(path)
+            for event in events:
+                if event.seq > after_seq:
+                    yield event
+    
+    # ------------------------------------------------------------------
+    # Snapshots and compaction
+    # ------------------------------------------------------------------
+    
+    def write_snapshot(self, state: Dict[str, Any]) -> int:
+        """
+        Atomically store `state` as of the newest event, start a new segment
+        and compact. Returns the sequence number the snapshot covers.
+        """
+        body = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            seq = self._last_seq
+            path = self._directory / _SNAPSHOT_PATTERN.format(seq)
+            tmp_path = path.with_suffix(".tmp")
+            
+            with open(tmp_path, "wb") as file:
+                file.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, seq, zlib.crc32(body)))
+                file.write(body)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, path)
+            _fsync_directory(self._directory)
+            
+            self._snapshot_seq = seq
+            # The next append opens a fresh segment, so every older one becomes removable
+            self.close()
+            self.compact()
+            return seq
+    
+    def latest_snapshot(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """(seq, state) of the newest readable snapshot, or None"""
+        for seq, path in reversed(self._snapshots()):
+            state = self._read_snapshot(path, seq)
+            if state is not None:
+                return seq, state
+        return None
+    
+    def compact(self) -> int:
+        """Delete segments and snapshots superseded by the latest snapshot; returns files removed"""
+        with self._lock:
+            return self._compact()
+    
+    def _compact(self) -> int:
+        snapshots = self._snapshots()
+        if not snapshots:
+            return 0
+        
+        latest_seq = snapshots[-1][0]
+        removed = [path for _, path in snapshots[:-1]]
+        
+        segments = self._segments()
+        for index, (first_seq, path) in enumerate(segments):
+            is_current = self._segment_file is not None and index == len(segments) - 1
+            next_first = segments[index + 1][0] if index + 1 < len(segments) else self._last_seq + 1
+            if not is_current and next_first - 1 <= latest_seq:
+                removed.append(path)
+        
+        for path in removed:
+            path.unlink()
+        if removed:
+            _fsync_directory(self._directory)
+        return len(removed)
+    
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+    
+    def _segments(self) -> List[Tuple[int, Path]]:
+        return sorted(
+            (int(path.stem.split("-")[1]), path)
+            for path in self._directory.glob("segment-*.log")
+        )
+    
+    def _snapshots(self) -> List[Tuple[int, Path]]:
+        return sorted(
+            (int(path.stem.split("-")[1]), path)
+            for path in self._directory.glob("snapshot-*.snap")
+        )
+    
+    def _latest_snapshot_seq(self) -> int:
+        latest = self.latest_snapshot()
+        return latest[0] if latest else 0
+    
+    def _current_segment(self, seq: int):
+        if self._segment_file is None:
+            path = self._directory / _SEGMENT_PATTERN.format(seq)
+            self._segment_file = open(path, "ab")
+            _fsync_directory(self._directory)
+        return self._segment_file
+    
+    def _recover_tail(self) -> int:
+        """Validate the segments, cut off a torn tail, and return the last sequence number"""
+        last_seq = self._snapshot_seq
+        segments = self._segments()
+        for index, (_, path) in enumerate(segments):
+            events, good_length = self._read_segment(path)
+            if good_length < path.stat().st_size:
+                if index != len(segments) - 1:
+                    raise JournalCorruptionError(f"Corrupt record in {path.name}")
+                with open(path, "r+b") as file:
+                    file.truncate(good_length)
+                    os.fsync(file.fileno())
+            if events:
+                last_seq = max(last_seq, events[-1].seq)
+        return last_seq
+    
+    @staticmethod
+    def _read_segment(path: Path) -> Tuple[List[JournalEvent], int]:
+        """All intact events in a segment, plus the byte length they span"""
+        data = path.read_bytes()
+        events: List[JournalEvent] = []
+        offset = 0
+        
+        while offset + _RECORD.size <= len(data):
+            length, checksum, seq = _RECORD.unpack_from(data, offset)
+            payload = data[offset + _RECORD.size:offset + _RECORD.size + length]
+            if len(payload) != length or _checksum(seq, payload) != checksum:
+                break
+            
+            event_type, event_data = json.loads(payload.decode("utf-8"))
+            events.append(JournalEvent(seq, event_type, event_data))
+            offset += _RECORD.size + length
+        
+        return events, offset
+    
+    @staticmethod
+    def _read_snapshot(path: Path, seq: int) -> Optional[Dict[str, Any]]:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < _SNAPSHOT_HEADER.size:
+            return None
+        
+        magic, stored_seq, checksum = _SNAPSHOT_HEADER.unpack_from(data)
+        body = data[_SNAPSHOT_HEADER.size:]
+        if magic != _SNAPSHOT_MAGIC or stored_seq != seq or zlib.crc32(body) != checksum:
+            return None
+        return json.loads(body.decode("utf-8"))
@@ -0,0 +1,71 @@
+"""Background event loop for calling async code from synchronous callers"""
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """
+    Runs one asyncio event loop on a daemon thread.
+    
+    Synchronous callers (Streamlit reruns, scripts) hand it coroutines and
+    block for the result, while the async backends keep a single long-lived
+    loop - asyncio locks, connection pools and executors stay bound to it
+    rather than to a fresh asyncio.run() per call.
+    """
+    
+    def __init__(self, name: str = "event-loop"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+    
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and wait for its result (exceptions propagate)"""
+        if not self._loop.is_running():
+            raise RuntimeError("Event loop thread is closed")
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot block on the event loop from its own thread")
+        
+        return asyncio.run_coroutine_threadsafe(awaitable, self._loop).result(timeout)
+    
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class SyncAdapter:
+    """
+    Synchronous facade over an async object (use case, service, repository).
+    
+    Coroutine methods become blocking methods that run on the given
+    EventLoopThread; everything else is passed through untouched, so
+    `SyncAdapter(AsyncCreateMalfunctionReportUseCase(...), loop).execute(request)`
+    drops into code written against the sync use case.
+    """
+    
+    def __init__(self, target: Any, loop_thread: EventLoopThread):
+        self._target = target
+        self._loop_thread = loop_thread
+    
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+        
+        @functools.wraps(attribute)
+        def blocking(*args, **kwargs):
+            return self._loop_thread.run(attribute(*args, **kwargs))
+        
+        return blocking
@@ -0,0 +1,135 @@
+"""Connection handling shared by the SQLite repositories"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Union
+
+
+class SqliteConnections:
+    """
+    One write connection, serialized by a lock, plus a bounded pool of read
+    connections. In WAL mode those readers run alongside each other and
+    alongside the writer, each seeing the last committed state.
+    
+    A reader is checked out for the duration of one read() block and then
+    handed back, so the number of open connections is capped by
+    `max_readers` however many threads come and go (Streamlit reruns and
+    HTTP connections each run on a fresh thread). When every reader is
+    busy, read() waits for one to be returned.
+    
+    A ':memory:' database only exists inside its own connection, so there
+    reads share the write connection and its lock instead.
+    """
+    
+    def __init__(
+        self,
+        database_path: Union[str, Path],
+        schema: str,
+        synchronous: str = "NORMAL",
+        max_readers: int = 8
+    ):
+        if max_readers <= 0:
+            raise ValueError("Reader pool size must be positive")
+        
+        self.database_path = str(database_path)
+        self.in_memory = self.database_path == ":memory:"
+        
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.execute(f"PRAGMA synchronous={synchronous}")
+        self._writer.executescript(schema)
+        self._writer.commit()
+        
+        self._max_readers = max_readers
+        # Idle readers, most recently returned last; _open_readers also counts checked-out ones
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._open_readers = 0
+        self._readers_available = threading.Condition()
+        self._closed = False
+    
+    @property
+    def open_readers(self) -> int:
+        """Read connections currently open, idle or checked out"""
+        with self._readers_available:
+            return self._open_readers
+    
+    @contextmanager
+    def write(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        The write connection inside one transaction (commit on success, rollback on error)
+        
+        immediate=True takes the database write lock up front (BEGIN IMMEDIATE),
+        so reads inside the transaction see the latest commit of every process
+        and nobody else can write until it ends - for read-check-write sequences.
+        """
+        with self._write_lock, self._writer:
+            if immediate:
+                self._writer.execute("BEGIN IMMEDIATE")
+            yield self._writer
+    
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """A pooled connection for queries, held by the caller until the block ends"""
+        if self.in_memory:
+            with self._write_lock:
+                yield self._writer
+            return
+        
+        connection = self._checkout()
+        try:
+            yield connection
+        finally:
+            self._checkin(connection)
+    
+    def close(self) -> None:
+        with self._readers_available:
+            self._closed = True
+            for connection in self._idle_readers:
+                connection.close()
+            self._open_readers -= len(self._idle_readers)
+            self._idle_readers.clear()
+            # Waiting readers wake up to find the pool closed; busy ones close on return
+            self._readers_available.notify_all()
+        with self._write_lock:
+            self._writer.close()
+    
+    def _checkout(self) -> sqlite3.Connection:
+        with self._readers_available:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+                if self._idle_readers:
+                    return self._idle_readers.pop()
+                if self._open_readers < self._max_readers:
+                    self._open_readers += 1
+                    break
+                self._readers_available.wait()
+        
+        # Connect outside the lock; the slot is already reserved
+        try:
+            return self._connect()
+        except BaseException:
+            with self._readers_available:
+                self._open_readers -= 1
+                self._readers_available.notify()
+            raise
+    
+    def _checkin(self, connection: sqlite3.Connection) -> None:
+        # A reader must not go back to the pool holding a snapshot open
+        if connection.in_transaction:
+            connection.rollback()
+        
+        with self._readers_available:
+            if self._closed:
+                connection.close()
+                self._open_readers -= 1
+                return
+            self._idle_readers.append(connection)
+            self._readers_available.notify()
+    
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread=False: a pooled reader serves whichever thread checks it out
+        connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
@@ -0,0 +1,69 @@
+"""Fixed pool of locks addressed by key"""
+import asyncio
+import threading
+import zlib
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterable, Iterator
+
+
+class StripedLock:
+    """
+    Maps keys (station ids) onto a fixed set of locks.
+    
+    Work on the same key is serialized; work on different keys only
+    contends when two keys happen to share a stripe, so with enough
+    stripes unrelated stations proceed in parallel while memory stays
+    constant however many stations exist.
+    """
+    
+    def __init__(self, stripes: int = 64):
+        if stripes <= 0:
+            raise ValueError("Number of stripes must be positive")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+    
+    def stripe_of(self, key: str) -> int:
+        # crc32 rather than hash(): stable across processes and runs
+        return zlib.crc32(key.encode("utf-8")) % len(self._locks)
+    
+    def lock_for(self, key: str) -> threading.Lock:
+        return self._locks[self.stripe_of(key)]
+    
+    @contextmanager
+    def locks_for(self, keys: Iterable[str]) -> Iterator[None]:
+        """
+        Hold the locks of every key at once. Stripes are always taken in
+        ascending order, so overlapping multi-key holders cannot deadlock.
+        """
+        stripes = sorted({self.stripe_of(key) for key in keys})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._locks[stripe])
+            yield
+
+
+class AsyncStripedLock:
+    """
+    StripedLock for coroutines: the same key-to-stripe mapping over
+    asyncio locks, so waiting on a busy station yields to the event loop
+    instead of blocking it. Use from a single event loop.
+    """
+    
+    def __init__(self, stripes: int = 64):
+        if stripes <= 0:
+            raise ValueError("Number of stripes must be positive")
+        self._locks = [asyncio.Lock() for _ in range(stripes)]
+    
+    def stripe_of(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._locks)
+    
+    def lock_for(self, key: str) -> asyncio.Lock:
+        return self._locks[self.stripe_of(key)]
+    
+    @asynccontextmanager
+    async def locks_for(self, keys: Iterable[str]) -> AsyncIterator[None]:
+        """Hold the locks of every key at once, taken in ascending stripe order"""
+        stripes = sorted({self.stripe_of(key) for key in keys})
+        async with AsyncExitStack() as stack:
+            for stripe in stripes:
+                await stack.enter_async_context(self._locks[stripe])
+            yield
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Bounded LRU cache whose entries are only valid for one data version"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class VersionedLruCache(Generic[K, V]):
+    """
+    Maps a key to a value built from data at a given version.
+    
+    A lookup names the version the caller currently sees; an entry built
+    for any other version is a miss and gets replaced, so each key is
+    invalidated on its own as soon as its data changes, without touching
+    the others. At most `max_entries` keys are kept, least recently used
+    first out. Safe to share between threads; builds run outside the lock.
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+        
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[K, Tuple[int, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    @property
+    def hits(self) -> int:
+        return self._hits
+    
+    @property
+    def misses(self) -> int:
+        return self._misses
+    
+    def get(self, key: K, version: int) -> Optional[V]:
+        """The value cached for key at exactly this version, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+    
+    def put(self, key: K, version: int, value: V) -> None:
+        with self._lock:
+            current = self._entries.get(key)
+            # A slow build must not overwrite what a build for a newer version stored
+            if current is not None and current[0] > version:
+                return
+            
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_or_build(self, key: K, version: int, build: Callable[[], V]) -> V:
+        """Cached value for key at this version, building and storing it on a miss"""
+        value = self.get(key, version)
+        if value is None:
+            value = build()
+            self.put(key, version, value)
+        return value
+    
+    def invalidate(self, key: K) -> bool:
+        """Drop one key; returns whether it was cached"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,321 @@
+"""
+Headless JSON API over the discovery and reporting use cases
+
+Serves the same use cases as the Streamlit UI, wired by the same
+build_system(), without a script rerun per interaction. Connections are
+kept alive (HTTP/1.1) and every connection is served on its own thread,
+so one slow client never holds up the others.
+
+Run from the project root:
+    python -m presentation.api [--host 127.0.0.1] [--port 8080]
+
+Endpoints:
+    GET  /health
+    GET  /stations?postal_code=10115
+    GET  /stations/nearest?lat=52.52&lon=13.40[&k=5][&status=available]
+    GET  /stations/<station_id>
+    POST /reports                      {"station_id", "malfunction_type", "description", "reported_by"?}
+    POST /reports/batch                {"items": [<report>, ...]}
+    POST /tickets/<ticket_id>/resolve  {"operator_notes"?}
+"""
+import argparse
+import json
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from contexts.discovery.application.use_cases.search_stations_use_case import SearchStationsUseCase
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.reporting.application.dtos.create_report_batch_dto import CreateReportBatchRequest
+from contexts.reporting.application.dtos.create_report_dto import CreateReportRequest
+from contexts.reporting.application.dtos.resolve_report_dto import ResolveReportRequest
+from contexts.reporting.application.use_cases.create_malfunction_report_batch_use_case import CreateMalfunctionReportBatchUseCase
+from contexts.reporting.application.use_cases.create_malfunction_report_use_case import CreateMalfunctionReportUseCase
+from contexts.reporting.application.use_cases.resolve_malfunction_use_case import ResolveMalfunctionUseCase
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from presentation.bootstrap import build_system
+
+
+MAX_BODY_BYTES = 1 << 20
+
+Response = Tuple[int, Dict[str, Any]]
+
+
+class ApiError(Exception):
+    """A request the API rejects, with the HTTP status to answer it with"""
+    
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def station_to_json(station: OperationalStation) -> Dict[str, Any]:
+    return {
+        "station_id": station.station_id.value,
+        "name": station.name,
+        "postal_code": station.postal_code,
+        "address": station.address,
+        "latitude": station.latitude,
+        "longitude": station.longitude,
+        "status": station.status.value,
+    }
+
+
+class JsonApi:
+    """
+    Routes decoded requests to the use cases and shapes their results as JSON.
+    
+    Knows nothing about sockets, so it can be exercised directly; the use
+    cases are stateless and the repositories behind them are thread-safe,
+    so one instance serves every connection.
+    """
+    
+    def __init__(
+        self,
+        search_use_case: SearchStationsUseCase,
+        create_use_case: CreateMalfunctionReportUseCase,
+        resolve_use_case: ResolveMalfunctionUseCase,
+        batch_use_case: Optional[CreateMalfunctionReportBatchUseCase] = None
+    ):
+        self._search = search_use_case
+        self._create = create_use_case
+        self._resolve = resolve_use_case
+        self._batch = batch_use_case
+    
+    def handle(self, method: str, target: str, body: bytes = b"") -> Response:
+        """Answer one request; never raises"""
+        try:
+            return self._route(method, target, body)
+        except ApiError as error:
+            return error.status, {"error": str(error)}
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        except Exception as error:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Unexpected error: {error}"}
+    
+    def _route(self, method: str, target: str, body: bytes) -> Response:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        
+        if parts == ["health"]:
+            self._require(method, "GET")
+            return HTTPStatus.OK, {"status": "ok"}
+        
+        if parts == ["stations"]:
+            self._require(method, "GET")
+            return self._stations_by_postal_code(query)
+        
+        if parts == ["stations", "nearest"]:
+            self._require(method, "GET")
+            return self._nearest_stations(query)
+        
+        if len(parts) == 2 and parts[0] == "stations":
+            self._require(method, "GET")
+            return self._station(parts[1])
+        
+        if parts == ["reports"]:
+            self._require(method, "POST")
+            return self._create_report(self._json(body))
+        
+        if parts == ["reports", "batch"] and self._batch is not None:
+            self._require(method, "POST")
+            return self._create_report_batch(self._json(body))
+        
+        if len(parts) == 3 and parts[0] == "tickets" and parts[2] == "resolve":
+            self._require(method, "POST")
+            return self._resolve_ticket(parts[1], self._json(body))
+        
+        raise ApiError(HTTPStatus.NOT_FOUND, f"No route for {url.path}")
+    
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+    
+    def _stations_by_postal_code(self, query: Dict[str, str]) -> Response:
+        postal_code = query.get("postal_code")
+        if not postal_code:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Query parameter 'postal_code' is required")
+        
+        stations = self._search.execute_by_postal_code(postal_code)
+        return HTTPStatus.OK, {"stations": [station_to_json(station) for station in stations]}
+    
+    def _nearest_stations(self, query: Dict[str, str]) -> Response:
+        try:
+            latitude = float(query["lat"])
+            longitude = float(query["lon"])
+            k = int(query.get("k", 5))
+        except KeyError as missing:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Query parameter {missing} is required")
+        
+        status = StationStatus(query["status"]) if "status" in query else None
+        stations = self._search.execute_nearest(latitude, longitude, k, status=status)
+        return HTTPStatus.OK, {"stations": [station_to_json(station) for station in stations]}
+    
+    def _station(self, station_id: str) -> Response:
+        try:
+            station = self._search.execute_by_id(station_id)
+        except ValueError as error:
+            if str(error).endswith("not found"):
+                raise ApiError(HTTPStatus.NOT_FOUND, str(error))
+            raise
+        return HTTPStatus.OK, station_to_json(station)
+    
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    
+    def _create_report(self, payload: Dict[str, Any]) -> Response:
+        response = self._create.execute(self._report_request(payload))
+        status = HTTPStatus.CREATED if response.success else HTTPStatus.UNPROCESSABLE_ENTITY
+        return status, asdict(response)
+    
+    def _create_report_batch(self, payload: Dict[str, Any]) -> Response:
+        items = payload.get("items")
+        if not isinstance(items, list):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Field 'items' must be a list")
+        
+        request = CreateReportBatchRequest(items=tuple(self._report_request(item) for item in items))
+        response = self._batch.execute(request)
+        return HTTPStatus.OK, {
+            "items": [asdict(item) for item in response.items],
+            "succeeded": response.succeeded,
+            "coalesced": response.coalesced,
+            "failed": response.failed,
+        }
+    
+    def _resolve_ticket(self, ticket_id: str, payload: Dict[str, Any]) -> Response:
+        request = ResolveReportRequest(ticket_id=ticket_id, operator_notes=payload.get("operator_notes"))
+        response = self._resolve.execute(request)
+        status = HTTPStatus.OK if response.success else HTTPStatus.UNPROCESSABLE_ENTITY
+        return status, asdict(response)
+    
+    def _report_request(self, payload: Any) -> CreateReportRequest:
+        if not isinstance(payload, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Report must be a JSON object")
+        
+        try:
+            malfunction_type = MalfunctionType(payload.get("malfunction_type"))
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Unknown malfunction type {payload.get('malfunction_type')!r}")
+        
+        return CreateReportRequest(
+            station_id=str(payload.get("station_id") or ""),
+            malfunction_type=malfunction_type,
+            description=str(payload.get("description") or ""),
+            reported_by=payload.get("reported_by")
+        )
+    
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _require(method: str, expected: str) -> None:
+        if method != expected:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {expected}")
+    
+    @staticmethod
+    def _json(body: bytes) -> Dict[str, Any]:
+        if not body:
+            return {}
+        try:
+            payload = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON")
+        if not isinstance(payload, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return payload
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Thin HTTP/1.1 adapter between the socket and JsonApi"""
+    
+    # HTTP/1.1 keeps connections open between requests
+    protocol_version = "HTTP/1.1"
+    # Small JSON responses on a kept-alive connection must not wait for Nagle
+    disable_nagle_algorithm = True
+    server_version = "EVChargingAPI/1.0"
+    
+    def do_GET(self) -> None:
+        self._serve(b"")
+    
+    def do_POST(self) -> None:
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self._reject(HTTPStatus.LENGTH_REQUIRED, "Content-Length header is required")
+            return
+        # int() alone would also take "+5", " 5" or "5_0"; a negative length would make read() wait for EOF
+        if not (header.isascii() and header.isdigit()):
+            self._reject(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header")
+            return
+        length = int(header)
+        if length > MAX_BODY_BYTES:
+            self._reject(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+            return
+        self._serve(self.rfile.read(length))
+    
+    def _reject(self, status: int, error: str) -> None:
+        """Answer without reading the body; the unread bytes make the connection unusable"""
+        self._send(status, {"error": error})
+        self.close_connection = True
+    
+    def _serve(self, body: bytes) -> None:
+        status, payload = self.server.api.handle(self.command, self.path, body)
+        self._send(status, payload)
+    
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format: str, *args) -> None:
+        # Per-request logging to stderr would dominate the cost of a request
+        pass
+
+
+class ApiServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the JsonApi its handlers dispatch to"""
+    
+    daemon_threads = True
+    request_queue_size = 128
+    
+    def __init__(self, address: Tuple[str, int], api: JsonApi):
+        super().__init__(address, _RequestHandler)
+        self.api = api
+
+
+def build_api(service, station_repo) -> JsonApi:
+    """JsonApi over the service and station repository from build_system()"""
+    return JsonApi(
+        SearchStationsUseCase(station_repo),
+        CreateMalfunctionReportUseCase(service),
+        ResolveMalfunctionUseCase(service),
+        CreateMalfunctionReportBatchUseCase(service)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    
+    server = ApiServer((args.host, args.port), build_api(*build_system()))
+    print(f"Serving JSON API on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
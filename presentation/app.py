@@ -11,14 +11,14 @@ from streamlit_folium import st_folium
 
 # Discovery Context
 from contexts.discovery.application.use_cases.search_stations_use_case import SearchStationsUseCase
-from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
-from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from contexts.discovery.application.use_cases.get_station_clusters_use_case import GetStationClustersUseCase
+from contexts.discovery.application.dtos.cluster_dto import ClusterRequest
+from contexts.discovery.application.dtos.station_page_dto import StationPage, StationPageRequest
+from contexts.discovery.domain.value_objects.station_status import StationStatus
 
 # Reporting Context
-from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
-from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
 from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
-from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.enums.report_status import OPEN_STATUSES, ReportStatus
 
 # Reporting Application Layer (Use Cases & DTOs)
 from contexts.reporting.application.use_cases.create_malfunction_report_use_case import CreateMalfunctionReportUseCase
@@ -27,7 +27,19 @@ from contexts.reporting.application.dtos.create_report_dto import CreateReportRe
 from contexts.reporting.application.dtos.resolve_report_dto import ResolveReportRequest
 
 # Shared
+from presentation.bootstrap import build_system
+from presentation.maps import add_station_clusters, render_station_map
+from contexts.shared_kernel.infrastructure.versioned_lru_cache import VersionedLruCache
 from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.common.geo_point import GeoPoint
+
+
+# --- MAP SETTINGS ---
+BERLIN_VIEWPORT = (52.3383, 13.0884, 52.6755, 13.7611)  # min_lat, min_lon, max_lat, max_lon
+MAP_CACHE_SIZE = 128
+
+# --- LIST SETTINGS ---
+STATION_PAGE_SIZE = 10
 
 
 # --- PAGE CONFIG ---
@@ -41,22 +53,19 @@ st.set_page_config(
 @st.cache_resource
 def init_system():
     """Initialize repositories, load data, and create service"""
-    station_repo = InMemoryStationRepository()
-    report_repo = InMemoryReportRepository()
-    
-    # Load real Berlin stations from CSV
-    loader = LadesaeulenregisterLoader()
-    berlin_stations = loader.load_berlin_stations()
-    
-    for station in berlin_stations:
-        station_repo.save(station)
-    
-    service = MalfunctionReportService(report_repo, station_repo)
-    
-    return service, station_repo
+    # Same wiring as the JSON API (presentation/api.py)
+    return build_system()
 
 service, station_repo = init_system()
 
+
+@st.cache_resource
+def init_map_cache():
+    """Rendered search maps, shared by every session"""
+    return VersionedLruCache(max_entries=MAP_CACHE_SIZE)
+
+map_cache = init_map_cache()
+
 # --- AUTHENTICATION STATE ---
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
@@ -66,6 +75,44 @@ if 'selected_postal_code' not in st.session_state:
     st.session_state.selected_postal_code = None
 if 'selected_station_id' not in st.session_state:
     st.session_state.selected_station_id = None
+if 'overview_viewport' not in st.session_state:
+    st.session_state.overview_viewport = BERLIN_VIEWPORT
+    st.session_state.overview_center = None
+    st.session_state.overview_zoom = 11
+# Cursor stacks of the paginated station lists; the last entry is the page on screen
+if 'search_postal_code' not in st.session_state:
+    st.session_state.search_postal_code = None
+    st.session_state.search_page_cursors = [None]
+if 'report_page_cursors' not in st.session_state:
+    st.session_state.report_postal_code = None
+    st.session_state.report_page_cursors = [None]
+if 'nearby_search' not in st.session_state:
+    st.session_state.nearby_search = None
+    st.session_state.nearby_page_cursors = [None]
+
+
+def page_request(cursor_key: str) -> StationPageRequest:
+    """Request for the page currently shown in a paginated list"""
+    return StationPageRequest(cursor=st.session_state[cursor_key][-1], page_size=STATION_PAGE_SIZE)
+
+
+def page_controls(cursor_key: str, station_page: StationPage) -> None:
+    """Previous/next buttons stepping through a list by its cursors"""
+    cursors = st.session_state[cursor_key]
+    first = (len(cursors) - 1) * STATION_PAGE_SIZE + 1
+    last = first + len(station_page.stations) - 1
+    
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("← Previous", key=f"{cursor_key}_previous", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    with col_info:
+        st.caption(f"Showing {first}-{last} of {station_page.total_count} stations")
+    with col_next:
+        if st.button("Next →", key=f"{cursor_key}_next", disabled=not station_page.has_next):
+            cursors.append(station_page.next_cursor)
+            st.rerun()
 
 # --- SIDEBAR NAVIGATION ---
 st.sidebar.title("🔌 Berlin EV Network")
@@ -76,16 +123,16 @@ page = st.sidebar.radio(
 
 st.sidebar.divider()
 
-# Get real-time stats
-all_reports = service.get_all_reports()
-open_reports = [r for r in all_reports if r.status != ReportStatus.RESOLVED]
-defective_stations = [s for s in station_repo.find_all() if s.status.value == "defective"]
+# Get real-time stats (counters are maintained by the repositories on save)
+report_counts = service.get_report_counts()
+station_counts = station_repo.count_by_status()
+open_report_count = sum(report_counts[status] for status in OPEN_STATUSES)
 
 st.sidebar.info(
     f"**📊 Network Status**\n\n"
-    f"Total Stations: {len(station_repo.find_all())}\n\n"
-    f"Active Reports: {len(open_reports)}\n\n"
-    f"Defective Stations: {len(defective_stations)}"
+    f"Total Stations: {station_repo.count()}\n\n"
+    f"Active Reports: {open_report_count}\n\n"
+    f"Defective Stations: {station_counts[StationStatus.DEFECTIVE]}"
 )
 
 # ============================================================================
@@ -108,14 +155,24 @@ if page == "🔍 Search Stations":
     with col2:
         search_button = st.button("🔍 Search", use_container_width=True, type="primary")
     
-    # Search using Use Case (handles validation via PostalCode value object)
     if search_button:
+        st.session_state.search_postal_code = postal_code
+        st.session_state.search_page_cursors = [None]
+    
+    # Paging reruns the script without the button, so the search lives on until the input changes
+    search_active = bool(postal_code) and postal_code == st.session_state.search_postal_code
+    
+    # Search using Use Case (handles validation via PostalCode value object)
+    if search_button or search_active:
         if not postal_code:
             st.error("❌ Please enter a postal code")
         else:
             try:
                 # Use the SearchStationsUseCase (proper DDD architecture)
                 search_use_case = SearchStationsUseCase(station_repo)
+                # Read the change version before the stations, so a change in between
+                # makes the cached map look stale rather than fresh
+                map_version = station_repo.postal_code_version(postal_code)
                 stations = search_use_case.execute_by_postal_code(postal_code)
                 
                 if not stations:
@@ -129,47 +186,12 @@ if page == "🔍 Search Stations":
                     if stations_with_coords:
                         st.subheader("📍 Station Locations Map")
                         
-                        # Calculate bounds to fit all stations
-                        lats = [s.latitude for s in stations_with_coords]
-                        lons = [s.longitude for s in stations_with_coords]
-                        
-                        # Center of all stations
-                        center_lat = sum(lats) / len(lats)
-                        center_lon = sum(lons) / len(lons)
-                        
-                        # Create map
-                        m = folium.Map(location=[center_lat, center_lon], zoom_start=13)
-                        
-                        # Add markers for each station
-                        for station in stations_with_coords:
-                            if station.status.value == "available":
-                                icon_color = "green"
-                                icon = "ok-sign"
-                            elif station.status.value == "defective":
-                                icon_color = "red"
-                                icon = "remove-sign"
-                            elif station.status.value == "in_use":
-                                icon_color = "blue"
-                                icon = "time"
-                            else:
-                                icon_color = "gray"
-                                icon = "question-sign"
-                            
-                            popup_text = f"""
-                            <b>{station.name}</b><br>
-                            Address: {station.address or 'N/A'}<br>
-                            Status: <b>{station.status.value.upper()}</b><br>
-                            ID: {station.station_id.value}
-                            """
-                            
-                            folium.Marker(
-                                location=[station.latitude, station.longitude],
-                                popup=popup_text,
-                                icon=folium.Icon(color=icon_color)
-                            ).add_to(m)
-                        
-                        # Display the map
-                        map_html = m._repr_html_()
+                        # Rendered maps are cached per postal code until one of its stations changes
+                        map_html = map_cache.get_or_build(
+                            postal_code,
+                            map_version,
+                            lambda: render_station_map(stations_with_coords)
+                        )
                         st.components.v1.html(map_html, height=400)
                         st.caption(f"🗺️ Showing {len(stations_with_coords)} stations | 🟢 Available | 🔴 Defective | 🔵 In Use")
                     else:
@@ -178,8 +200,12 @@ if page == "🔍 Search Stations":
                     st.divider()
                     st.subheader("📋 Station Details")
                     
+                    # Only the current page gets widgets, however many stations the postal code has;
+                    # it is cut from the stations fetched for the map, not queried again
+                    station_page = search_use_case.paginate_by_station_id(stations, page_request("search_page_cursors"))
+                    
                     # Display stations as expandable cards
-                    for i, station in enumerate(stations, 1):
+                    for i, station in enumerate(station_page.stations, 1):
                         with st.expander(f"📍 {station.name}", expanded=i<=3):
                             col_a, col_b = st.columns([2, 1])
                             
@@ -202,8 +228,9 @@ if page == "🔍 Search Stations":
                                 elif station.status.value == "in_use":
                                     st.info("🔵 **IN USE**")
                                     st.caption("Currently charging")
-                                
-                                        
+                    
+                    page_controls("search_page_cursors", station_page)
+            
             except ValueError as e:
                 # PostalCode validation errors (from value object)
                 st.error(f"❌ {str(e)}")
@@ -216,23 +243,100 @@ if page == "🔍 Search Stations":
             # Create default Berlin overview map
             berlin_center = [52.5200, 13.4050]  # Berlin center coordinates
             default_map = folium.Map(
-                location=berlin_center, 
-                zoom_start=11,
+                location=st.session_state.overview_center or berlin_center, 
+                zoom_start=st.session_state.overview_zoom,
                 tiles='OpenStreetMap'
             )
             
-            # Add a marker for Berlin center
-            folium.Marker(
-                location=berlin_center,
-                popup="<b>Berlin City Center</b><br>Search by postal code to find charging stations",
-                icon=folium.Icon(color='blue', icon='info-sign')
-            ).add_to(default_map)
+            # Summarize the stations inside the current map view as precomputed clusters
+            viewport = st.session_state.overview_viewport
+            # Pick up status changes other processes (the JSON API) committed to the shared database
+            station_repo.refresh()
+            cluster_use_case = GetStationClustersUseCase(station_repo.cluster_index)
+            overview = cluster_use_case.execute(ClusterRequest(*viewport, zoom=st.session_state.overview_zoom))
+            
+            # Clusters of one are drawn as the station itself, so only those need loading - in one lookup
+            single_stations = {
+                station_id.value: station
+                for station_id, station in station_repo.find_by_ids(
+                    StationId(cluster.station_id) for cluster in overview.clusters if cluster.is_single_station
+                ).items()
+            }
+            add_station_clusters(default_map, overview.clusters, single_stations)
             
-            # Display the map
+            # Display the map; panning or zooming reports new bounds back to us
             st.subheader("📍 Berlin Overview Map")
-            map_html = default_map._repr_html_()
-            st.components.v1.html(map_html, height=400)
-            st.caption("🔍 Enter a postal code above to find charging stations in specific areas")
+            map_state = st_folium(
+                default_map,
+                height=400,
+                key="overview_map",
+                returned_objects=["bounds", "center", "zoom"]
+            )
+            
+            bounds = (map_state or {}).get("bounds") or {}
+            south_west, north_east = bounds.get("_southWest"), bounds.get("_northEast")
+            if south_west and north_east and south_west.get("lat") is not None:
+                new_viewport = (
+                    max(south_west["lat"], -90.0), max(south_west["lng"], -180.0),
+                    min(north_east["lat"], 90.0), min(north_east["lng"], 180.0)
+                )
+                if new_viewport != viewport:
+                    # Rebuild at the same center/zoom so the refreshed map keeps the user's view
+                    center = map_state.get("center") or {}
+                    if center.get("lat") is not None:
+                        st.session_state.overview_center = [center["lat"], center["lng"]]
+                    st.session_state.overview_zoom = map_state.get("zoom") or st.session_state.overview_zoom
+                    st.session_state.overview_viewport = new_viewport
+                    st.rerun()
+            
+            st.caption(
+                f"🗺️ {overview.station_count} stations in view in {len(overview.clusters)} clusters "
+                f"| 🔍 Enter a postal code above to search a specific area"
+            )
+    
+    # Location search - finds chargers across postal code boundaries
+    st.divider()
+    with st.expander("📍 Search Near a Location"):
+        col_lat, col_lon, col_radius = st.columns(3)
+        with col_lat:
+            near_lat = st.number_input("Latitude", value=52.5200, format="%.5f")
+        with col_lon:
+            near_lon = st.number_input("Longitude", value=13.4050, format="%.5f")
+        with col_radius:
+            radius_m = st.number_input("Radius (m)", min_value=100, max_value=20000, value=500, step=100)
+        
+        if st.button("📍 Find Nearby Stations", use_container_width=True):
+            st.session_state.nearby_search = (near_lat, near_lon, radius_m)
+            st.session_state.nearby_page_cursors = [None]
+        
+        # Like the postal code search, paging keeps the search alive until an input changes
+        if st.session_state.nearby_search == (near_lat, near_lon, radius_m):
+            try:
+                search_use_case = SearchStationsUseCase(station_repo)
+                origin = GeoPoint(near_lat, near_lon)
+                nearby_page = search_use_case.execute_within_radius_page(
+                    near_lat, near_lon, radius_m, page_request("nearby_page_cursors")
+                )
+                nearby = nearby_page.stations
+                
+                if not nearby:
+                    st.warning(f"⚠️ No stations within {radius_m} m - showing the closest available ones")
+                    nearby = search_use_case.execute_nearest(
+                        near_lat, near_lon, k=5, status=StationStatus.AVAILABLE
+                    )
+                
+                for station in nearby:
+                    distance = origin.distance_to(GeoPoint(station.latitude, station.longitude))
+                    st.write(
+                        f"📍 **{station.name}** - {station.address or 'Berlin'} "
+                        f"({station.postal_code}) · {distance:,.0f} m · {station.status.value.upper()}"
+                    )
+                
+                if nearby_page.stations:
+                    page_controls("nearby_page_cursors", nearby_page)
+            
+            except ValueError as e:
+                st.error(f"❌ {str(e)}")
 
 # ============================================================================
 # PAGE 2: REPORT MALFUNCTION (Public)
@@ -257,23 +361,29 @@ elif page == "📢 Report Issue":
         find_button = st.button("🔍 Find Stations", use_container_width=True)
     
     available_stations = []
+    station_page = None
+    
+    # A cursor only means something for the postal code it was issued for, however the new code was entered
+    if find_button or postal_input != st.session_state.report_postal_code:
+        st.session_state.report_postal_code = postal_input
+        st.session_state.report_page_cursors = [None]
     
     if find_button or st.session_state.selected_postal_code:
         if postal_input:
             try:
-                # Use SearchStationsUseCase
+                # Use SearchStationsUseCase; only operational (not already defective) stations
                 search_use_case = SearchStationsUseCase(station_repo)
-                all_stations = search_use_case.execute_by_postal_code(postal_input)
-                
-                # Filter only operational (not already defective)
-                available_stations = [s for s in all_stations if s.is_operational]
+                station_page = search_use_case.execute_by_postal_code_page(
+                    postal_input, page_request("report_page_cursors"), operational_only=True
+                )
+                available_stations = station_page.stations
                 
                 if not available_stations:
                     st.warning(f"⚠️ No operational stations found in postal code {postal_input}")
                 else:
-                    st.success(f"✅ Found {len(available_stations)} operational station(s)")
+                    st.success(f"✅ Found {station_page.total_count} operational station(s)")
                     st.session_state.selected_postal_code = postal_input
-                    
+            
             except ValueError as e:
                 st.error(f"❌ {str(e)}")
         else:
@@ -284,6 +394,10 @@ elif page == "📢 Report Issue":
         st.divider()
         st.subheader("⚠️ Step 2: Report the Issue")
         
+        # Buttons cannot live inside a form, so the station pages are switched above it
+        if station_page is not None and (station_page.has_next or len(st.session_state.report_page_cursors) > 1):
+            page_controls("report_page_cursors", station_page)
+        
         # If we have stations, show the form
         if available_stations:
             with st.form("malfunction_report_form"):
@@ -383,12 +497,13 @@ elif page == "📢 Report Issue":
                             # Reset form
                             st.session_state.selected_postal_code = None
                             st.session_state.selected_station_id = None
+                            st.session_state.report_page_cursors = [None]
                         else:
                             st.error(
                                 f"❌ **Validation Failed**\n\n" +
                                 "\n".join(f"- {error}" for error in result.errors)
                             )
-                            
+                    
                     except ValueError as e:
                         st.error(f"⚠️ **Validation Error:** {str(e)}")
         else:
@@ -450,19 +565,15 @@ elif page == "👷 Operator Dashboard":
                 st.session_state.authenticated = False
                 st.rerun()
         
-        # Get reports
-        all_reports = service.get_all_reports()
-        open_reports = [r for r in all_reports if r.status != ReportStatus.RESOLVED]
-        resolved_reports = [r for r in all_reports if r.status == ReportStatus.RESOLVED]
+        # Only the open tickets are loaded, read from the repository's status index
+        open_reports = service.get_open_reports()
         
         # Metrics
         metric1, metric2, metric3, metric4 = st.columns(4)
-        metric1.metric("📊 Total Reports", len(all_reports))
-        metric2.metric("🔴 Open Tickets", len(open_reports))
-        metric3.metric("✅ Resolved", len(resolved_reports))
-        
-        defective_count = len([s for s in station_repo.find_all() if s.status.value == "defective"])
-        metric4.metric("⚠️ Defective Stations", defective_count)
+        metric1.metric("📊 Total Reports", sum(report_counts.values()))
+        metric2.metric("🔴 Open Tickets", open_report_count)
+        metric3.metric("✅ Resolved", report_counts[ReportStatus.RESOLVED])
+        metric4.metric("⚠️ Defective Stations", station_counts[StationStatus.DEFECTIVE])
         
         st.divider()
         
@@ -475,8 +586,11 @@ elif page == "👷 Operator Dashboard":
         else:
             st.warning(f"⚠️ {len(open_reports)} station(s) need maintenance")
             
+            # Every ticket's station in one fetch, however many tickets are open
+            ticket_stations = station_repo.find_by_ids(report.station_id for report in open_reports)
+            
             for report in open_reports:
-                station = station_repo.find_by_id(report.station_id)
+                station = ticket_stations[report.station_id]
                 
                 with st.expander(
                     f"🎫 Ticket: {str(report.ticket_id)[:8]}... | {station.name} ({station.postal_code})",
@@ -0,0 +1,41 @@
+"""Repository and service wiring shared by the Streamlit UI and the JSON API"""
+from typing import Tuple
+
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import (
+    SqliteStationRepository,
+    DEFAULT_DATABASE_PATH as DEFAULT_STATIONS_DATABASE_PATH
+)
+from contexts.discovery.infrastructure.repositories.cluster_indexed_station_repository import ClusterIndexedStationRepository
+from contexts.discovery.infrastructure.spatial.station_cluster_index import GridStationClusterIndex
+from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from contexts.discovery.infrastructure.data.station_snapshot import StationSnapshotCache, DEFAULT_SNAPSHOT_PATH
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
+from contexts.reporting.infrastructure.repositories.sqlite_report_repository import (
+    SqliteReportRepository,
+    DEFAULT_DATABASE_PATH as DEFAULT_REPORTS_DATABASE_PATH
+)
+
+
+def build_system() -> Tuple[MalfunctionReportService, ClusterIndexedStationRepository]:
+    """Initialize repositories, load data, and create service"""
+    # Stations (and their status) persist in SQLite, shared by every worker process;
+    # saves also keep the overview map's zoom-level clusters current
+    station_repo = ClusterIndexedStationRepository(
+        SqliteStationRepository(DEFAULT_STATIONS_DATABASE_PATH),
+        GridStationClusterIndex()
+    )
+    # Reports and tickets are group-committed to SQLite so they survive restarts
+    report_repo = SqliteReportRepository(DEFAULT_REPORTS_DATABASE_PATH)
+    
+    # Stream real Berlin stations from CSV into an empty database only,
+    # so status changes from earlier runs are not overwritten
+    # (a binary snapshot of the parsed stations is reused while the CSV is unchanged)
+    if station_repo.count() == 0:
+        loader = LadesaeulenregisterLoader(snapshot_cache=StationSnapshotCache(DEFAULT_SNAPSHOT_PATH))
+        loader.load_into(station_repo)
+    else:
+        station_repo.build_index()
+    
+    service = MalfunctionReportService(report_repo, station_repo)
+    
+    return service, station_repo
@@ -0,0 +1,113 @@
+"""Folium map rendering for the Streamlit pages"""
+from typing import Any, Dict, List, Optional
+
+import folium
+from branca.element import MacroElement
+from jinja2 import Template
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_cluster import StationCluster
+from presentation.station_geojson import (
+    feature_collection_bounds,
+    stations_to_feature_collection,
+    to_script_json,
+)
+
+
+STATUS_COLORS = {"available": "green", "defective": "red", "in_use": "blue"}
+BERLIN_CENTER = [52.52, 13.405]
+
+
+class StationLayer(MacroElement):
+    """
+    All stations as one Leaflet GeoJSON layer.
+    
+    The feature collection is embedded once; a small script colours each
+    point by its status property and builds the popup on click, so the page
+    grows by one compact feature per station rather than a marker, an icon
+    and a popup element each.
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }}_colors = {{ this.colors }};
+        var {{ this.get_name() }}_escape = function(value) {
+            return String(value == null ? "N/A" : value).replace(/[&<>"']/g, function(c) {
+                return "&#" + c.charCodeAt(0) + ";";
+            });
+        };
+        var {{ this.get_name() }} = L.geoJSON({{ this.data }}, {
+            pointToLayer: function(feature, latlng) {
+                var color = {{ this.get_name() }}_colors[feature.properties.status] || "gray";
+                return L.circleMarker(latlng, {
+                    radius: 7, color: color, fillColor: color, fillOpacity: 0.8, weight: 2
+                });
+            },
+            onEachFeature: function(feature, layer) {
+                layer.bindPopup(function() {
+                    var p = feature.properties, e = {{ this.get_name() }}_escape;
+                    return "<b>" + e(p.name) + "</b><br>Address: " + e(p.address)
+                        + "<br>Status: <b>" + e(p.status).toUpperCase() + "</b><br>ID: " + e(p.id);
+                });
+            }
+        }).addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+    """)
+    
+    def __init__(self, feature_collection: Dict[str, Any]):
+        super().__init__()
+        self._name = "StationLayer"
+        self.data = to_script_json(feature_collection)
+        self.colors = to_script_json(STATUS_COLORS)
+
+
+def render_station_map(stations_with_coords: List[OperationalStation]) -> str:
+    """Standalone HTML for a map with every station in one GeoJSON layer, fitted to them"""
+    stations = stations_to_feature_collection(stations_with_coords)
+    bounds = feature_collection_bounds(stations)
+    
+    m = folium.Map(location=BERLIN_CENTER, zoom_start=13)
+    if bounds is not None:
+        m.fit_bounds(bounds, max_zoom=16)
+    StationLayer(stations).add_to(m)
+    
+    return m._repr_html_()
+
+
+def add_station_clusters(
+    folium_map: folium.Map,
+    clusters: List[StationCluster],
+    single_stations: Dict[str, Optional[OperationalStation]]
+) -> None:
+    """Draw clusters as count bubbles, and clusters of one as their station"""
+    for cluster in clusters:
+        station = single_stations.get(cluster.station_id) if cluster.is_single_station else None
+        if station is not None:
+            folium.CircleMarker(
+                location=[cluster.latitude, cluster.longitude],
+                radius=4,
+                color=STATUS_COLORS.get(station.status.value, "gray"),
+                fill=True,
+                popup=f"<b>{station.name}</b><br>{station.address or 'Berlin'}"
+            ).add_to(folium_map)
+            continue
+        
+        # Red ring as soon as one station in the cluster is defective
+        border = "red" if cluster.defective else "green"
+        size = 24 + min(len(str(cluster.count)), 4) * 6
+        folium.Marker(
+            location=[cluster.latitude, cluster.longitude],
+            icon=folium.DivIcon(
+                icon_size=(size, size),
+                icon_anchor=(size // 2, size // 2),
+                html=(
+                    f'<div style="width:{size}px;height:{size}px;line-height:{size - 6}px;'
+                    f'border-radius:50%;border:3px solid {border};background:rgba(255,255,255,0.85);'
+                    f'text-align:center;font-weight:bold;font-size:12px">{cluster.count}</div>'
+                )
+            ),
+            tooltip=(
+                f"{cluster.count} stations: {cluster.available} available, "
+                f"{cluster.in_use} in use, {cluster.defective} defective"
+            )
+        ).add_to(folium_map)
@@ -0,0 +1,57 @@
+"""GeoJSON encoding of stations for the single-layer map"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+
+
+# Six decimals is ~0.1 m - finer digits only add payload
+COORDINATE_DECIMALS = 6
+
+
+def stations_to_feature_collection(stations: Iterable[OperationalStation]) -> Dict[str, Any]:
+    """
+    One Point feature per located station, with status as a plain property.
+    
+    Styling and popups are derived from the properties in the browser, so
+    each station costs one small feature instead of its own marker, icon
+    and popup HTML. Stations without coordinates are left out.
+    """
+    features = []
+    for station in stations:
+        if station.latitude is None or station.longitude is None:
+            continue
+        features.append({
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                # GeoJSON orders positions longitude first
+                "coordinates": [
+                    round(station.longitude, COORDINATE_DECIMALS),
+                    round(station.latitude, COORDINATE_DECIMALS),
+                ],
+            },
+            "properties": {
+                "id": station.station_id.value,
+                "name": station.name,
+                "address": station.address,
+                "status": station.status.value,
+            },
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+def feature_collection_bounds(collection: Dict[str, Any]) -> Optional[List[List[float]]]:
+    """[[south, west], [north, east]] around every feature, or None when empty"""
+    positions = [feature["geometry"]["coordinates"] for feature in collection["features"]]
+    if not positions:
+        return None
+    lons = [lon for lon, _ in positions]
+    lats = [lat for _, lat in positions]
+    return [[min(lats), min(lons)], [max(lats), max(lons)]]
+
+
+def to_script_json(data: Any) -> str:
+    """Compact JSON that is safe to embed inside a <script> element"""
+    # "</" would end the script element early if a station name contained "</script>"
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
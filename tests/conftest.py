@@ -3,6 +3,7 @@ import pytest
 from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
 from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
 from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
 from contexts.shared_kernel.common.station_id import StationId
 
 
@@ -28,3 +29,33 @@ def sample_station(station_repository):
     )
     station_repository.save(station)
     return station
+
+
+@pytest.fixture
+def make_station():
+    """
+    Factory for stations numbered STATION-000, STATION-001, ...
+    
+    Positional arguments after the number are latitude, longitude and
+    status; name defaults to "Station <n>" and address to "Teststraße <n>".
+    """
+    def make(
+        number,
+        latitude=52.52,
+        longitude=13.41,
+        status=StationStatus.AVAILABLE,
+        postal_code="10178",
+        name=None,
+        address=None
+    ):
+        return OperationalStation(
+            station_id=StationId(f"STATION-{number:03d}"),
+            name=name or f"Station {number}",
+            postal_code=postal_code,
+            address=address or f"Teststraße {number}",
+            latitude=latitude,
+            longitude=longitude,
+            status=status
+        )
+    
+    return make
@@ -0,0 +1,65 @@
+"""Tests for GetStationClustersUseCase"""
+import pytest
+from contexts.discovery.application.dtos.cluster_dto import ClusterRequest
+from contexts.discovery.application.use_cases.get_station_clusters_use_case import GetStationClustersUseCase
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.spatial.station_cluster_index import GridStationClusterIndex
+from contexts.shared_kernel.common.station_id import StationId
+
+
+@pytest.fixture
+def use_case():
+    """Setup use case with two central stations and one in Potsdam"""
+    index = GridStationClusterIndex()
+    coordinates = [
+        ("STATION-001", 52.5219, 13.4132, StationStatus.AVAILABLE),  # Alexanderplatz
+        ("STATION-002", 52.5163, 13.3777, StationStatus.DEFECTIVE),  # Brandenburger Tor
+        ("STATION-003", 52.4000, 13.0500, StationStatus.IN_USE),     # Potsdam
+    ]
+    index.rebuild(
+        OperationalStation(
+            station_id=StationId(station_id),
+            name=f"Station {station_id}",
+            postal_code="10178",
+            latitude=lat,
+            longitude=lon,
+            status=status
+        )
+        for station_id, lat, lon, status in coordinates
+    )
+    return GetStationClustersUseCase(index)
+
+
+class TestGetStationClustersUseCase:
+    """Test suite for GetStationClustersUseCase"""
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_low_zoom_merges_stations_with_status_counts(self, use_case):
+        """Happy Path: Zoomed out, the area is one cluster with per-status counts"""
+        response = use_case.execute(ClusterRequest(52.3, 13.0, 52.7, 13.8, zoom=3))
+        
+        assert len(response.clusters) == 1
+        cluster = response.clusters[0]
+        assert (cluster.available, cluster.in_use, cluster.defective) == (1, 1, 1)
+        assert cluster.count_for(StationStatus.DEFECTIVE) == 1
+    
+    def test_high_zoom_shows_single_stations_in_view(self, use_case):
+        """Happy Path: Zoomed in, only the stations in view come back, one each"""
+        response = use_case.execute(ClusterRequest(52.50, 13.35, 52.55, 13.45, zoom=16))
+        
+        assert response.station_count == 2
+        assert {c.station_id for c in response.clusters} == {"STATION-001", "STATION-002"}
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_inverted_viewport_raises_error(self):
+        """Error Scenario: Minimum corner above maximum corner"""
+        with pytest.raises(ValueError, match="must not exceed"):
+            ClusterRequest(52.6, 13.0, 52.5, 13.8, zoom=10)
+    
+    def test_negative_zoom_raises_error(self):
+        """Error Scenario: Zoom levels start at 0"""
+        with pytest.raises(ValueError, match="Zoom level cannot be negative"):
+            ClusterRequest(52.3, 13.0, 52.7, 13.8, zoom=-1)
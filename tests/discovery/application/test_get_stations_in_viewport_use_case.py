@@ -0,0 +1,80 @@
+"""Tests for GetStationsInViewportUseCase"""
+import pytest
+from contexts.discovery.application.dtos.viewport_dto import ViewportRequest
+from contexts.discovery.application.use_cases.get_stations_in_viewport_use_case import GetStationsInViewportUseCase
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+@pytest.fixture
+def use_case():
+    """Setup use case with stations inside and outside central Berlin"""
+    repo = InMemoryStationRepository()
+    
+    coordinates = [
+        ("STATION-001", 52.5219, 13.4132),  # Alexanderplatz
+        ("STATION-002", 52.5163, 13.3777),  # Brandenburger Tor
+        ("STATION-003", 52.4000, 13.0500),  # Potsdam
+        ("STATION-004", None, None),        # no GPS
+    ]
+    for station_id, lat, lon in coordinates:
+        repo.save(OperationalStation(
+            station_id=StationId(station_id),
+            name=f"Station {station_id}",
+            postal_code="10178",
+            latitude=lat,
+            longitude=lon
+        ))
+    
+    return GetStationsInViewportUseCase(repo)
+
+
+class TestGetStationsInViewportUseCase:
+    """Test suite for GetStationsInViewportUseCase"""
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_returns_only_visible_stations(self, use_case):
+        """Happy Path: Only stations inside the view are returned"""
+        response = use_case.execute(ViewportRequest(52.50, 13.35, 52.55, 13.45))
+        
+        assert sorted(s.station_id.value for s in response.stations) == ["STATION-001", "STATION-002"]
+        assert response.truncated is False
+    
+    def test_limit_truncates_result(self, use_case):
+        """Happy Path: Limit caps the stations and flags truncation"""
+        response = use_case.execute(ViewportRequest(52.0, 13.0, 53.0, 14.0, limit=2))
+        
+        assert response.count == 2
+        assert response.truncated is True
+    
+    def test_exact_limit_is_not_truncated(self, use_case):
+        """Edge Case: Exactly `limit` visible stations is not a truncation"""
+        response = use_case.execute(ViewportRequest(52.0, 13.0, 53.0, 14.0, limit=3))
+        
+        assert response.count == 3
+        assert response.truncated is False
+    
+    def test_empty_view(self, use_case):
+        """Edge Case: View with no stations"""
+        response = use_case.execute(ViewportRequest(48.0, 11.0, 48.5, 11.5))
+        
+        assert response.stations == []
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_inverted_bounds_raise_error(self):
+        """Error Scenario: Minimum above maximum"""
+        with pytest.raises(ValueError, match="must not exceed"):
+            ViewportRequest(52.6, 13.3, 52.4, 13.5)
+    
+    def test_out_of_range_bounds_raise_error(self):
+        """Error Scenario: Latitude outside -90..90"""
+        with pytest.raises(ValueError, match="Latitude"):
+            ViewportRequest(52.4, 13.3, 95.0, 13.5)
+    
+    def test_non_positive_limit_raises_error(self):
+        """Error Scenario: Limit must be positive"""
+        with pytest.raises(ValueError, match="Limit must be positive"):
+            ViewportRequest(52.4, 13.3, 52.6, 13.5, limit=0)
@@ -1,8 +1,10 @@
 """Tests for SearchStationsUseCase"""
 import pytest
+from contexts.discovery.application.dtos.station_page_dto import StationPageRequest
 from contexts.discovery.application.use_cases.search_stations_use_case import SearchStationsUseCase
 from contexts.discovery.domain.entities.operational_station import OperationalStation
 from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.domain.value_objects.station_status import StationStatus
 from contexts.shared_kernel.common.station_id import StationId
 
 
@@ -35,6 +37,46 @@ def use_case():
     return SearchStationsUseCase(repo)
 
 
+@pytest.fixture
+def geo_use_case():
+    """Setup use case with stations on both sides of a postal code boundary"""
+    repo = InMemoryStationRepository()
+    
+    stations = [
+        OperationalStation(
+            station_id=StationId("STATION-101"),
+            name="Alexanderplatz Station",
+            postal_code="10178",
+            latitude=52.5219,
+            longitude=13.4132
+        ),
+        OperationalStation(
+            station_id=StationId("STATION-102"),
+            name="Jannowitzbrücke Station",
+            postal_code="10179",
+            latitude=52.5150,
+            longitude=13.4180
+        ),
+        OperationalStation(
+            station_id=StationId("STATION-103"),
+            name="Zoo Station",
+            postal_code="10623",
+            latitude=52.5069,
+            longitude=13.3324
+        ),
+        OperationalStation(
+            station_id=StationId("STATION-104"),
+            name="No GPS Station",
+            postal_code="10178"
+        ),
+    ]
+    
+    for station in stations:
+        repo.save(station)
+    
+    return SearchStationsUseCase(repo), repo
+
+
 class TestSearchStationsUseCase:
     """Test suite for SearchStationsUseCase"""
     
@@ -114,4 +156,160 @@ class TestSearchStationsUseCase:
         empty_repo = InMemoryStationRepository()
         use_case = SearchStationsUseCase(empty_repo)
         stations = use_case.execute_all()
-        assert len(stations) == 0
\ No newline at end of file
+        assert len(stations) == 0
+    
+    # ==================== SPATIAL SEARCH ====================
+    
+    def test_nearest_stations_ordered_by_distance(self, geo_use_case):
+        """Happy Path: Nearest search crosses postal code boundaries"""
+        use_case, _ = geo_use_case
+        stations = use_case.execute_nearest(52.5200, 13.4150, k=2)
+        
+        assert [s.station_id.value for s in stations] == ["STATION-101", "STATION-102"]
+    
+    def test_nearest_filters_by_status(self, geo_use_case):
+        """Domain Rule: Status filter skips defective stations"""
+        use_case, repo = geo_use_case
+        station = repo.find_by_id(StationId("STATION-101"))
+        station.mark_as_defective()
+        repo.save(station)
+        
+        stations = use_case.execute_nearest(52.5219, 13.4132, k=1, status=StationStatus.AVAILABLE)
+        
+        assert stations[0].station_id.value == "STATION-102"
+    
+    def test_within_radius(self, geo_use_case):
+        """Happy Path: Radius search returns only nearby stations with coordinates"""
+        use_case, _ = geo_use_case
+        stations = use_case.execute_within_radius(52.5219, 13.4132, 1000)
+        
+        assert [s.station_id.value for s in stations] == ["STATION-101", "STATION-102"]
+    
+    def test_invalid_coordinates_raise_error(self, geo_use_case):
+        """Error Scenario: Coordinates out of range"""
+        use_case, _ = geo_use_case
+        with pytest.raises(ValueError, match="Latitude"):
+            use_case.execute_nearest(123.0, 13.4)
+    
+    def test_non_positive_radius_raises_error(self, geo_use_case):
+        """Error Scenario: Radius must be positive"""
+        use_case, _ = geo_use_case
+        with pytest.raises(ValueError, match="Radius must be positive"):
+            use_case.execute_within_radius(52.52, 13.41, 0)
+
+
+@pytest.fixture
+def paged_use_case():
+    """Setup use case with 25 stations in one postal code, every fifth defective"""
+    repo = InMemoryStationRepository()
+    for i in reversed(range(25)):
+        repo.save(OperationalStation(
+            station_id=StationId(f"STATION-{i:03d}"),
+            name=f"Station {i}",
+            postal_code="10178",
+            latitude=52.52 + i * 0.0001,
+            longitude=13.40,
+            status=StationStatus.DEFECTIVE if i % 5 == 0 else StationStatus.AVAILABLE
+        ))
+    return SearchStationsUseCase(repo), repo
+
+
+class TestSearchStationsPagination:
+    """Test suite for cursor-based pages of search results"""
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_pages_cover_every_station_once_in_id_order(self, paged_use_case):
+        """Happy Path: Following next cursors walks the whole result set"""
+        use_case, _ = paged_use_case
+        seen, cursor, pages = [], None, 0
+        
+        while True:
+            page = use_case.execute_by_postal_code_page("10178", StationPageRequest(cursor=cursor, page_size=10))
+            assert page.total_count == 25
+            seen.extend(s.station_id.value for s in page.stations)
+            pages += 1
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        
+        assert pages == 3
+        assert seen == [f"STATION-{i:03d}" for i in range(25)]
+    
+    def test_operational_only_filters_before_paging(self, paged_use_case):
+        """Happy Path: Defective stations neither appear nor count"""
+        use_case, _ = paged_use_case
+        
+        page = use_case.execute_by_postal_code_page("10178", StationPageRequest(page_size=50), operational_only=True)
+        
+        assert page.total_count == 20
+        assert all(s.is_operational for s in page.stations)
+        assert page.next_cursor is None
+    
+    def test_fetched_stations_page_without_another_query(self, paged_use_case):
+        """Happy Path: A list fetched once pages like the postal code query, without touching the repository"""
+        use_case, repo = paged_use_case
+        stations = use_case.execute_by_postal_code("10178")
+        request = StationPageRequest(page_size=10)
+        second = StationPageRequest(cursor=use_case.paginate_by_station_id(stations, request).next_cursor, page_size=10)
+        
+        def no_query(postal_code):
+            raise AssertionError("repository queried again")
+        repo.find_by_postal_code = no_query
+        
+        page = use_case.paginate_by_station_id(stations, second)
+        
+        assert [s.station_id.value for s in page.stations] == [f"STATION-{i:03d}" for i in range(10, 20)]
+        assert page.total_count == 25
+    
+    def test_radius_pages_are_nearest_first(self, paged_use_case):
+        """Happy Path: Radius results page by distance from the origin"""
+        use_case, _ = paged_use_case
+        
+        first = use_case.execute_within_radius_page(52.52, 13.40, 1000, StationPageRequest(page_size=5))
+        second = use_case.execute_within_radius_page(52.52, 13.40, 1000, StationPageRequest(first.next_cursor, 5))
+        
+        assert [s.station_id.value for s in first.stations] == [f"STATION-{i:03d}" for i in range(5)]
+        assert [s.station_id.value for s in second.stations] == [f"STATION-{i:03d}" for i in range(5, 10)]
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_cursor_survives_removed_and_added_stations(self, paged_use_case):
+        """Edge Case: A page continues after the last station shown, not at an offset"""
+        use_case, repo = paged_use_case
+        first = use_case.execute_by_postal_code_page("10178", StationPageRequest(page_size=10))
+        
+        repo.save(OperationalStation(station_id=StationId("STATION-000A"), name="New", postal_code="10178"))
+        second = use_case.execute_by_postal_code_page("10178", StationPageRequest(first.next_cursor, 10))
+        
+        assert second.stations[0].station_id.value == "STATION-010"
+        assert second.total_count == 26
+    
+    def test_all_stations_paged(self, paged_use_case):
+        """Edge Case: The national listing pages the same way"""
+        use_case, _ = paged_use_case
+        
+        page = use_case.execute_all_page(StationPageRequest(page_size=100))
+        
+        assert len(page.stations) == 25
+        assert not page.has_next
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_invalid_page_size_raises_error(self):
+        """Error Scenario: Page size outside 1..100"""
+        with pytest.raises(ValueError, match="Page size must be between"):
+            StationPageRequest(page_size=0)
+    
+    def test_garbage_cursor_raises_error(self):
+        """Error Scenario: Cursor that was not issued by a search"""
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            StationPageRequest(cursor="not-a-cursor!")
+    
+    def test_cursor_from_another_ordering_raises_error(self, paged_use_case):
+        """Error Scenario: Radius cursor used for a postal code search"""
+        use_case, _ = paged_use_case
+        radius_page = use_case.execute_within_radius_page(52.52, 13.40, 1000, StationPageRequest(page_size=5))
+        
+        with pytest.raises(ValueError, match="does not belong"):
+            use_case.execute_by_postal_code_page("10178", StationPageRequest(radius_page.next_cursor, 5))
@@ -0,0 +1,157 @@
+"""Tests for the array-backed station repository"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.columnar_station_repository import ColumnarStationRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class TestColumnarStationRepository:
+    """Test array-backed implementation of station repository"""
+    
+    @pytest.fixture
+    def repository(self):
+        """Create a repository with a tiny capacity to exercise growth"""
+        return ColumnarStationRepository(initial_capacity=2)
+    
+    def test_save_and_find_returns_equivalent_view(self, repository, make_station):
+        """Test a saved station comes back with all its fields"""
+        station = make_station(1)
+        repository.save(station)
+        
+        found = repository.find_by_id(StationId("STATION-001"))
+        
+        assert found.station_id == station.station_id
+        assert found.name == station.name
+        assert found.postal_code == station.postal_code
+        assert found.address == station.address
+        assert found.latitude == station.latitude
+        assert found.longitude == station.longitude
+        assert found.status == StationStatus.AVAILABLE
+    
+    def test_transition_status_writes_the_status_column(self, repository, make_station):
+        """Test the compare-and-set moves matching rows and bumps their postal code version"""
+        repository.save_all(make_station(number) for number in range(3))
+        before = repository.postal_code_version("10178")
+        
+        moved = repository.transition_status(
+            [StationId("STATION-001"), StationId("STATION-999")], {StationStatus.AVAILABLE}, StationStatus.DEFECTIVE
+        )
+        
+        assert moved == {StationId("STATION-001")}
+        assert repository.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+        assert repository.count_by_status()[StationStatus.DEFECTIVE] == 1
+        assert repository.postal_code_version("10178") > before
+    
+    def test_find_by_ids(self, repository, make_station):
+        """Test bulk lookup returns views keyed by id, skipping unknown ids"""
+        repository.save_all(make_station(number) for number in range(5))
+        
+        found = repository.find_by_ids([StationId("STATION-004"), StationId("STATION-001"), StationId("STATION-999")])
+        
+        assert set(found) == {StationId("STATION-001"), StationId("STATION-004")}
+        assert found[StationId("STATION-004")].address == "Teststraße 4"
+    
+    def test_missing_coordinates_round_trip_as_none(self, repository, make_station):
+        """Test stations without GPS data keep None coordinates"""
+        repository.save(make_station(1, latitude=None, longitude=None))
+        
+        found = repository.find_by_id(StationId("STATION-001"))
+        
+        assert found.latitude is None
+        assert found.longitude is None
+    
+    def test_growth_beyond_initial_capacity(self, repository, make_station):
+        """Test columns grow as stations are appended"""
+        count = repository.save_all(make_station(i) for i in range(10))
+        
+        assert count == 10
+        assert repository.count() == 10
+        assert [s.station_id.value for s in repository.find_all()] == [f"STATION-{i:03d}" for i in range(10)]
+    
+    def test_saving_a_mutated_view_writes_back(self, repository, make_station):
+        """Test status changes on a view persist after save"""
+        repository.save(make_station(1))
+        
+        view = repository.find_by_id(StationId("STATION-001"))
+        view.mark_as_defective()
+        repository.save(view)
+        
+        assert repository.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+        assert repository.count() == 1
+    
+    def test_postal_code_version_follows_status_changes(self, repository, make_station):
+        """Test a status change bumps only its own postal code's version"""
+        repository.save(make_station(1, postal_code="10178"))
+        repository.save(make_station(2, postal_code="10785"))
+        before = repository.postal_code_version("10178"), repository.postal_code_version("10785")
+        
+        view = repository.find_by_id(StationId("STATION-001"))
+        repository.save(view)
+        assert repository.postal_code_version("10178") == before[0]
+        
+        view.mark_as_defective()
+        repository.save(view)
+        assert repository.postal_code_version("10178") > before[0]
+        assert repository.postal_code_version("10785") == before[1]
+    
+    def test_find_by_postal_code(self, repository, make_station):
+        """Test postal code filter keeps insertion order"""
+        repository.save(make_station(1, postal_code="10178"))
+        repository.save(make_station(2, postal_code="10785"))
+        repository.save(make_station(3, postal_code="10178"))
+        
+        ids = [s.station_id.value for s in repository.find_by_postal_code("10178")]
+        
+        assert ids == ["STATION-001", "STATION-003"]
+        assert repository.find_by_postal_code("10999") == []
+    
+    def test_count_and_find_by_status(self, repository, make_station):
+        """Test vectorized status counts and filters"""
+        repository.save_all(make_station(i) for i in range(4))
+        view = repository.find_by_id(StationId("STATION-002"))
+        view.mark_as_defective()
+        repository.save(view)
+        
+        counts = repository.count_by_status()
+        
+        assert counts[StationStatus.AVAILABLE] == 3
+        assert counts[StationStatus.DEFECTIVE] == 1
+        assert counts[StationStatus.IN_USE] == 0
+        assert [s.station_id.value for s in repository.find_by_status(StationStatus.DEFECTIVE)] == ["STATION-002"]
+    
+    def test_find_in_bbox(self, repository, make_station):
+        """Test bounding-box selection skips stations outside or without coordinates"""
+        repository.save(make_station(1, latitude=52.52, longitude=13.40))
+        repository.save(make_station(2, latitude=52.40, longitude=13.10))
+        repository.save(make_station(3, latitude=None, longitude=None))
+        repository.save(make_station(4, latitude=52.50, longitude=13.45))
+        
+        inside = repository.find_in_bbox(52.45, 13.30, 52.60, 13.50)
+        
+        assert [s.station_id.value for s in inside] == ["STATION-001", "STATION-004"]
+        assert repository.count_in_bbox(52.45, 13.30, 52.60, 13.50) == 2
+        assert len(repository.find_in_bbox(52.45, 13.30, 52.60, 13.50, limit=1)) == 1
+    
+    def test_operator_names_are_interned(self, repository, make_station):
+        """Test repeated operator names share one interned id"""
+        repository.save_all(make_station(i, name="Stromnetz Berlin") for i in range(5))
+        
+        assert len(set(repository._name_ids[:repository.count()])) == 1
+    
+    def test_find_nearest_and_within_radius(self, repository, make_station):
+        """Test spatial queries return views ordered by distance"""
+        repository.save(make_station(1, latitude=52.5219, longitude=13.4132))
+        repository.save(make_station(2, latitude=52.5150, longitude=13.4180))
+        repository.save(make_station(3, latitude=52.5069, longitude=13.3324))
+        view = repository.find_by_id(StationId("STATION-001"))
+        view.mark_as_defective()
+        repository.save(view)
+        
+        nearest = repository.find_nearest(52.5219, 13.4132, k=2, status=StationStatus.AVAILABLE)
+        nearby = repository.find_within_radius(52.5219, 13.4132, 1000)
+        
+        assert [s.station_id.value for s in nearest] == ["STATION-002", "STATION-003"]
+        assert [s.station_id.value for s in nearby] == ["STATION-001", "STATION-002"]
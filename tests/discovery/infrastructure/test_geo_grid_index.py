@@ -0,0 +1,90 @@
+"""Tests for the lat/lon grid spatial index"""
+import random
+import pytest
+from contexts.discovery.infrastructure.spatial.geo_grid_index import GeoGridIndex
+from contexts.shared_kernel.common.geo_point import haversine_meters
+
+
+@pytest.fixture
+def berlin_points():
+    """Random points scattered over the Berlin area"""
+    rng = random.Random(42)
+    return {
+        f"S{i}": (rng.uniform(52.35, 52.65), rng.uniform(13.1, 13.75))
+        for i in range(2000)
+    }
+
+
+@pytest.fixture
+def index(berlin_points):
+    index = GeoGridIndex()
+    for key, (lat, lon) in berlin_points.items():
+        index.upsert(key, lat, lon)
+    return index
+
+
+def brute_force(points, lat, lon):
+    return sorted((haversine_meters(lat, lon, *p), key) for key, p in points.items())
+
+
+class TestGeoGridIndex:
+    """Test suite for nearest and radius queries"""
+    
+    @pytest.mark.parametrize("lat,lon", [(52.52, 13.405), (52.36, 13.11), (52.9, 14.2), (48.13, 11.57)])
+    def test_nearest_matches_brute_force(self, index, berlin_points, lat, lon):
+        """Test ring search returns the same neighbours as a full scan"""
+        expected = [key for _, key in brute_force(berlin_points, lat, lon)[:7]]
+        
+        assert [key for key, _ in index.nearest(lat, lon, 7)] == expected
+    
+    def test_within_radius_matches_brute_force(self, index, berlin_points):
+        """Test radius search returns exactly the points inside the circle"""
+        expected = [key for d, key in brute_force(berlin_points, 52.52, 13.405) if d <= 1500]
+        
+        assert [key for key, _ in index.within_radius(52.52, 13.405, 1500)] == expected
+    
+    def test_nearest_with_predicate(self, index, berlin_points):
+        """Test predicate filters candidates before the k cut"""
+        allowed = lambda key: int(key[1:]) % 10 == 0
+        expected = [key for _, key in brute_force(berlin_points, 52.5, 13.4) if allowed(key)][:3]
+        
+        assert [key for key, _ in index.nearest(52.5, 13.4, 3, allowed)] == expected
+    
+    def test_upsert_moves_point(self):
+        """Test re-inserting a key relocates it"""
+        index = GeoGridIndex()
+        index.upsert("A", 52.52, 13.40)
+        index.upsert("A", 48.13, 11.57)
+        
+        assert index.within_radius(52.52, 13.40, 1000) == []
+        assert [key for key, _ in index.within_radius(48.13, 11.57, 10)] == ["A"]
+        assert len(index) == 1
+    
+    def test_missing_coordinates_remove_point(self):
+        """Test upserting None coordinates drops the key"""
+        index = GeoGridIndex()
+        index.upsert("A", 52.52, 13.40)
+        index.upsert("A", None, None)
+        
+        assert "A" not in index
+        assert index.nearest(52.52, 13.40, 1) == []
+    
+    def test_empty_index(self):
+        """Test queries on an empty index return nothing"""
+        index = GeoGridIndex()
+        
+        assert index.nearest(52.52, 13.40, 5) == []
+        assert index.within_radius(52.52, 13.40, 5000) == []
+    
+    def test_in_bbox_matches_brute_force(self, index, berlin_points):
+        """Test bounding-box query returns exactly the points inside"""
+        expected = {
+            key for key, (lat, lon) in berlin_points.items()
+            if 52.45 <= lat <= 52.55 and 13.30 <= lon <= 13.50
+        }
+        
+        assert set(index.in_bbox(52.45, 13.30, 52.55, 13.50)) == expected
+    
+    def test_in_bbox_respects_limit(self, index):
+        """Test limit stops the scan early"""
+        assert len(index.in_bbox(52.0, 13.0, 53.0, 14.0, limit=25)) == 25
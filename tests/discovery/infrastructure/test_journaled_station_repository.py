@@ -0,0 +1,118 @@
+"""Tests for status journaling and recovery of stations"""
+import pytest
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.journaled_station_repository import JournaledStationRepository
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.event_journal import EventJournal
+
+
+def register_stations():
+    """Stand-in for the register load at startup"""
+    return [
+        OperationalStation(StationId(f"STATION-00{i}"), f"Station {i}", "10178")
+        for i in range(1, 4)
+    ]
+
+
+class TestJournaledStationRepository:
+    """Test station status transitions survive a restart"""
+    
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return tmp_path / "stations"
+    
+    def start(self, directory, snapshot_every=1000):
+        """Simulate a process start: load the register, then recover from the journal"""
+        journal = EventJournal(directory)
+        repository = JournaledStationRepository(InMemoryStationRepository(), journal, snapshot_every)
+        repository.save_all(register_stations())
+        replayed = repository.recover()
+        return repository, journal, replayed
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_register_load_writes_no_events(self, directory):
+        """Happy Path: Loading available stations is not a state change"""
+        _, journal, _ = self.start(directory)
+        
+        assert journal.last_seq == 0
+        journal.close()
+    
+    def test_status_change_survives_restart(self, directory):
+        """Happy Path: A defective station is still defective after restart"""
+        repository, journal, _ = self.start(directory)
+        station = repository.find_by_id(StationId("STATION-002"))
+        station.mark_as_defective()
+        repository.save(station)
+        journal.close()
+        
+        recovered, journal, replayed = self.start(directory)
+        
+        assert replayed == 1
+        assert recovered.find_by_id(StationId("STATION-002")).status == StationStatus.DEFECTIVE
+        assert recovered.count_by_status()[StationStatus.DEFECTIVE] == 1
+        journal.close()
+    
+    def test_transition_status_is_journaled(self, directory):
+        """Happy Path: Only the stations a transition moved are journaled and recovered"""
+        repository, journal, _ = self.start(directory)
+        moved = repository.transition_status(
+            [StationId("STATION-001"), StationId("STATION-404")],
+            {StationStatus.AVAILABLE, StationStatus.IN_USE},
+            StationStatus.DEFECTIVE
+        )
+        journal.close()
+        
+        recovered, journal, replayed = self.start(directory)
+        
+        assert moved == {StationId("STATION-001")}
+        assert replayed == 1
+        assert recovered.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+        journal.close()
+    
+    def test_repair_after_restart_is_journaled(self, directory):
+        """Happy Path: Recovered statuses are the baseline for the next transition"""
+        repository, journal, _ = self.start(directory)
+        station = repository.find_by_id(StationId("STATION-001"))
+        station.mark_as_defective()
+        repository.save(station)
+        journal.close()
+        
+        repository, journal, _ = self.start(directory)
+        station = repository.find_by_id(StationId("STATION-001"))
+        station.mark_as_available()
+        repository.save(station)
+        journal.close()
+        
+        recovered, journal, _ = self.start(directory)
+        assert recovered.find_by_id(StationId("STATION-001")).status == StationStatus.AVAILABLE
+        journal.close()
+    
+    def test_snapshots_bound_replay(self, directory):
+        """Happy Path: Recovery replays only the events since the last snapshot"""
+        repository, journal, _ = self.start(directory, snapshot_every=2)
+        station = repository.find_by_id(StationId("STATION-003"))
+        for _ in range(3):
+            station.mark_as_defective()
+            repository.save(station)
+            station.mark_as_available()
+            repository.save(station)
+        station.mark_as_defective()
+        repository.save(station)
+        journal.close()
+        
+        recovered, journal, replayed = self.start(directory, snapshot_every=2)
+        
+        assert replayed == 1
+        assert recovered.find_by_id(StationId("STATION-003")).status == StationStatus.DEFECTIVE
+        journal.close()
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_invalid_snapshot_interval_raises_error(self, directory):
+        """Error Scenario: Snapshot interval must be positive"""
+        with pytest.raises(ValueError, match="Snapshot interval must be positive"):
+            JournaledStationRepository(InMemoryStationRepository(), EventJournal(directory), 0)
@@ -1,6 +1,36 @@
 """Tests for LadesaeulenregisterLoader"""
 import pytest
-from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import (
+    LadesaeulenregisterLoader,
+    build_stations,
+    dedupe_locations,
+    filter_region,
+    normalize_rows,
+    parse_records_parallel,
+    read_rows,
+    read_rows_prefiltered,
+    split_record_ranges,
+)
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.shared_kernel.common.region import BAYERN, BERLIN, MUENCHEN
+
+
+SAMPLE_CSV = (
+    "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad\n"
+    "Stromnetz Berlin;Karl-Marx-Allee;1;10178;Berlin;Berlin;52,5219;13,4132\n"
+    "Stadtwerke München;Marienplatz;8;80331;München;Bayern;48,1374;11,5755\n"
+    "Stromnetz Berlin;Karl-Marx-Allee;1;10178;Berlin;Berlin;52,5219;13,4132\n"
+    ";Oranienstraße;5;10999;Berlin;Berlin;;\n"
+    "Allego;Kantstraße;12;;Berlin;Berlin;52,50;13,30\n"
+)
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    """Write a small register file covering filtering, dedupe and bad rows"""
+    path = tmp_path / "Ladesaeulenregister.csv"
+    path.write_text(SAMPLE_CSV, encoding="utf-8")
+    return path
 
 
 class TestLadesaeulenregisterLoader:
@@ -93,4 +123,224 @@ class TestLadesaeulenregisterLoader:
         for station in stations:
             assert station.name, f"Station {station.station_id.value} has empty name"
             assert len(station.name) > 0
-            assert len(station.name) <= 100  # Should be truncated if too long
\ No newline at end of file
+            assert len(station.name) <= 100  # Should be truncated if too long
+
+
+class TestIngestionPipeline:
+    """Test suite for the streaming ingestion stages"""
+    
+    def test_stream_berlin_stations(self, sample_csv):
+        """Test the composed pipeline filters, dedupes and numbers stations"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        stations = list(loader.stream_berlin_stations())
+        
+        assert [s.station_id.value for s in stations] == [
+            "BERLIN-10178-0001",
+            "BERLIN-10999-0002",
+        ]
+        assert stations[0].address == "Karl-Marx-Allee 1"
+        assert stations[0].latitude == pytest.approx(52.5219)
+        assert stations[1].name == "Station 10999"
+        assert stations[1].latitude is None
+    
+    def test_stream_is_lazy(self, sample_csv):
+        """Test stations are produced one at a time rather than as a list"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        stream = loader.stream_berlin_stations()
+        
+        assert not isinstance(stream, list)
+        assert next(stream).station_id.value == "BERLIN-10178-0001"
+    
+    def test_load_into_repository(self, sample_csv):
+        """Test streaming straight into a repository via bulk upsert"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        repository = InMemoryStationRepository()
+        
+        count = loader.load_into(repository)
+        
+        assert count == 2
+        assert repository.count() == 2
+        assert len(repository.find_by_postal_code("10178")) == 1
+    
+    def test_list_api_matches_stream(self, sample_csv):
+        """Test load_berlin_stations stays a thin wrapper over the stream"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        
+        listed = [s.station_id for s in loader.load_berlin_stations()]
+        streamed = [s.station_id for s in loader.stream_berlin_stations()]
+        
+        assert listed == streamed
+    
+    def test_stages_compose_on_plain_iterables(self):
+        """Test stages work on any iterable of rows, not only CSV readers"""
+        rows = [
+            {"Ort": "Berlin", "Postleitzahl": "10115", "Straße": "A", "Hausnummer": "1", "Betreiber": "X"},
+            {"Ort": "Hamburg", "Postleitzahl": "20095", "Straße": "B", "Hausnummer": "2", "Betreiber": "Y"},
+        ]
+        
+        stations = list(build_stations(dedupe_locations(normalize_rows(filter_region(rows)))))
+        
+        assert len(stations) == 1
+        assert stations[0].station_id.value == "BERLIN-10115-0001"
+    
+    def test_rows_the_entity_rejects_are_skipped(self):
+        """Test a row failing station validation is skipped without using up an ID"""
+        rows = [
+            {"Ort": "Berlin", "Postleitzahl": "1" * 60, "Straße": "A", "Hausnummer": "1", "Betreiber": "X"},
+            {"Ort": "Berlin", "Postleitzahl": "10115", "Straße": "B", "Hausnummer": "2", "Betreiber": "Y"},
+        ]
+        
+        stations = list(build_stations(dedupe_locations(normalize_rows(filter_region(rows)))))
+        
+        assert [s.station_id.value for s in stations] == ["BERLIN-10115-0001"]
+    
+    def test_stream_region_stations(self, sample_csv):
+        """Test other regions are streamed with their own ID prefix"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        
+        munich = [s.station_id.value for s in loader.stream_region_stations(MUENCHEN)]
+        bavaria = [s.station_id.value for s in loader.stream_region_stations(BAYERN)]
+        
+        assert munich == ["MUENCHEN-80331-0001"]
+        assert bavaria == ["BY-80331-0001"]
+    
+    def test_berlin_region_matches_berlin_stream(self, sample_csv):
+        """Test the Berlin region keeps the historical BERLIN- IDs"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        
+        by_region = [s.station_id for s in loader.stream_region_stations(BERLIN)]
+        by_city = [s.station_id for s in loader.stream_berlin_stations()]
+        
+        assert by_region == by_city
+    
+    def test_get_summary_from_stream(self, sample_csv):
+        """Test summary statistics are computed while streaming"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv)
+        summary = loader.get_summary()
+        
+        assert summary['total_berlin_stations'] == 2
+        assert summary['stations_per_postal_code'] == {"10178": 1, "10999": 1}
+        assert summary['stations_with_coordinates'] == 1
+        assert summary['coverage_percentage'] == 50.0
+
+
+QUOTED_CSV = (
+    'Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad\n'
+    '"Stromnetz\nBerlin GmbH";Karl-Marx-Allee;1;10178;Berlin;Berlin;52,5219;13,4132\n'
+    '"SWM ""Berliner Platz""";"Berliner\nPlatz";8;80331;München;Bayern;48,1374;11,5755\n'
+    'EnBW;"Hauptstraße\n(Hinterhof ""A"")";3;70173;Stuttgart;Baden-Württemberg;48,77;9,18\n'
+    'Allego;"Kant\nstraße";12;10623;Berlin;Berlin;52,5058;13,3226\n'
+    'Tesla;Alexanderplatz;2;10178;Berlin;Berlin;52,52;13,41'
+)
+
+
+class TestPrefilterFastPath:
+    """Test suite for the memory-mapped byte-level prefilter"""
+    
+    @pytest.fixture
+    def quoted_csv(self, tmp_path):
+        path = tmp_path / "quoted.csv"
+        path.write_text(QUOTED_CSV, encoding="utf-8")
+        return path
+    
+    def test_prefiltered_rows_keep_multiline_fields(self, quoted_csv):
+        """Test quoted fields spanning lines survive the byte-level split"""
+        rows = list(read_rows_prefiltered(quoted_csv, "Berlin"))
+        
+        assert [row['Postleitzahl'] for row in rows] == ["10178", "80331", "10623", "10178"]
+        assert rows[0]['Betreiber'] == "Stromnetz\nBerlin GmbH"
+        assert rows[1]['Betreiber'] == 'SWM "Berliner Platz"'
+        assert rows[2]['Straße'] == "Kant\nstraße"
+    
+    def test_prefilter_skips_records_without_needle(self, quoted_csv):
+        """Test records that never mention the needle are never parsed"""
+        rows = list(read_rows_prefiltered(quoted_csv, "Berlin"))
+        
+        assert all(row['Ort'] != "Stuttgart" for row in rows)
+    
+    def test_prefilter_keeps_every_region_row(self, quoted_csv):
+        """Test the fast path is a superset of the region filter"""
+        fast = list(filter_region(read_rows_prefiltered(quoted_csv, "Berlin")))
+        slow = list(filter_region(read_rows(quoted_csv)))
+        
+        assert fast == slow
+    
+    def test_both_paths_build_identical_stations(self, quoted_csv):
+        """Test station IDs and fields match the full-parse path exactly"""
+        def snapshot(loader):
+            return [
+                (s.station_id, s.name, s.postal_code, s.address, s.latitude, s.longitude)
+                for s in loader.stream_berlin_stations()
+            ]
+        
+        fast = snapshot(LadesaeulenregisterLoader(csv_path=quoted_csv, use_prefilter=True))
+        slow = snapshot(LadesaeulenregisterLoader(csv_path=quoted_csv, use_prefilter=False))
+        
+        assert fast == slow
+        assert len(fast) == 3
+    
+    def test_empty_file(self, tmp_path):
+        """Test an empty register yields nothing"""
+        path = tmp_path / "empty.csv"
+        path.write_bytes(b"")
+        
+        assert list(read_rows_prefiltered(path, "Berlin")) == []
+
+
+class TestParallelNationalParsing:
+    """Test suite for record-aligned splitting and multi-process parsing"""
+    
+    @pytest.fixture
+    def national_csv(self, tmp_path):
+        """Register with every region, quoted multi-line fields and duplicates"""
+        lines = [QUOTED_CSV.split("\n", 1)[0]]
+        body = QUOTED_CSV.split("\n", 1)[1] + "\n"
+        for i in range(40):
+            lines.append(body.rstrip("\n").replace("10178", f"10{i:03d}"))
+        lines.append(body.rstrip("\n"))  # duplicates of the first block
+        path = tmp_path / "national.csv"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+    
+    def test_ranges_are_contiguous_and_record_aligned(self, national_csv):
+        """Test ranges tile the body and never split a quoted record"""
+        header, delimiter, ranges = split_record_ranges(national_csv, parts=37)
+        
+        assert header[0] == "Betreiber"
+        assert delimiter == ";"
+        assert len(ranges) > 1
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert end == next_start
+        assert ranges[-1][1] == national_csv.stat().st_size
+        
+        raw = national_csv.read_bytes()
+        for start, end in ranges:
+            assert raw[start:end].count(b'"') % 2 == 0
+    
+    def test_parallel_records_match_single_process(self, national_csv):
+        """Test merged worker output equals a single-process parse, in order"""
+        sequential = list(dedupe_locations(normalize_rows(read_rows(national_csv))))
+        parallel = list(dedupe_locations(parse_records_parallel(national_csv, workers=3, chunks_per_worker=5)))
+        
+        assert parallel == sequential
+    
+    def test_parallel_station_ids_match_single_process(self, national_csv):
+        """Test national IDs are identical whatever the worker count"""
+        loader = LadesaeulenregisterLoader(csv_path=national_csv)
+        
+        single = [(s.station_id, s.postal_code, s.address) for s in loader.stream_national_stations(workers=1)]
+        multi = [(s.station_id, s.postal_code, s.address) for s in loader.stream_national_stations(workers=4)]
+        
+        assert multi == single
+        assert single[0][0].value == "DE-10000-0001"
+        assert {pc for _, pc, _ in single} >= {"80331", "70173"}
+    
+    def test_load_national_into_repository(self, national_csv):
+        """Test national ingestion streams into a repository"""
+        loader = LadesaeulenregisterLoader(csv_path=national_csv)
+        repository = InMemoryStationRepository()
+        
+        count = loader.load_national_into(repository, workers=2)
+        
+        # two varying locations per block (41 distinct postal codes) + three shared ones
+        assert count == repository.count() == 41 * 2 + 3
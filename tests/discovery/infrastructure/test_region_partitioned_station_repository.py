@@ -0,0 +1,186 @@
+"""Tests for the lazily loaded, region-partitioned station repository"""
+import threading
+import time
+
+import pytest
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.region_partitioned_station_repository import (
+    RegionPartitionedStationRepository
+)
+from contexts.shared_kernel.common.region import BAYERN, BERLIN, HAMBURG, MUENCHEN
+from contexts.shared_kernel.common.station_id import StationId
+
+
+# station_id, name, postal_code, latitude, longitude per region key
+PARTITIONS = {
+    "berlin": [
+        ("BERLIN-10178-0001", "Alexanderplatz", "10178", 52.5219, 13.4132),
+        ("BERLIN-10785-0002", "Potsdamer Platz", "10785", 52.5096, 13.3759),
+    ],
+    "hamburg": [
+        ("HAMBURG-20095-0001", "Rathausmarkt", "20095", 53.5503, 9.9920),
+    ],
+    "muenchen": [
+        ("MUENCHEN-80331-0001", "Marienplatz", "80331", 48.1374, 11.5755),
+    ],
+}
+
+
+class TestRegionPartitionedStationRepository:
+    """Test partitions are routed correctly and loaded only on demand"""
+    
+    @pytest.fixture
+    def loads(self):
+        return []
+    
+    @pytest.fixture
+    def repository(self, loads):
+        def load_partition(region):
+            loads.append(region.key)
+            return [
+                OperationalStation(StationId(station_id), name, postal_code, None, latitude, longitude)
+                for station_id, name, postal_code, latitude, longitude in PARTITIONS[region.key]
+            ]
+        
+        return RegionPartitionedStationRepository([BERLIN, HAMBURG, MUENCHEN], load_partition)
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_nothing_loaded_up_front(self, repository, loads):
+        """Happy Path: Constructing the repository reads no partition"""
+        assert loads == []
+        assert repository.loaded_regions == []
+    
+    def test_postal_code_query_loads_only_its_region(self, repository, loads):
+        """Happy Path: A Hamburg postal code only pages in Hamburg"""
+        stations = repository.find_by_postal_code("20095")
+        
+        assert [s.name for s in stations] == ["Rathausmarkt"]
+        assert loads == ["hamburg"]
+    
+    def test_partition_loaded_once(self, repository, loads):
+        """Happy Path: Repeated queries reuse the loaded partition"""
+        repository.find_by_postal_code("10178")
+        repository.find_by_postal_code("10785")
+        
+        assert loads == ["berlin"]
+    
+    def test_find_by_id_routes_by_prefix(self, repository, loads):
+        """Happy Path: Station IDs carry their region's prefix"""
+        station = repository.find_by_id(StationId("MUENCHEN-80331-0001"))
+        
+        assert station.name == "Marienplatz"
+        assert loads == ["muenchen"]
+    
+    def test_find_by_ids_loads_only_the_regions_asked_for(self, repository, loads):
+        """Happy Path: A bulk lookup is routed per region and merged"""
+        found = repository.find_by_ids([
+            StationId("HAMBURG-20095-0001"),
+            StationId("BERLIN-10785-0002"),
+            StationId("WIEN-1010-0001"),
+        ])
+        
+        assert {station.name for station in found.values()} == {"Rathausmarkt", "Potsdamer Platz"}
+        assert sorted(loads) == ["berlin", "hamburg"]
+    
+    def test_find_by_status_covers_loaded_partitions(self, repository):
+        """Happy Path: Status queries merge the partitions loaded so far"""
+        repository.find_by_postal_code("10178")
+        repository.find_by_postal_code("20095")
+        
+        stations = repository.find_by_status(StationStatus.AVAILABLE)
+        
+        assert {s.name for s in stations} == {"Alexanderplatz", "Potsdamer Platz", "Rathausmarkt"}
+    
+    def test_bbox_only_touches_intersecting_regions(self, repository, loads):
+        """Happy Path: A Berlin viewport leaves the other regions unloaded"""
+        stations = repository.find_in_bbox(52.50, 13.30, 52.53, 13.45)
+        
+        assert len(stations) == 2
+        assert loads == ["berlin"]
+    
+    def test_nearest_stops_at_closest_region(self, repository, loads):
+        """Happy Path: Enough hits in Berlin means farther regions are never loaded"""
+        stations = repository.find_nearest(52.52, 13.41, k=1)
+        
+        assert stations[0].name == "Alexanderplatz"
+        assert loads == ["berlin"]
+    
+    def test_nearest_crosses_regions_when_needed(self, repository):
+        """Happy Path: Asking for more stations than a region has spills into the next closest"""
+        stations = repository.find_nearest(52.52, 13.41, k=3)
+        
+        assert [s.name for s in stations] == ["Alexanderplatz", "Potsdamer Platz", "Rathausmarkt"]
+    
+    def test_save_updates_its_partition(self, repository):
+        """Happy Path: Saves land in the partition the station belongs to"""
+        station = repository.find_by_id(StationId("BERLIN-10178-0001"))
+        station.mark_as_defective()
+        repository.save(station)
+        
+        assert repository.count_by_status()[StationStatus.DEFECTIVE] == 1
+    
+    def test_counts_cover_loaded_partitions(self, repository):
+        """Happy Path: Network-wide counts widen once every partition is loaded"""
+        repository.find_by_postal_code("10178")
+        assert repository.count() == 2
+        
+        repository.load_all()
+        assert repository.count() == 4
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_postal_code_outside_every_region(self, repository, loads):
+        """Edge Case: Unpartitioned postal codes find nothing and load nothing"""
+        assert repository.find_by_postal_code("50667") == []
+        assert loads == []
+    
+    def test_unknown_prefix_not_found(self, repository):
+        """Edge Case: IDs without a known prefix are simply absent"""
+        assert repository.find_by_id(StationId("KOELN-50667-0001")) is None
+        assert not repository.exists(StationId("KOELN-50667-0001"))
+    
+    def test_concurrent_first_queries_load_once(self):
+        """Edge Case: Threads racing to the same unloaded region share one slow load"""
+        loads = []
+        
+        def slow_load(region):
+            loads.append(region.key)
+            time.sleep(0.05)
+            return []
+        
+        repository = RegionPartitionedStationRepository([BERLIN, HAMBURG], slow_load)
+        start = threading.Barrier(8)
+        
+        def query():
+            start.wait()
+            repository.find_by_postal_code("10178")
+        
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert loads == ["berlin"]
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_save_without_partition_raises_error(self, repository):
+        """Error Scenario: A station no region claims cannot be saved"""
+        station = OperationalStation(StationId("KOELN-50667-0001"), "Dom", "50667", None)
+        
+        with pytest.raises(ValueError, match="No partition"):
+            repository.save(station)
+    
+    def test_overlapping_regions_raise_error(self):
+        """Error Scenario: Regions sharing postal codes would load stations twice"""
+        with pytest.raises(ValueError, match="muenchen and bayern have overlapping"):
+            RegionPartitionedStationRepository([BERLIN, MUENCHEN, BAYERN], lambda region: [])
+    
+    def test_requires_regions(self):
+        """Error Scenario: A partitioned repository needs at least one region"""
+        with pytest.raises(ValueError, match="At least one region"):
+            RegionPartitionedStationRepository([], lambda region: [])
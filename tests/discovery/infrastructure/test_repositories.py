@@ -1,7 +1,9 @@
 import pytest
 from contexts.discovery.domain.entities.operational_station import OperationalStation
 from contexts.shared_kernel.common.station_id import StationId
+from contexts.discovery.domain.value_objects.station_status import StationStatus
 from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import SqliteStationRepository
 
 
 class TestInMemoryStationRepository:
@@ -35,6 +37,58 @@ class TestInMemoryStationRepository:
         found = repository.find_by_id(StationId("NONEXISTENT"))
         assert found is None
     
+    def test_find_by_ids_returns_known_stations_in_one_call(self, repository):
+        """Test bulk lookup keys found stations by id and leaves unknown ids out"""
+        repository.save_all(
+            OperationalStation(station_id=StationId(f"STATION-{i:03d}"), name=f"Station {i}", postal_code="10178")
+            for i in range(3)
+        )
+        
+        found = repository.find_by_ids([StationId("STATION-002"), StationId("STATION-000"), StationId("NONEXISTENT")])
+        
+        assert set(found) == {StationId("STATION-000"), StationId("STATION-002")}
+        assert found[StationId("STATION-002")].name == "Station 2"
+    
+    def test_find_by_ids_with_no_ids(self, repository, sample_station):
+        """Test an empty bulk lookup returns an empty dict"""
+        repository.save(sample_station)
+        assert repository.find_by_ids([]) == {}
+    
+    def test_find_by_status_follows_transitions(self, repository, sample_station):
+        """Test a station moves between status queries as its status is saved"""
+        repository.save(sample_station)
+        repository.save(OperationalStation(station_id=StationId("STATION-002"), name="Other", postal_code="10178"))
+        
+        assert len(repository.find_by_status(StationStatus.AVAILABLE)) == 2
+        assert repository.find_by_status(StationStatus.DEFECTIVE) == []
+        
+        station = repository.find_by_id(sample_station.station_id)
+        station.mark_as_defective()
+        repository.save(station)
+        
+        defective = repository.find_by_status(StationStatus.DEFECTIVE)
+        assert [s.station_id for s in defective] == [sample_station.station_id]
+        assert [s.station_id.value for s in repository.find_by_status(StationStatus.AVAILABLE)] == ["STATION-002"]
+        assert repository.count_by_status()[StationStatus.DEFECTIVE] == 1
+    
+    def test_transition_status_moves_only_matching_stations(self, repository, sample_station):
+        """Test the compare-and-set moves stations in an allowed status and reports which moved"""
+        repository.save(sample_station)
+        defective = OperationalStation(
+            station_id=StationId("STATION-002"), name="Other", postal_code="10178", status=StationStatus.DEFECTIVE
+        )
+        repository.save(defective)
+        operational = {StationStatus.AVAILABLE, StationStatus.IN_USE}
+        
+        moved = repository.transition_status(
+            [sample_station.station_id, defective.station_id, StationId("NONEXISTENT")], operational, StationStatus.DEFECTIVE
+        )
+        
+        assert moved == {sample_station.station_id}
+        assert repository.find_by_id(sample_station.station_id).status == StationStatus.DEFECTIVE
+        assert repository.count_by_status()[StationStatus.DEFECTIVE] == 2
+        assert repository.transition_status([sample_station.station_id], operational, StationStatus.DEFECTIVE) == set()
+    
     def test_exists_returns_true_for_saved_station(self, repository, sample_station):
         """Test exists method returns True for saved station"""
         repository.save(sample_station)
@@ -66,4 +120,134 @@ class TestInMemoryStationRepository:
         stations_10178 = repository.find_by_postal_code("10178")
         
         assert len(stations_10178) == 2
-        assert all(s.postal_code == "10178" for s in stations_10178)
\ No newline at end of file
+        assert all(s.postal_code == "10178" for s in stations_10178)
+    
+    def test_find_by_postal_code_preserves_insertion_order(self, repository):
+        """Test postal code lookups return stations in a stable order"""
+        for i in range(1, 6):
+            repository.save(OperationalStation(
+                station_id=StationId(f"STATION-00{i}"),
+                name=f"Station {i}",
+                postal_code="10178"
+            ))
+        
+        ids = [s.station_id.value for s in repository.find_by_postal_code("10178")]
+        
+        assert ids == [f"STATION-00{i}" for i in range(1, 6)]
+    
+    def test_resave_with_new_postal_code_moves_station(self, repository, sample_station):
+        """Test re-saving a station under a different postal code updates the index"""
+        repository.save(sample_station)
+        moved = OperationalStation(
+            station_id=sample_station.station_id,
+            name="Test Station",
+            postal_code="10785"
+        )
+        
+        repository.save(moved)
+        
+        assert repository.find_by_postal_code("10178") == []
+        assert repository.find_by_postal_code("10785") == [moved]
+    
+    def test_resave_same_station_does_not_duplicate(self, repository, sample_station):
+        """Test saving the same station twice keeps a single index entry"""
+        repository.save(sample_station)
+        sample_station.mark_as_defective()
+        repository.save(sample_station)
+        
+        assert repository.find_by_postal_code("10178") == [sample_station]
+    
+    def test_count_by_status_tracks_transitions(self, repository, sample_station):
+        """Test status counters follow status changes across saves"""
+        repository.save(sample_station)
+        assert repository.count() == 1
+        assert repository.count_by_status()[StationStatus.AVAILABLE] == 1
+        
+        sample_station.mark_as_defective()
+        repository.save(sample_station)
+        counts = repository.count_by_status()
+        assert counts[StationStatus.AVAILABLE] == 0
+        assert counts[StationStatus.DEFECTIVE] == 1
+        
+        sample_station.mark_as_available()
+        repository.save(sample_station)
+        counts = repository.count_by_status()
+        assert counts[StationStatus.AVAILABLE] == 1
+        assert counts[StationStatus.DEFECTIVE] == 0
+        assert repository.count() == 1
+    
+    
+    def test_postal_code_version_changes_only_with_the_postal_code(self, repository, sample_station):
+        """Test the change version moves on arrival and status changes, per postal code"""
+        other = OperationalStation(station_id=StationId("STATION-002"), name="Other", postal_code="10785")
+        assert repository.postal_code_version("10178") == 0
+        
+        repository.save(sample_station)
+        repository.save(other)
+        after_load = repository.postal_code_version("10178")
+        other_after_load = repository.postal_code_version("10785")
+        assert after_load > 0
+        
+        repository.save(sample_station)
+        assert repository.postal_code_version("10178") == after_load
+        
+        sample_station.mark_as_defective()
+        repository.save(sample_station)
+        assert repository.postal_code_version("10178") > after_load
+        assert repository.postal_code_version("10785") == other_after_load
+    
+    def test_postal_code_version_changes_when_station_moves(self, repository, sample_station):
+        """Test moving a station changes the version of both postal codes"""
+        repository.save(sample_station)
+        before = repository.postal_code_version("10178")
+        
+        repository.save(OperationalStation(station_id=sample_station.station_id, name="Test Station", postal_code="10785"))
+        
+        assert repository.postal_code_version("10178") > before
+        assert repository.postal_code_version("10785") > 0
+    
+    def test_postal_code_versions_lists_every_postal_code(self, repository, sample_station):
+        """Test the bulk version read matches the per postal code counters"""
+        assert repository.postal_code_versions() == {}
+        
+        repository.save(sample_station)
+        repository.save(OperationalStation(station_id=StationId("STATION-002"), name="Other", postal_code="10785"))
+        
+        assert repository.postal_code_versions() == {
+            "10178": repository.postal_code_version("10178"),
+            "10785": repository.postal_code_version("10785"),
+        }
+
+
+class TestSqliteStationRepository(TestInMemoryStationRepository):
+    """Run the same repository tests against the SQLite implementation"""
+    
+    @pytest.fixture
+    def repository(self):
+        """Create a fresh in-memory database for each test"""
+        repository = SqliteStationRepository()
+        yield repository
+        repository.close()
+    
+    def test_find_by_ids_beyond_one_query(self, repository):
+        """Test lookups larger than one IN list are split and merged"""
+        repository.save_all(
+            OperationalStation(station_id=StationId(f"STATION-{i:04d}"), name=f"Station {i}", postal_code="10178")
+            for i in range(1200)
+        )
+        
+        found = repository.find_by_ids(StationId(f"STATION-{i:04d}") for i in range(0, 1300))
+        
+        assert len(found) == 1200
+    
+    def test_transition_status_sees_other_connections(self, tmp_path):
+        """Test a transition committed through another connection makes the same transition a no-op"""
+        first = SqliteStationRepository(tmp_path / "stations.sqlite3")
+        second = SqliteStationRepository(tmp_path / "stations.sqlite3")
+        first.save(OperationalStation(station_id=StationId("STATION-001"), name="Test Station", postal_code="10178"))
+        operational = {StationStatus.AVAILABLE, StationStatus.IN_USE}
+        
+        assert first.transition_status([StationId("STATION-001")], operational, StationStatus.DEFECTIVE) == {StationId("STATION-001")}
+        assert second.transition_status([StationId("STATION-001")], operational, StationStatus.DEFECTIVE) == set()
+        first.close()
+        second.close()
@@ -0,0 +1,158 @@
+"""Tests for the SQLite station repository beyond the shared repository tests"""
+import sqlite3
+import threading
+
+import pytest
+
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import SqliteStationRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class TestSqliteStationRepository:
+    """Test persistence, indexes and spatial queries of the SQLite repository"""
+    
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        return tmp_path / "stations.sqlite3"
+    
+    @pytest.fixture
+    def repository(self, database_path):
+        repository = SqliteStationRepository(database_path)
+        yield repository
+        repository.close()
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_round_trips_all_fields(self, repository, make_station):
+        """Happy Path: Every station field survives a save and load"""
+        station = make_station(1)
+        station.mark_as_defective()
+        repository.save(station)
+        
+        found = repository.find_by_id(StationId("STATION-001"))
+        
+        assert found.name == "Station 1"
+        assert found.address == "Teststraße 1"
+        assert found.latitude == pytest.approx(52.52)
+        assert found.status == StationStatus.DEFECTIVE
+    
+    def test_status_survives_restart(self, repository, database_path, make_station):
+        """Happy Path: Status changes are durable across connections"""
+        station = make_station(1)
+        repository.save(station)
+        station.mark_as_defective()
+        repository.save(station)
+        repository.close()
+        
+        reopened = SqliteStationRepository(database_path)
+        try:
+            assert reopened.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+            assert reopened.count_by_status()[StationStatus.DEFECTIVE] == 1
+        finally:
+            reopened.close()
+    
+    def test_runs_in_wal_mode(self, repository, database_path):
+        """Happy Path: File databases use write-ahead logging"""
+        connection = sqlite3.connect(database_path)
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            connection.close()
+    
+    def test_save_all_is_one_transaction(self, repository, make_station):
+        """Happy Path: A failing bulk load leaves nothing behind"""
+        def stations():
+            yield make_station(1)
+            yield make_station(2)
+            raise RuntimeError("register read failed")
+        
+        with pytest.raises(RuntimeError):
+            repository.save_all(stations())
+        
+        assert repository.count() == 0
+    
+    def test_queries_use_indexes(self, repository):
+        """Happy Path: Postal code and status lookups hit their indexes"""
+        with repository._connections.read() as connection:
+            postal_plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM stations WHERE postal_code = ?", ("10178",)
+            ).fetchall()
+            status_plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT status, COUNT(*) FROM stations GROUP BY status"
+            ).fetchall()
+        
+        assert "idx_stations_postal_code" in str(postal_plan)
+        assert "idx_stations_status" in str(status_plan)
+    
+    def test_nearest_orders_by_distance(self, repository, make_station):
+        """Happy Path: Nearest stations come back closest first"""
+        repository.save_all([
+            make_station(1, latitude=52.5300, longitude=13.4100),
+            make_station(2, latitude=52.5210, longitude=13.4100),
+            make_station(3, latitude=52.6000, longitude=13.4100),
+        ])
+        
+        nearest = repository.find_nearest(52.52, 13.41, k=2)
+        
+        assert [s.station_id.value for s in nearest] == ["STATION-002", "STATION-001"]
+    
+    def test_nearest_filters_by_status(self, repository, make_station):
+        """Happy Path: A status filter skips closer stations in other states"""
+        defective = make_station(1, latitude=52.5201, longitude=13.4100)
+        defective.mark_as_defective()
+        repository.save_all([defective, make_station(2, latitude=52.70, longitude=13.41)])
+        
+        nearest = repository.find_nearest(52.52, 13.41, k=1, status=StationStatus.AVAILABLE)
+        
+        assert [s.station_id.value for s in nearest] == ["STATION-002"]
+    
+    def test_within_radius_and_bbox(self, repository, make_station):
+        """Happy Path: Radius and viewport queries go through the R*Tree"""
+        repository.save_all([
+            make_station(1, latitude=52.5200, longitude=13.4050),
+            make_station(2, latitude=52.5300, longitude=13.4050),
+            make_station(3, latitude=48.1374, longitude=11.5755),
+        ])
+        
+        within = repository.find_within_radius(52.52, 13.405, 1_200)
+        in_box = repository.find_in_bbox(52.0, 13.0, 53.0, 14.0)
+        
+        assert [s.station_id.value for s in within] == ["STATION-001", "STATION-002"]
+        assert [s.station_id.value for s in in_box] == ["STATION-001", "STATION-002"]
+    
+    def test_moving_station_updates_spatial_index(self, repository, make_station):
+        """Happy Path: Re-saving with new coordinates moves the R*Tree entry"""
+        repository.save(make_station(1, latitude=52.52, longitude=13.41))
+        repository.save(make_station(1, latitude=48.1374, longitude=11.5755))
+        
+        assert repository.find_in_bbox(52.0, 13.0, 53.0, 14.0) == []
+        assert len(repository.find_in_bbox(48.0, 11.0, 49.0, 12.0)) == 1
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_station_without_coordinates_not_in_spatial_results(self, repository, make_station):
+        """Edge Case: Stations without coordinates are stored but never located"""
+        repository.save(make_station(1, latitude=None, longitude=None))
+        
+        assert repository.count() == 1
+        assert repository.find_nearest(52.52, 13.41, k=1) == []
+    
+    def test_threads_that_exit_do_not_leak_connections(self, repository, make_station):
+        """Edge Case: One query from each of many short-lived threads keeps the reader count bounded"""
+        repository.save(make_station(1))
+        counts = []
+        
+        for _ in range(300):
+            thread = threading.Thread(target=lambda: counts.append(repository.count()))
+            thread.start()
+            thread.join()
+        
+        assert counts == [1] * 300
+        assert repository._connections.open_readers == 1
+    
+    def test_bbox_limit(self, repository, make_station):
+        """Edge Case: Viewport queries honour the limit"""
+        repository.save_all(make_station(i, latitude=52.5 + i / 1000) for i in range(10))
+        
+        assert len(repository.find_in_bbox(52.0, 13.0, 53.0, 14.0, limit=3)) == 3
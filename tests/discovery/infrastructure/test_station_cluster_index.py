@@ -0,0 +1,162 @@
+"""Tests for the zoom-level station cluster index"""
+import random
+import pytest
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.cluster_indexed_station_repository import ClusterIndexedStationRepository
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import SqliteStationRepository
+from contexts.discovery.infrastructure.spatial.station_cluster_index import GridStationClusterIndex
+from contexts.shared_kernel.common.station_id import StationId
+
+
+WORLD = (-85.0, -180.0, 85.0, 180.0)
+BERLIN = (52.33, 13.08, 52.68, 13.77)
+
+
+@pytest.fixture
+def berlin_stations(make_station):
+    """Random stations scattered over the Berlin area"""
+    rng = random.Random(7)
+    return [make_station(i, rng.uniform(52.35, 52.65), rng.uniform(13.1, 13.75)) for i in range(500)]
+
+
+@pytest.fixture
+def index(berlin_stations):
+    index = GridStationClusterIndex()
+    index.rebuild(berlin_stations)
+    return index
+
+
+class TestGridStationClusterIndex:
+    """Test suite for cluster hierarchy construction, queries and updates"""
+    
+    def test_every_level_accounts_for_every_station(self, index):
+        """Test each zoom level partitions all stations into clusters"""
+        for zoom in index.zoom_levels:
+            clusters = index.clusters(zoom, *WORLD)
+            assert sum(cluster.count for cluster in clusters) == 500
+    
+    def test_city_collapses_at_low_zoom_and_splits_when_zooming_in(self, index):
+        """Test the overview is a handful of clusters and zooming in refines them"""
+        assert len(index.clusters(3, *BERLIN)) == 1
+        assert len(index.clusters(11, *BERLIN)) < len(index.clusters(14, *BERLIN))
+        assert all(cluster.is_single_station for cluster in index.clusters(18, *BERLIN))
+    
+    def test_levels_nest(self, index):
+        """Test every cluster at zoom z+1 lies inside exactly one cluster at zoom z"""
+        coarse = index.clusters(10, *WORLD)
+        fine = index.clusters(11, *WORLD)
+        
+        assert len(fine) >= len(coarse)
+        assert sum(c.count for c in fine) == sum(c.count for c in coarse)
+    
+    def test_single_station_cluster_sits_on_the_station(self, index, berlin_stations):
+        """Test a cluster of one carries the station id and exact position"""
+        station = berlin_stations[0]
+        singles = [c for c in index.clusters(18, *BERLIN) if c.station_id == station.station_id.value]
+        
+        assert len(singles) == 1
+        assert (singles[0].latitude, singles[0].longitude) == (station.latitude, station.longitude)
+    
+    def test_status_change_updates_counts_at_every_level(self, index, berlin_stations):
+        """Test marking a station defective moves one count on every zoom level"""
+        station = berlin_stations[10]
+        station.mark_as_defective()
+        index.upsert(station)
+        
+        for zoom in index.zoom_levels:
+            clusters = index.clusters(zoom, *WORLD)
+            assert sum(c.defective for c in clusters) == 1
+            assert sum(c.available for c in clusters) == 499
+    
+    def test_move_and_remove(self, index, berlin_stations, make_station):
+        """Test moving a station relocates it and removing drops it everywhere"""
+        station = berlin_stations[0]
+        moved = make_station(0, 48.137, 11.575)  # Munich
+        index.upsert(moved)
+        
+        assert sum(c.count for c in index.clusters(12, 48.0, 11.4, 48.3, 11.8)) == 1
+        assert sum(c.count for c in index.clusters(12, *BERLIN)) == 499
+        
+        index.remove(station.station_id)
+        
+        assert len(index) == 499
+        assert index.clusters(12, 48.0, 11.4, 48.3, 11.8) == []
+    
+    def test_viewport_only_returns_overlapping_cells(self, index):
+        """Test a small viewport returns fewer stations than the whole city"""
+        center = index.clusters(14, 52.50, 13.38, 52.53, 13.43)
+        
+        assert 0 < sum(c.count for c in center) < 500
+    
+    def test_stations_without_coordinates_are_not_clustered(self, make_station):
+        """Test stations lacking GPS data are skipped"""
+        index = GridStationClusterIndex()
+        
+        assert index.rebuild([make_station(1, None, None), make_station(2, 52.5, 13.4)]) == 1
+    
+    def test_invalid_zoom_range_raises_error(self):
+        """Test an inverted zoom range is rejected"""
+        with pytest.raises(ValueError, match="Zoom range"):
+            GridStationClusterIndex(min_zoom=5, max_zoom=4)
+
+
+class TestClusterIndexedStationRepository:
+    """Test the repository decorator keeps its index in step with saves"""
+    
+    def test_saves_update_the_index(self, berlin_stations):
+        """Test bulk loads and single saves both reach the index"""
+        index = GridStationClusterIndex()
+        repository = ClusterIndexedStationRepository(InMemoryStationRepository(), index)
+        
+        assert repository.save_all(berlin_stations) == 500
+        assert len(index) == 500
+        
+        station = repository.find_by_id(StationId("STATION-003"))
+        station.mark_as_defective()
+        repository.save(station)
+        
+        assert sum(c.defective for c in index.clusters(0, *WORLD)) == 1
+    
+    def test_build_index_covers_stations_saved_before_wrapping(self, berlin_stations):
+        """Test build_index picks up stations already in the wrapped repository"""
+        inner = InMemoryStationRepository()
+        inner.save_all(berlin_stations)
+        repository = ClusterIndexedStationRepository(inner, GridStationClusterIndex())
+        
+        assert repository.build_index() == 500
+        assert sum(c.count for c in repository.cluster_index.clusters(5, *WORLD)) == 500
+    
+    def test_failed_bulk_save_leaves_the_index_alone(self, berlin_stations):
+        """Test stations reach the index only after the wrapped repository committed them"""
+        class FailingRepository(InMemoryStationRepository):
+            def save_all(self, stations):
+                list(stations)
+                raise RuntimeError("disk full")
+        
+        index = GridStationClusterIndex()
+        repository = ClusterIndexedStationRepository(FailingRepository(), index)
+        
+        with pytest.raises(RuntimeError):
+            repository.save_all(berlin_stations)
+        assert len(index) == 0
+    
+    def test_refresh_picks_up_changes_from_another_process(self, berlin_stations, tmp_path):
+        """Test refresh re-indexes the postal codes another writer changed in the shared store"""
+        database_path = tmp_path / "stations.sqlite3"
+        other_process = SqliteStationRepository(database_path)
+        other_process.save_all(berlin_stations)
+        repository = ClusterIndexedStationRepository(SqliteStationRepository(database_path), GridStationClusterIndex())
+        repository.build_index()
+        
+        assert repository.refresh() == 0
+        
+        changed = other_process.find_by_id(StationId("STATION-003"))
+        other_process.transition_status([changed.station_id], {StationStatus.AVAILABLE}, StationStatus.DEFECTIVE)
+        
+        refreshed = repository.refresh()
+        
+        assert refreshed == len(other_process.find_by_postal_code(changed.postal_code))
+        assert sum(c.defective for c in repository.cluster_index.clusters(0, *WORLD)) == 1
+        assert repository.refresh() == 0
+        other_process.close()
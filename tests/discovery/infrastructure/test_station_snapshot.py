@@ -0,0 +1,101 @@
+"""Tests for the binary station snapshot cache"""
+import os
+import pytest
+from contexts.discovery.infrastructure.data.ladesaeulenregister_loader import LadesaeulenregisterLoader
+from contexts.discovery.infrastructure.data.station_snapshot import StationSnapshotCache
+
+
+SAMPLE_CSV = (
+    "Betreiber;Straße;Hausnummer;Postleitzahl;Ort;Bundesland;Breitengrad;Längengrad\n"
+    "Stromnetz Berlin;Karl-Marx-Allee;1;10178;Berlin;Berlin;52,5219;13,4132\n"
+    "Allego;Kantstraße;12;10623;Berlin;Berlin;52,5058;13,3226\n"
+    "Allego;Kantstraße;14;10623;Berlin;Berlin;;\n"
+)
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    path = tmp_path / "Ladesaeulenregister.csv"
+    path.write_text(SAMPLE_CSV, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StationSnapshotCache(tmp_path / "stations.snapshot")
+
+
+class TestStationSnapshotCache:
+    """Test suite for snapshot creation, reuse and invalidation"""
+    
+    def test_first_load_writes_snapshot(self, sample_csv, cache):
+        """Test consuming the stream once leaves a snapshot behind"""
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache)
+        
+        stations = loader.load_berlin_stations()
+        
+        assert len(stations) == 3
+        assert cache.snapshot_path.exists()
+        assert cache.load(sample_csv) is not None
+    
+    def test_snapshot_round_trips_stations(self, sample_csv, cache):
+        """Test stations rebuilt from the snapshot match a fresh parse"""
+        parsed = LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        cached = list(cache.load(sample_csv).stations())
+        
+        assert [(s.station_id, s.name, s.postal_code, s.address, s.latitude, s.longitude) for s in cached] == \
+            [(s.station_id, s.name, s.postal_code, s.address, s.latitude, s.longitude) for s in parsed]
+    
+    def test_snapshot_used_instead_of_csv(self, sample_csv, cache, monkeypatch):
+        """Test a fresh snapshot skips CSV parsing entirely"""
+        LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        
+        loader = LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache)
+        monkeypatch.setattr(loader, "_parse_berlin_stations", lambda: pytest.fail("CSV was re-parsed"))
+        
+        assert len(loader.load_berlin_stations()) == 3
+        assert loader.get_summary()['stations_per_postal_code'] == {"10178": 1, "10623": 2}
+    
+    def test_snapshot_indexes_postal_codes(self, sample_csv, cache):
+        """Test the snapshot stores the derived postal code index"""
+        snapshot = LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_snapshot()
+        
+        assert snapshot.postal_code_index == {"10178": [0], "10623": [1, 2]}
+        assert snapshot.stations_with_coordinates == 2
+    
+    def test_changed_source_invalidates_snapshot(self, sample_csv, cache):
+        """Test editing the CSV falls back to a full parse"""
+        LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        
+        sample_csv.write_text(SAMPLE_CSV + "EnBW;Unter den Linden;1;10117;Berlin;Berlin;52,51;13,38\n", encoding="utf-8")
+        
+        assert cache.load(sample_csv) is None
+        stations = LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        assert len(stations) == 4
+        assert len(cache.load(sample_csv).rows) == 4
+    
+    def test_same_size_edit_detected_by_hash(self, sample_csv, cache):
+        """Test an edit that keeps the file size is caught by the content hash"""
+        LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        
+        sample_csv.write_text(SAMPLE_CSV.replace("10178", "10179"), encoding="utf-8")
+        stat = sample_csv.stat()
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert cache.load(sample_csv) is None
+    
+    def test_touch_without_change_keeps_snapshot(self, sample_csv, cache):
+        """Test a new mtime with identical content still reuses the snapshot"""
+        LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()
+        
+        stat = sample_csv.stat()
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert cache.load(sample_csv) is not None
+    
+    def test_corrupt_snapshot_is_ignored(self, sample_csv, cache):
+        """Test a damaged snapshot file is treated as a cache miss"""
+        cache.snapshot_path.write_bytes(b"not a snapshot")
+        
+        assert cache.load(sample_csv) is None
+        assert len(LadesaeulenregisterLoader(csv_path=sample_csv, snapshot_cache=cache).load_berlin_stations()) == 3
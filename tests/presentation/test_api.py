@@ -0,0 +1,213 @@
+"""Tests for the headless JSON API"""
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+from presentation.api import ApiServer, build_api
+
+
+REPORT = {
+    "station_id": "STATION-001",
+    "malfunction_type": "not_charging",
+    "description": "The charging station does not deliver power.",
+}
+
+
+@pytest.fixture
+def station_repo():
+    repository = InMemoryStationRepository()
+    for i in range(3):
+        repository.save(OperationalStation(
+            station_id=StationId(f"STATION-{i:03d}"),
+            name=f"Station {i}",
+            postal_code="10178",
+            latitude=52.52 + i * 0.01,
+            longitude=13.40
+        ))
+    return repository
+
+
+@pytest.fixture
+def api(station_repo):
+    service = MalfunctionReportService(InMemoryReportRepository(), station_repo)
+    return build_api(service, station_repo)
+
+
+def call(api, method, target, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return api.handle(method, target, body)
+
+
+class TestJsonApi:
+    """Routing and JSON shaping, without sockets"""
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_search_by_postal_code(self, api):
+        """Happy Path: Stations in a postal code are listed"""
+        status, payload = call(api, "GET", "/stations?postal_code=10178")
+        
+        assert status == 200
+        assert [s["station_id"] for s in payload["stations"]] == ["STATION-000", "STATION-001", "STATION-002"]
+        assert payload["stations"][0]["status"] == "available"
+    
+    def test_nearest_stations(self, api):
+        """Happy Path: Nearest search honours k"""
+        status, payload = call(api, "GET", "/stations/nearest?lat=52.53&lon=13.40&k=1")
+        
+        assert status == 200
+        assert [s["station_id"] for s in payload["stations"]] == ["STATION-001"]
+    
+    def test_report_then_resolve(self, api, station_repo):
+        """Happy Path: A created ticket can be resolved over the API"""
+        status, created = call(api, "POST", "/reports", REPORT)
+        
+        assert status == 201
+        assert created["success"] is True
+        assert call(api, "GET", "/stations/STATION-001")[1]["status"] == "defective"
+        
+        status, resolved = call(api, "POST", f"/tickets/{created['ticket_id']}/resolve", {"operator_notes": "Fixed"})
+        
+        assert status == 200
+        assert resolved["station_id"] == "STATION-001"
+        assert call(api, "GET", "/stations/STATION-001")[1]["status"] == "available"
+    
+    def test_report_batch(self, api):
+        """Happy Path: The batch endpoint answers per item"""
+        other = dict(REPORT, station_id="STATION-002")
+        
+        status, payload = call(api, "POST", "/reports/batch", {"items": [REPORT, other, REPORT]})
+        
+        assert status == 200
+        assert payload["succeeded"] == 2
+        assert payload["coalesced"] == 1
+        assert payload["failed"] == 0
+        assert payload["items"][2]["coalesced"] is True
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_invalid_report_is_unprocessable(self, api):
+        """Error Scenario: Reporting an unknown station fails validation"""
+        status, payload = call(api, "POST", "/reports", dict(REPORT, station_id="STATION-999"))
+        
+        assert status == 422
+        assert payload["success"] is False
+        assert payload["errors"]
+    
+    def test_retried_resolve_leaves_newer_ticket_alone(self, api, station_repo):
+        """Error Scenario: Resolving an old ticket again neither succeeds nor restores the station"""
+        first = call(api, "POST", "/reports", REPORT)[1]
+        assert call(api, "POST", f"/tickets/{first['ticket_id']}/resolve", {})[0] == 200
+        second = call(api, "POST", "/reports", REPORT)[1]
+        assert second["success"] is True
+        
+        status, retried = call(api, "POST", f"/tickets/{first['ticket_id']}/resolve", {})
+        
+        assert status == 422
+        assert "already resolved" in retried["message"]
+        assert call(api, "GET", "/stations/STATION-001")[1]["status"] == "defective"
+        assert call(api, "POST", "/reports", REPORT)[0] == 422
+    
+    @pytest.mark.parametrize("method, target, payload, expected", [
+        ("GET", "/stations", None, 400),
+        ("GET", "/stations?postal_code=99999", None, 400),
+        ("GET", "/stations/nearest?lat=52.5", None, 400),
+        ("GET", "/stations/STATION-999", None, 404),
+        ("GET", "/nowhere", None, 404),
+        ("GET", "/reports", None, 405),
+        ("POST", "/reports", dict(REPORT, malfunction_type="on_fire"), 400),
+        ("POST", "/reports", [REPORT], 400),
+        ("POST", "/reports/batch", {"items": []}, 400),
+    ])
+    def test_bad_requests(self, api, method, target, payload, expected):
+        """Error Scenario: Bad input maps to a 4xx status with an error message"""
+        status, body = call(api, method, target, payload)
+        
+        assert status == expected
+        assert body["error"]
+    
+    def test_malformed_json(self, api):
+        """Error Scenario: A body that is not JSON is rejected"""
+        status, body = api.handle("POST", "/reports", b"{not json")
+        
+        assert status == 400
+        assert "JSON" in body["error"]
+
+
+class TestApiServer:
+    """The HTTP server in front of JsonApi"""
+    
+    @pytest.fixture
+    def server(self, api):
+        server = ApiServer(("127.0.0.1", 0), api)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+    
+    def test_keep_alive_connection_serves_many_requests(self, server):
+        """Happy Path: One HTTP/1.1 connection carries several requests"""
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+        try:
+            for _ in range(3):
+                connection.request("GET", "/health")
+                response = connection.getresponse()
+                assert response.status == 200
+                assert json.loads(response.read()) == {"status": "ok"}
+            
+            connection.request("POST", "/reports", body=json.dumps(REPORT), headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            assert response.status == 201
+            assert json.loads(response.read())["ticket_id"]
+            assert response.version == 11
+        finally:
+            connection.close()
+    
+    def test_concurrent_clients(self, server):
+        """Happy Path: Clients on separate connections are served in parallel"""
+        statuses = []
+        
+        def client():
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+            try:
+                for _ in range(10):
+                    connection.request("GET", "/stations?postal_code=10178")
+                    response = connection.getresponse()
+                    response.read()
+                    statuses.append(response.status)
+            finally:
+                connection.close()
+        
+        threads = [threading.Thread(target=client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert statuses == [200] * 80
+    
+    @pytest.mark.parametrize("headers, expected", [
+        (b"", 411),
+        (b"Content-Length: -1\r\n", 400),
+        (b"Content-Length: ten\r\n", 400),
+        (b"Content-Length: 99999999\r\n", 413),
+    ])
+    def test_bad_content_length_is_rejected_and_closes(self, server, headers, expected):
+        """Error Scenario: A missing, negative, unparseable or huge length is answered at once and the connection closed"""
+        with socket.create_connection(("127.0.0.1", server.server_port), timeout=5) as sock:
+            sock.sendall(b"POST /reports HTTP/1.1\r\nHost: localhost\r\n" + headers + b"\r\n")
+            response = http.client.HTTPResponse(sock)
+            response.begin()
+            
+            assert response.status == expected
+            assert "error" in json.loads(response.read())
+            assert sock.recv(1) == b""
@@ -0,0 +1,67 @@
+"""Tests for the GeoJSON encoding behind the station map"""
+import json
+
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from presentation.station_geojson import (
+    feature_collection_bounds,
+    stations_to_feature_collection,
+    to_script_json,
+)
+
+
+class TestStationsToFeatureCollection:
+    """Test suite for building the single map layer's data"""
+    
+    def test_one_point_feature_per_station_with_status_property(self, make_station):
+        """Test positions are longitude first and status is a plain property"""
+        collection = stations_to_feature_collection([
+            make_station(1, 52.5219, 13.4132),
+            make_station(2, 52.5163, 13.3777, StationStatus.DEFECTIVE),
+        ])
+        
+        assert collection["type"] == "FeatureCollection"
+        first, second = collection["features"]
+        assert first["geometry"] == {"type": "Point", "coordinates": [13.4132, 52.5219]}
+        assert first["properties"]["id"] == "STATION-001"
+        assert second["properties"]["status"] == "defective"
+    
+    def test_stations_without_coordinates_are_left_out(self, make_station):
+        """Test unlocated stations do not produce features"""
+        collection = stations_to_feature_collection([make_station(1), make_station(2, None, None)])
+        
+        assert [f["properties"]["id"] for f in collection["features"]] == ["STATION-001"]
+    
+    def test_coordinates_are_rounded(self, make_station):
+        """Test surplus coordinate digits are dropped from the payload"""
+        collection = stations_to_feature_collection([make_station(1, 52.123456789, 13.987654321)])
+        
+        assert collection["features"][0]["geometry"]["coordinates"] == [13.987654, 52.123457]
+    
+    def test_payload_grows_linearly_and_compactly(self, make_station):
+        """Test each extra station adds one small feature to the embedded JSON"""
+        small = to_script_json(stations_to_feature_collection(make_station(i) for i in range(100)))
+        large = to_script_json(stations_to_feature_collection(make_station(i) for i in range(1000)))
+        
+        assert (len(large) - len(small)) / 900 < 200
+
+
+class TestBoundsAndEmbedding:
+    """Test fitting the map and embedding the data in a script element"""
+    
+    def test_bounds_enclose_every_feature(self, make_station):
+        """Test the bounds are south-west and north-east corners"""
+        collection = stations_to_feature_collection([make_station(1, 52.4, 13.5), make_station(2, 52.6, 13.1)])
+        
+        assert feature_collection_bounds(collection) == [[52.4, 13.1], [52.6, 13.5]]
+    
+    def test_empty_collection_has_no_bounds(self):
+        """Test nothing to fit yields None"""
+        assert feature_collection_bounds(stations_to_feature_collection([])) is None
+    
+    def test_script_json_cannot_close_the_script_element(self, make_station):
+        """Test a hostile station name stays inside the script and round-trips"""
+        collection = stations_to_feature_collection([make_station(1, name="</script><b>x</b>")])
+        encoded = to_script_json(collection)
+        
+        assert "</script>" not in encoded
+        assert json.loads(encoded)["features"][0]["properties"]["name"] == "</script><b>x</b>"
@@ -0,0 +1,215 @@
+"""Tests for the asyncio use cases, service and repository adapters"""
+import asyncio
+
+import pytest
+
+from contexts.discovery.application.use_cases.async_search_stations_use_case import AsyncSearchStationsUseCase
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.threaded_async_station_repository import ThreadedAsyncStationRepository
+from contexts.reporting.application.dtos.create_report_dto import CreateReportRequest
+from contexts.reporting.application.dtos.resolve_report_dto import ResolveReportRequest
+from contexts.reporting.application.use_cases.async_create_malfunction_report_use_case import AsyncCreateMalfunctionReportUseCase
+from contexts.reporting.application.use_cases.async_resolve_malfunction_use_case import AsyncResolveMalfunctionUseCase
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.services.async_malfunction_report_service import AsyncMalfunctionReportService
+from contexts.reporting.domain.services.malfunction_report_service import ReportSubmission
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.infrastructure.repositories.threaded_async_report_repository import ThreadedAsyncReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.event_loop_thread import EventLoopThread, SyncAdapter
+
+
+STATIONS = 20
+
+
+class YieldingStationRepository(ThreadedAsyncStationRepository):
+    """Yields to the loop on every call and returns fresh copies, like a networked backend"""
+    
+    async def _run(self, method, *args):
+        await asyncio.sleep(0)
+        result = method(*args)
+        if isinstance(result, OperationalStation):
+            return copy_station(result)
+        if isinstance(result, dict):
+            return {key: copy_station(station) for key, station in result.items()}
+        return result
+
+
+def copy_station(station: OperationalStation) -> OperationalStation:
+    return OperationalStation(
+        station_id=station.station_id,
+        name=station.name,
+        postal_code=station.postal_code,
+        status=station.status
+    )
+
+
+def report_request(index: int) -> CreateReportRequest:
+    return CreateReportRequest(
+        station_id=f"STATION-{index:03d}",
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description="The charging station does not deliver power."
+    )
+
+
+class TestAsyncUseCases:
+    """Async use cases over thread-offloaded in-memory repositories"""
+    
+    @pytest.fixture
+    def setup(self, make_station):
+        station_repo = InMemoryStationRepository()
+        station_repo.save_all(
+            make_station(i, latitude=52.52 + i * 0.001, longitude=13.40) for i in range(STATIONS)
+        )
+        report_repo = InMemoryReportRepository()
+        service = AsyncMalfunctionReportService(
+            ThreadedAsyncReportRepository(report_repo),
+            ThreadedAsyncStationRepository(station_repo)
+        )
+        return service, station_repo, report_repo
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_create_and_resolve_report(self, setup):
+        """Happy Path: A report is ticketed and resolved through the async use cases"""
+        service, station_repo, _ = setup
+        
+        async def scenario():
+            created = await AsyncCreateMalfunctionReportUseCase(service).execute(report_request(1))
+            defective = station_repo.find_by_id(StationId("STATION-001")).status
+            resolved = await AsyncResolveMalfunctionUseCase(service).execute(ResolveReportRequest(ticket_id=created.ticket_id))
+            return created, defective, resolved
+        
+        created, defective, resolved = asyncio.run(scenario())
+        
+        assert created.success is True
+        assert defective == StationStatus.DEFECTIVE
+        assert resolved.success is True
+        assert resolved.station_id == "STATION-001"
+        assert station_repo.find_by_id(StationId("STATION-001")).status == StationStatus.AVAILABLE
+    
+    def test_concurrent_requests_on_one_loop(self, setup):
+        """Happy Path: Many in-flight requests all complete with one ticket each"""
+        service, _, report_repo = setup
+        use_case = AsyncCreateMalfunctionReportUseCase(service)
+        
+        async def scenario():
+            return await asyncio.gather(*(use_case.execute(report_request(i)) for i in range(STATIONS)))
+        
+        responses = asyncio.run(scenario())
+        
+        assert all(response.success for response in responses)
+        assert len({response.ticket_id for response in responses}) == STATIONS
+        assert report_repo.count_by_status()[ReportStatus.TICKET_CREATED] == STATIONS
+    
+    def test_batch_processing(self, setup):
+        """Happy Path: The async service applies the same batch rules as the sync one"""
+        service, _, report_repo = setup
+        submissions = [
+            ReportSubmission("STATION-001", MalfunctionType.NOT_CHARGING, "Charger does not start."),
+            ReportSubmission("STATION-001", MalfunctionType.NOT_CHARGING, "charger does not start."),
+            ReportSubmission("STATION-002", MalfunctionType.PHYSICAL_DAMAGE, "Cable is torn open."),
+        ]
+        
+        results = asyncio.run(service.process_malfunction_report_batch(submissions))
+        
+        assert [result.success for result in results] == [True, True, True]
+        assert results[1].duplicate is True
+        assert results[1].ticket_id == results[0].ticket_id
+        assert report_repo.count() == 2
+    
+    def test_async_search(self, setup):
+        """Happy Path: The async search use case queries through the adapter"""
+        _, station_repo, _ = setup
+        use_case = AsyncSearchStationsUseCase(ThreadedAsyncStationRepository(station_repo))
+        
+        nearest = asyncio.run(use_case.execute_nearest(52.52, 13.40, k=3))
+        by_postal_code = asyncio.run(use_case.execute_by_postal_code("10178"))
+        
+        assert [station.station_id.value for station in nearest] == ["STATION-000", "STATION-001", "STATION-002"]
+        assert len(by_postal_code) == STATIONS
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_same_station_reports_are_serialized(self, make_station):
+        """Edge Case: Interleaved reports for one station produce exactly one ticket"""
+        station_repo = InMemoryStationRepository()
+        station_repo.save(make_station(1))
+        service = AsyncMalfunctionReportService(
+            ThreadedAsyncReportRepository(InMemoryReportRepository()),
+            YieldingStationRepository(station_repo)
+        )
+        use_case = AsyncCreateMalfunctionReportUseCase(service)
+        
+        async def scenario():
+            return await asyncio.gather(*(use_case.execute(report_request(1)) for _ in range(10)))
+        
+        responses = asyncio.run(scenario())
+        
+        assert sum(response.success for response in responses) == 1
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_unknown_ticket(self, setup):
+        """Error Scenario: Resolving an unknown ticket reports failure"""
+        service, _, _ = setup
+        
+        response = asyncio.run(AsyncResolveMalfunctionUseCase(service).execute(
+            ResolveReportRequest(ticket_id="00000000-0000-0000-0000-000000000000")
+        ))
+        
+        assert response.success is False
+        assert "No report found" in response.message
+    
+    def test_unknown_station_search_raises_error(self, setup):
+        """Error Scenario: Looking up a missing station raises ValueError"""
+        _, station_repo, _ = setup
+        use_case = AsyncSearchStationsUseCase(ThreadedAsyncStationRepository(station_repo))
+        
+        with pytest.raises(ValueError, match="not found"):
+            asyncio.run(use_case.execute_by_id("STATION-999"))
+
+
+class TestSyncAdapter:
+    """The blocking facade the Streamlit UI can use"""
+    
+    @pytest.fixture
+    def loop_thread(self):
+        loop_thread = EventLoopThread()
+        yield loop_thread
+        loop_thread.close()
+    
+    def test_adapter_runs_async_use_case_synchronously(self, loop_thread, make_station):
+        """Happy Path: execute() blocks and returns the response"""
+        station_repo = InMemoryStationRepository()
+        station_repo.save(make_station(1))
+        service = AsyncMalfunctionReportService(
+            ThreadedAsyncReportRepository(InMemoryReportRepository()),
+            ThreadedAsyncStationRepository(station_repo)
+        )
+        use_case = SyncAdapter(AsyncCreateMalfunctionReportUseCase(service), loop_thread)
+        
+        response = use_case.execute(report_request(1))
+        
+        assert response.success is True
+        assert SyncAdapter(service, loop_thread).get_report_counts()[ReportStatus.TICKET_CREATED] == 1
+    
+    def test_adapter_propagates_exceptions(self, loop_thread):
+        """Error Scenario: Exceptions raised by the coroutine reach the caller"""
+        use_case = SyncAdapter(AsyncSearchStationsUseCase(ThreadedAsyncStationRepository(InMemoryStationRepository())), loop_thread)
+        
+        with pytest.raises(ValueError, match="not found"):
+            use_case.execute_by_id("STATION-999")
+    
+    def test_closed_loop_raises_error(self):
+        """Error Scenario: A closed loop thread refuses new work"""
+        loop_thread = EventLoopThread()
+        loop_thread.close()
+        coroutine = asyncio.sleep(0)
+        
+        with pytest.raises(RuntimeError, match="closed"):
+            loop_thread.run(coroutine)
+        coroutine.close()
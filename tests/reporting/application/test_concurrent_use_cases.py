@@ -0,0 +1,198 @@
+"""Stress test: search, report creation and resolution running at the same time"""
+import threading
+
+import pytest
+
+from contexts.discovery.application.use_cases.search_stations_use_case import SearchStationsUseCase
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.infrastructure.repositories.sqlite_station_repository import SqliteStationRepository
+from contexts.reporting.application.dtos.create_report_dto import CreateReportRequest
+from contexts.reporting.application.dtos.resolve_report_dto import ResolveReportRequest
+from contexts.reporting.application.use_cases.create_malfunction_report_use_case import CreateMalfunctionReportUseCase
+from contexts.reporting.application.use_cases.resolve_malfunction_use_case import ResolveMalfunctionUseCase
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService, ReportSubmission
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.infrastructure.repositories.sqlite_report_repository import SqliteReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+REPORTERS = 8
+ROUNDS = 25
+SEARCHERS = 4
+STATIONS = 40
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def repositories(request, tmp_path):
+    """Station and report repositories shared by every thread, like init_system's"""
+    if request.param == "in_memory":
+        yield InMemoryStationRepository(), InMemoryReportRepository()
+        return
+    
+    station_repository = SqliteStationRepository(tmp_path / "stations.sqlite3")
+    report_repository = SqliteReportRepository(tmp_path / "reports.sqlite3")
+    yield station_repository, report_repository
+    report_repository.close()
+    station_repository.close()
+
+
+class TestConcurrentUseCases:
+    """Hammer the shared repositories from many threads at once"""
+    
+    def test_search_report_and_resolve_concurrently(self, repositories):
+        """Happy Path: No errors, torn reads or lost updates under concurrent load"""
+        station_repository, report_repository = repositories
+        station_repository.save_all(
+            OperationalStation(StationId(f"STATION-{i:03d}"), f"Station {i}", "10178" if i % 2 else "10785")
+            for i in range(STATIONS)
+        )
+        service = MalfunctionReportService(report_repository, station_repository)
+        search = SearchStationsUseCase(station_repository)
+        create = CreateMalfunctionReportUseCase(service)
+        resolve = ResolveMalfunctionUseCase(service)
+        
+        errors = []
+        reporters_done = threading.Event()
+        start = threading.Barrier(REPORTERS + SEARCHERS)
+        
+        def reporter(number):
+            # Each reporter owns one station, so every report must succeed
+            station_id = f"STATION-{number:03d}"
+            start.wait()
+            for _ in range(ROUNDS):
+                created = create.execute(CreateReportRequest(
+                    station_id=station_id,
+                    malfunction_type=MalfunctionType.NOT_CHARGING,
+                    description="Charger stops after a few seconds"
+                ))
+                if not created.success:
+                    errors.append(("create", created.errors))
+                    return
+                
+                resolved = resolve.execute(ResolveReportRequest(ticket_id=created.ticket_id))
+                if not resolved.success:
+                    errors.append(("resolve", resolved.message))
+                    return
+        
+        def searcher():
+            start.wait()
+            while not reporters_done.is_set():
+                try:
+                    found = search.execute_by_postal_code("10178") + search.execute_by_postal_code("10785")
+                    if len(found) != STATIONS:
+                        errors.append(("search", len(found)))
+                    counts = station_repository.count_by_status()
+                    if sum(counts.values()) != STATIONS:
+                        errors.append(("station counts", counts))
+                    reports = service.get_all_reports()
+                    if sum(service.get_report_counts().values()) < len(reports):
+                        errors.append(("report counts", len(reports)))
+                except Exception as error:
+                    errors.append(("searcher", repr(error)))
+                    return
+        
+        reporter_threads = [threading.Thread(target=reporter, args=(n,)) for n in range(REPORTERS)]
+        searcher_threads = [threading.Thread(target=searcher) for _ in range(SEARCHERS)]
+        for thread in reporter_threads + searcher_threads:
+            thread.start()
+        for thread in reporter_threads:
+            thread.join()
+        reporters_done.set()
+        for thread in searcher_threads:
+            thread.join()
+        
+        assert errors == []
+        assert report_repository.count() == REPORTERS * ROUNDS
+        assert report_repository.count_by_status()[ReportStatus.RESOLVED] == REPORTERS * ROUNDS
+        assert station_repository.count_by_status()[StationStatus.AVAILABLE] == STATIONS
+
+
+class TestTwoServicesOneDatabase:
+    """Two processes' worth of services (own locks, own connections) sharing the SQLite files"""
+    
+    RACERS = 8
+    
+    @pytest.fixture
+    def services(self, tmp_path):
+        opened = []
+        
+        def open_service():
+            station_repository = SqliteStationRepository(tmp_path / "stations.sqlite3")
+            report_repository = SqliteReportRepository(tmp_path / "reports.sqlite3")
+            opened.append((station_repository, report_repository))
+            return MalfunctionReportService(report_repository, station_repository)
+        
+        api_service = open_service()
+        opened[0][0].save(OperationalStation(StationId("STATION-001"), "Station 1", "10178"))
+        ui_service = open_service()
+        yield api_service, ui_service, opened[0][0], opened[0][1]
+        for station_repository, report_repository in opened:
+            report_repository.close()
+            station_repository.close()
+    
+    def test_racing_services_open_one_ticket_per_station(self, services):
+        """Edge Case: Reports racing through both services open exactly one ticket"""
+        api_service, ui_service, station_repository, report_repository = services
+        
+        for _ in range(ROUNDS):
+            results = []
+            start = threading.Barrier(self.RACERS)
+            
+            def racer(service):
+                use_case = CreateMalfunctionReportUseCase(service)
+                start.wait()
+                results.append(use_case.execute(CreateReportRequest(
+                    station_id="STATION-001",
+                    malfunction_type=MalfunctionType.NOT_CHARGING,
+                    description="Charger stops after a few seconds"
+                )))
+            
+            threads = [
+                threading.Thread(target=racer, args=(api_service if n % 2 else ui_service,))
+                for n in range(self.RACERS)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            tickets = [result.ticket_id for result in results if result.success]
+            assert len(tickets) == 1
+            assert all("Station already marked as defective" in result.errors for result in results if not result.success)
+            
+            # The one ticket can always be resolved, from either service
+            resolved = ResolveMalfunctionUseCase(ui_service).execute(ResolveReportRequest(ticket_id=tickets[0]))
+            assert resolved.success
+            assert station_repository.find_by_id(StationId("STATION-001")).status == StationStatus.AVAILABLE
+        
+        assert report_repository.count_by_status()[ReportStatus.RESOLVED] == ROUNDS
+    
+    def test_racing_batches_open_one_ticket_per_station(self, services):
+        """Edge Case: Batches for the same station from both services open exactly one ticket"""
+        api_service, ui_service, station_repository, _ = services
+        results = []
+        start = threading.Barrier(self.RACERS)
+        
+        def racer(service):
+            start.wait()
+            results.extend(service.process_malfunction_report_batch([ReportSubmission(
+                station_id="STATION-001",
+                malfunction_type=MalfunctionType.NOT_CHARGING,
+                description="Charger stops after a few seconds"
+            )]))
+        
+        threads = [
+            threading.Thread(target=racer, args=(api_service if n % 2 else ui_service,))
+            for n in range(self.RACERS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert sum(result.success for result in results) == 1
+        assert station_repository.count_by_status()[StationStatus.DEFECTIVE] == 1
@@ -0,0 +1,197 @@
+"""Tests for CreateMalfunctionReportBatchUseCase"""
+import pytest
+from contexts.reporting.application.use_cases.create_malfunction_report_batch_use_case import CreateMalfunctionReportBatchUseCase
+from contexts.reporting.application.dtos.create_report_batch_dto import CreateReportBatchRequest
+from contexts.reporting.application.dtos.create_report_dto import CreateReportRequest
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
+from contexts.discovery.domain.entities.operational_station import OperationalStation
+from contexts.discovery.domain.value_objects.station_status import StationStatus
+from contexts.shared_kernel.common.station_id import StationId
+
+
+class CountingStationRepository(InMemoryStationRepository):
+    """Station repository that records lookups and bulk status writes"""
+    
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+        self.bulk_writes = 0
+    
+    def find_by_id(self, station_id):
+        self.lookups += 1
+        return super().find_by_id(station_id)
+    
+    def find_by_ids(self, station_ids):
+        self.lookups += 1
+        return super().find_by_ids(station_ids)
+    
+    def transition_status(self, station_ids, from_statuses, to_status):
+        self.bulk_writes += 1
+        return super().transition_status(station_ids, from_statuses, to_status)
+
+
+class FailingReportRepository(InMemoryReportRepository):
+    """Report repository whose bulk save fails until switched off"""
+    
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+    
+    def save_all(self, reports):
+        if self.failing:
+            raise RuntimeError("disk full")
+        return super().save_all(reports)
+
+
+def request(station_id, description="The charging station does not deliver power.", malfunction_type=MalfunctionType.NOT_CHARGING):
+    return CreateReportRequest(
+        station_id=station_id,
+        malfunction_type=malfunction_type,
+        description=description
+    )
+
+
+class TestCreateMalfunctionReportBatchUseCase:
+    """Test suite for CreateMalfunctionReportBatchUseCase"""
+    
+    @pytest.fixture
+    def setup(self):
+        """Setup repositories and use case with two stations"""
+        station_repo = CountingStationRepository()
+        report_repo = InMemoryReportRepository()
+        
+        for key in ("STATION-001", "STATION-002"):
+            station_repo.save(OperationalStation(
+                station_id=StationId(key),
+                name="Test Station",
+                postal_code="10178"
+            ))
+        
+        service = MalfunctionReportService(report_repo, station_repo)
+        use_case = CreateMalfunctionReportBatchUseCase(service)
+        
+        return use_case, station_repo, report_repo
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_batch_creates_a_ticket_per_station(self, setup):
+        """Happy Path: Each valid report gets a ticket and its station goes defective"""
+        use_case, station_repo, report_repo = setup
+        
+        response = use_case.execute(CreateReportBatchRequest(items=(
+            request("STATION-001"),
+            request("STATION-002"),
+        )))
+        
+        assert response.succeeded == 2
+        assert response.failed == 0
+        assert all(item.ticket_id for item in response.items)
+        assert report_repo.count_by_status()[ReportStatus.TICKET_CREATED] == 2
+        assert station_repo.find_by_id(StationId("STATION-001")).status == StationStatus.DEFECTIVE
+        assert station_repo.find_by_id(StationId("STATION-002")).status == StationStatus.DEFECTIVE
+    
+    def test_each_station_is_looked_up_once(self, setup):
+        """Happy Path: Many reports for one station share one lookup and one bulk write"""
+        use_case, station_repo, _ = setup
+        station_repo.lookups = 0
+        
+        use_case.execute(CreateReportBatchRequest(items=tuple(
+            request("STATION-001", description=f"Display shows error code {i}.")
+            for i in range(5)
+        )))
+        
+        assert station_repo.lookups == 1
+        assert station_repo.bulk_writes == 1
+    
+    def test_all_stations_fetched_in_one_lookup(self, setup):
+        """Happy Path: Reports for different stations share a single bulk lookup"""
+        use_case, station_repo, _ = setup
+        station_repo.lookups = 0
+        
+        response = use_case.execute(CreateReportBatchRequest(items=(
+            request("STATION-001"),
+            request("STATION-002"),
+            request("STATION-404"),
+        )))
+        
+        assert station_repo.lookups == 1
+        assert response.succeeded == 2
+        assert response.failed == 1
+    
+    def test_duplicates_are_coalesced(self, setup):
+        """Happy Path: A repeated report reuses the first report instead of creating another"""
+        use_case, _, report_repo = setup
+        
+        response = use_case.execute(CreateReportBatchRequest(items=(
+            request("STATION-001", description="Screen is  black."),
+            request("STATION-001", description="screen is black."),
+        )))
+        
+        first, second = response.items
+        assert first.success is True
+        assert second.coalesced is True
+        assert second.report_id == first.report_id
+        assert second.ticket_id == first.ticket_id
+        assert report_repo.count() == 1
+        assert (response.succeeded, response.coalesced, response.failed) == (1, 1, 0)
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_second_report_for_same_station_is_invalid(self, setup):
+        """Edge Case: Once a batch item marks a station defective, later ones are rejected"""
+        use_case, _, report_repo = setup
+        
+        response = use_case.execute(CreateReportBatchRequest(items=(
+            request("STATION-001", malfunction_type=MalfunctionType.NOT_CHARGING),
+            request("STATION-001", malfunction_type=MalfunctionType.DISPLAY_MALFUNCTION),
+        )))
+        
+        assert [item.success for item in response.items] == [True, False]
+        assert response.items[1].ticket_id is None
+        assert report_repo.count() == 2
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_invalid_items_do_not_fail_the_batch(self, setup):
+        """Error Scenario: Unknown stations and bad descriptions fail only their own item"""
+        use_case, _, _ = setup
+        
+        response = use_case.execute(CreateReportBatchRequest(items=(
+            request("STATION-999"),
+            request("STATION-001", description="short"),
+            request("STATION-002"),
+        )))
+        
+        assert [item.success for item in response.items] == [False, False, True]
+        assert response.items[0].has_errors
+        assert response.items[1].report_id == ""
+    
+    def test_failed_report_save_stores_nothing(self):
+        """Error Scenario: When the reports cannot be stored the claimed stations are released, so a retry works"""
+        station_repo = InMemoryStationRepository()
+        station_repo.save(OperationalStation(station_id=StationId("STATION-001"), name="Test Station", postal_code="10178"))
+        report_repo = FailingReportRepository()
+        use_case = CreateMalfunctionReportBatchUseCase(MalfunctionReportService(report_repo, station_repo))
+        batch = CreateReportBatchRequest(items=(request("STATION-001"),))
+        
+        failed = use_case.execute(batch)
+        
+        assert failed.failed == 1
+        assert "no report of the batch was stored" in failed.items[0].errors[0]
+        assert report_repo.count() == 0
+        assert station_repo.find_by_id(StationId("STATION-001")).status == StationStatus.AVAILABLE
+        
+        report_repo.failing = False
+        retried = use_case.execute(batch)
+        
+        assert retried.succeeded == 1
+        assert report_repo.count() == 1
+    
+    def test_empty_batch_raises_error(self):
+        """Error Scenario: A batch needs at least one item"""
+        with pytest.raises(ValueError, match="Batch cannot be empty"):
+            CreateReportBatchRequest(items=())
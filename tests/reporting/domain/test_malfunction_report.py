@@ -1,5 +1,6 @@
 import pytest
 from uuid import uuid4
+from datetime import datetime
 from contexts.reporting.domain.entities.malfunction_report import MalfunctionReport
 from contexts.shared_kernel.common.station_id import StationId
 from contexts.reporting.domain.value_objects.report_description import ReportDescription
@@ -38,4 +39,43 @@ def test_validate_report_with_existing_station():
     is_valid = report.validate(station_exists=True, station_is_operational=True)
     
     assert is_valid is True
-    assert report.status == ReportStatus.VALIDATED
\ No newline at end of file
+    assert report.status == ReportStatus.VALIDATED
+
+
+def test_restore_report_keeps_persisted_state():
+    """Test a report rebuilt by a repository keeps its lifecycle state"""
+    ticket_id = uuid4()
+    created_at = datetime(2024, 5, 1, 12, 30)
+    report = MalfunctionReport.restore(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.PAYMENT_FAILURE,
+        description=ReportDescription("Card reader rejects every card"),
+        reported_by=None,
+        status=ReportStatus.TICKET_CREATED,
+        ticket_id=ticket_id,
+        created_at=created_at
+    )
+    
+    assert report.status == ReportStatus.TICKET_CREATED
+    assert report.ticket_id == ticket_id
+    assert report.created_at == created_at
+    
+    report.resolve()
+    assert report.status == ReportStatus.RESOLVED
+
+def test_resolve_twice_raises_error():
+    """Test a resolved ticket cannot be resolved again"""
+    report = MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Vehicle not charging at all")
+    )
+    report.validate(station_exists=True, station_is_operational=True)
+    report.create_ticket(uuid4())
+    report.resolve()
+    
+    with pytest.raises(ValueError, match="already resolved"):
+        report.resolve()
+    assert report.status == ReportStatus.RESOLVED
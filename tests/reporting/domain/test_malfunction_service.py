@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 from contexts.reporting.domain.services.malfunction_report_service import MalfunctionReportService
 from contexts.discovery.domain.entities.operational_station import OperationalStation
@@ -6,6 +9,8 @@ from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
 from contexts.discovery.domain.value_objects.station_status import StationStatus
 from contexts.discovery.infrastructure.repositories.in_memory_station_repository import InMemoryStationRepository
 from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.shared_kernel.infrastructure.striped_lock import StripedLock
 
 
 class TestMalfunctionReportService:
@@ -91,4 +96,96 @@ class TestMalfunctionReportService:
         
         # Station should be available again
         station = service._station_repository.find_by_id(StationId("STATION-001"))
-        assert station.status == StationStatus.AVAILABLE
\ No newline at end of file
+        assert station.status == StationStatus.AVAILABLE
+
+
+class SlowStationRepository(InMemoryStationRepository):
+    """
+    Returns a fresh copy per read, like a database-backed repository,
+    and widens the window between reading a station and saving it
+    """
+    
+    def __init__(self, on_find=None):
+        super().__init__()
+        self._on_find = on_find or (lambda: time.sleep(0.01))
+    
+    def find_by_id(self, station_id):
+        station = super().find_by_id(station_id)
+        self._on_find()
+        if station is None:
+            return None
+        return OperationalStation(
+            station_id=station.station_id,
+            name=station.name,
+            postal_code=station.postal_code,
+            status=station.status
+        )
+
+
+class TestConcurrentReportProcessing:
+    """Report processing is atomic per station and parallel across stations"""
+    
+    def make_service(self, station_repo, station_ids):
+        for station_id in station_ids:
+            station_repo.save(OperationalStation(
+                station_id=StationId(station_id),
+                name="Test Charging Station",
+                postal_code="10178"
+            ))
+        return MalfunctionReportService(InMemoryReportRepository(), station_repo, StripedLock(stripes=64))
+    
+    def submit(self, service, station_id):
+        return service.submit_malfunction_report(
+            station_id=station_id,
+            malfunction_type=MalfunctionType.NOT_CHARGING,
+            description="Charger does not start a session"
+        )
+    
+    def test_simultaneous_reports_for_same_station(self):
+        """Test only one of many simultaneous reports creates a ticket, the rest are invalid"""
+        service = self.make_service(SlowStationRepository(), ["STATION-001"])
+        report_ids = [self.submit(service, "STATION-001") for _ in range(5)]
+        results = []
+        
+        threads = [
+            threading.Thread(target=lambda rid=rid: results.append(service.process_malfunction_report(rid)))
+            for rid in report_ids
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 5
+        assert sum(result.success for result in results) == 1
+        assert all(
+            result.errors == ["Station already marked as defective"]
+            for result in results if not result.success
+        )
+        counts = service.get_report_counts()
+        assert counts[ReportStatus.TICKET_CREATED] == 1
+        assert counts[ReportStatus.INVALID] == 4
+    
+    def test_different_stations_proceed_in_parallel(self):
+        """Test reports for stations on different stripes do not wait for each other"""
+        locks = StripedLock(stripes=64)
+        station_ids = ["STATION-001", "STATION-002"]
+        assert locks.stripe_of(station_ids[0]) != locks.stripe_of(station_ids[1])
+        
+        # Both processing threads must be inside the station read at once
+        both_inside = threading.Barrier(2, timeout=2)
+        service = self.make_service(SlowStationRepository(on_find=both_inside.wait), station_ids)
+        report_ids = [self.submit(service, station_id) for station_id in station_ids]
+        results = []
+        
+        threads = [
+            threading.Thread(target=lambda rid=rid: results.append(service.process_malfunction_report(rid)))
+            for rid in report_ids
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not both_inside.broken
+        assert [result.success for result in results] == [True, True]
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Tests for report lifecycle journaling and recovery"""
+from uuid import uuid4
+
+import pytest
+
+from contexts.reporting.domain.entities.malfunction_report import MalfunctionReport
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.value_objects.report_description import ReportDescription
+from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
+from contexts.reporting.infrastructure.repositories.journaled_report_repository import (
+    REPORT_STATUS_CHANGED,
+    REPORT_SUBMITTED,
+    JournaledReportRepository,
+)
+from contexts.shared_kernel.common.station_id import StationId
+from contexts.shared_kernel.infrastructure.event_journal import EventJournal
+
+
+def make_report():
+    return MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId("STATION-001"),
+        malfunction_type=MalfunctionType.CONNECTOR_ISSUE,
+        description=ReportDescription("Connector latch is broken"),
+        reported_by="anna@example.com"
+    )
+
+
+class TestJournaledReportRepository:
+    """Test reports and tickets survive a restart"""
+    
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return tmp_path / "reports"
+    
+    def start(self, directory, snapshot_every=1000):
+        journal = EventJournal(directory)
+        repository = JournaledReportRepository(InMemoryReportRepository(), journal, snapshot_every)
+        replayed = repository.recover()
+        return repository, journal, replayed
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_lifecycle_is_journaled_compactly(self, directory):
+        """Happy Path: One full event on submit, small events afterwards"""
+        repository, journal, _ = self.start(directory)
+        report = make_report()
+        repository.save(report)
+        repository.save(report)  # unchanged - no event
+        report.validate(station_exists=True, station_is_operational=True)
+        repository.save(report)
+        
+        events = list(journal.read())
+        
+        assert [e.event_type for e in events] == [REPORT_SUBMITTED, REPORT_STATUS_CHANGED]
+        assert set(events[1].data) == {"report_id", "status", "ticket_id"}
+        journal.close()
+    
+    def test_save_all_is_journaled_and_recovered(self, directory):
+        """Happy Path: A bulk save journals every report and replays after restart"""
+        repository, journal, _ = self.start(directory)
+        reports = [make_report() for _ in range(3)]
+        
+        assert repository.save_all(reports) == 3
+        assert [e.event_type for e in journal.read()] == [REPORT_SUBMITTED] * 3
+        journal.close()
+        
+        restarted, journal, replayed = self.start(directory)
+        
+        assert replayed == 3
+        assert restarted.count() == 3
+        journal.close()
+    
+    def test_reports_and_tickets_survive_restart(self, directory):
+        """Happy Path: A recovered report keeps its ticket and status"""
+        repository, journal, _ = self.start(directory)
+        report = make_report()
+        ticket_id = uuid4()
+        repository.save(report)
+        report.validate(station_exists=True, station_is_operational=True)
+        report.create_ticket(ticket_id)
+        repository.save(report)
+        journal.close()
+        
+        recovered, journal, replayed = self.start(directory)
+        found = recovered.find_by_ticket_id(ticket_id)
+        
+        assert replayed == 2
+        assert found.report_id == report.report_id
+        assert found.status == ReportStatus.TICKET_CREATED
+        assert found.reported_by == "anna@example.com"
+        assert found.created_at == report.created_at
+        journal.close()
+    
+    def test_recovery_from_snapshot_and_tail(self, directory):
+        """Happy Path: Snapshot plus the events after it rebuild every report"""
+        repository, journal, _ = self.start(directory, snapshot_every=3)
+        reports = [make_report() for _ in range(4)]
+        for report in reports:
+            repository.save(report)
+        reports[0].validate(station_exists=False, station_is_operational=False)
+        repository.save(reports[0])
+        journal.close()
+        
+        recovered, journal, replayed = self.start(directory, snapshot_every=3)
+        
+        assert replayed == 2
+        assert recovered.count() == 4
+        assert recovered.find_by_id(reports[0].report_id).status == ReportStatus.INVALID
+        journal.close()
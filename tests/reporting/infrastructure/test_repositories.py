@@ -4,6 +4,7 @@ from contexts.reporting.domain.entities.malfunction_report import MalfunctionRep
 from contexts.shared_kernel.common.station_id import StationId
 from contexts.reporting.domain.value_objects.report_description import ReportDescription
 from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
 from contexts.reporting.infrastructure.repositories.in_memory_report_repository import InMemoryReportRepository
 
 
@@ -54,4 +55,76 @@ class TestInMemoryReportRepository:
         
         station_reports = repository.find_by_station(station_id)
         
-        assert len(station_reports) == 2
\ No newline at end of file
+        assert len(station_reports) == 2
+    
+    def test_find_by_ticket_id(self, repository, sample_report):
+        """Test finding a report by the ticket created for it"""
+        ticket_id = uuid4()
+        sample_report.validate(station_exists=True, station_is_operational=True)
+        sample_report.create_ticket(ticket_id)
+        repository.save(sample_report)
+        
+        found = repository.find_by_ticket_id(ticket_id)
+        
+        assert found is sample_report
+    
+    def test_find_by_ticket_id_before_ticket_created(self, repository, sample_report):
+        """Test the ticket index picks up tickets created after the first save"""
+        repository.save(sample_report)
+        ticket_id = uuid4()
+        
+        assert repository.find_by_ticket_id(ticket_id) is None
+        
+        sample_report.validate(station_exists=True, station_is_operational=True)
+        sample_report.create_ticket(ticket_id)
+        repository.save(sample_report)
+        
+        assert repository.find_by_ticket_id(ticket_id) is sample_report
+    
+    def test_count_by_status_tracks_lifecycle(self, repository, sample_report):
+        """Test status counters follow the report lifecycle across saves"""
+        repository.save(sample_report)
+        assert repository.count() == 1
+        assert repository.count_by_status()[ReportStatus.SUBMITTED] == 1
+        
+        sample_report.validate(station_exists=True, station_is_operational=True)
+        sample_report.create_ticket(uuid4())
+        repository.save(sample_report)
+        counts = repository.count_by_status()
+        assert counts[ReportStatus.SUBMITTED] == 0
+        assert counts[ReportStatus.TICKET_CREATED] == 1
+        
+        sample_report.resolve()
+        repository.save(sample_report)
+        counts = repository.count_by_status()
+        assert counts[ReportStatus.TICKET_CREATED] == 0
+        assert counts[ReportStatus.RESOLVED] == 1
+        assert sum(counts.values()) == repository.count() == 1
+    
+    def test_find_by_status_and_open_follow_transitions(self, repository, sample_report):
+        """Test status membership moves with each save and find_open holds only unresolved tickets"""
+        invalid = MalfunctionReport(
+            report_id=uuid4(),
+            station_id=StationId("STATION-002"),
+            malfunction_type=MalfunctionType.OTHER,
+            description=ReportDescription("Report for a missing station")
+        )
+        invalid.validate(station_exists=False, station_is_operational=False)
+        repository.save_all([sample_report, invalid])
+        
+        assert [r.report_id for r in repository.find_by_status(ReportStatus.SUBMITTED)] == [sample_report.report_id]
+        assert repository.find_open() == []
+        
+        sample_report.validate(station_exists=True, station_is_operational=True)
+        sample_report.create_ticket(uuid4())
+        repository.save(sample_report)
+        
+        assert repository.find_by_status(ReportStatus.SUBMITTED) == []
+        assert [r.report_id for r in repository.find_open()] == [sample_report.report_id]
+        
+        sample_report.resolve()
+        repository.save(sample_report)
+        
+        assert repository.find_open() == []
+        assert [r.report_id for r in repository.find_by_status(ReportStatus.RESOLVED)] == [sample_report.report_id]
+        assert [r.report_id for r in repository.find_by_status(ReportStatus.INVALID)] == [invalid.report_id]
@@ -0,0 +1,230 @@
+"""Tests for the durable, group-committing SQLite report repository"""
+import sqlite3
+import threading
+from uuid import uuid4
+
+import pytest
+
+from contexts.reporting.domain.entities.malfunction_report import MalfunctionReport
+from contexts.reporting.domain.enums.malfunction_type import MalfunctionType
+from contexts.reporting.domain.enums.report_status import ReportStatus
+from contexts.reporting.domain.value_objects.report_description import ReportDescription
+from contexts.reporting.infrastructure.repositories.sqlite_report_repository import SqliteReportRepository
+from contexts.shared_kernel.common.station_id import StationId
+
+
+def make_report(station="STATION-001", reported_by=None):
+    return MalfunctionReport(
+        report_id=uuid4(),
+        station_id=StationId(station),
+        malfunction_type=MalfunctionType.NOT_CHARGING,
+        description=ReportDescription("Test malfunction report"),
+        reported_by=reported_by
+    )
+
+
+class TestSqliteReportRepository:
+    """Test SQLite implementation of report repository"""
+    
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        return tmp_path / "reports.sqlite3"
+    
+    @pytest.fixture
+    def repository(self, database_path):
+        repository = SqliteReportRepository(database_path)
+        yield repository
+        repository.close()
+    
+    # ==================== HAPPY PATH ====================
+    
+    def test_save_and_find_round_trips_all_fields(self, repository):
+        """Happy Path: A stored report comes back in the state it was saved"""
+        report = make_report(reported_by="anna@example.com")
+        report.validate(station_exists=True, station_is_operational=True)
+        report.create_ticket(uuid4())
+        repository.save(report)
+        
+        found = repository.find_by_id(report.report_id)
+        
+        assert found.report_id == report.report_id
+        assert found.station_id == report.station_id
+        assert found.malfunction_type == MalfunctionType.NOT_CHARGING
+        assert found.description == report.description
+        assert found.reported_by == "anna@example.com"
+        assert found.status == ReportStatus.TICKET_CREATED
+        assert found.ticket_id == report.ticket_id
+        assert found.created_at == report.created_at
+    
+    def test_reports_survive_restart(self, repository, database_path):
+        """Happy Path: Reports and tickets are still there after reopening"""
+        report = make_report()
+        ticket_id = uuid4()
+        report.validate(station_exists=True, station_is_operational=True)
+        report.create_ticket(ticket_id)
+        repository.save(report)
+        repository.close()
+        
+        reopened = SqliteReportRepository(database_path)
+        try:
+            assert reopened.find_by_ticket_id(ticket_id).report_id == report.report_id
+            assert reopened.count_by_status()[ReportStatus.TICKET_CREATED] == 1
+        finally:
+            reopened.close()
+    
+    def test_find_by_station_in_insertion_order(self, repository):
+        """Happy Path: Station lookups return that station's reports oldest first"""
+        first, second = make_report(), make_report()
+        repository.save(first)
+        repository.save(make_report(station="STATION-002"))
+        repository.save(second)
+        
+        reports = repository.find_by_station(StationId("STATION-001"))
+        
+        assert [r.report_id for r in reports] == [first.report_id, second.report_id]
+    
+    def test_count_by_status_tracks_lifecycle(self, repository):
+        """Happy Path: Re-saving updates the stored status in place"""
+        report = make_report()
+        repository.save(report)
+        report.validate(station_exists=True, station_is_operational=True)
+        report.create_ticket(uuid4())
+        repository.save(report)
+        report.resolve()
+        repository.save(report)
+        
+        counts = repository.count_by_status()
+        
+        assert counts[ReportStatus.RESOLVED] == 1
+        assert sum(counts.values()) == repository.count() == 1
+    
+    def test_find_open_and_find_by_status(self, repository):
+        """Happy Path: Only ticketed, unresolved reports are open"""
+        ticketed, resolved, submitted = make_report(), make_report(), make_report()
+        for report in (ticketed, resolved):
+            report.validate(station_exists=True, station_is_operational=True)
+            report.create_ticket(uuid4())
+        resolved.resolve()
+        repository.save_all([ticketed, resolved, submitted])
+        
+        assert [r.report_id for r in repository.find_open()] == [ticketed.report_id]
+        assert [r.report_id for r in repository.find_by_status(ReportStatus.RESOLVED)] == [resolved.report_id]
+        assert [r.report_id for r in repository.find_by_status(ReportStatus.SUBMITTED)] == [submitted.report_id]
+    
+    def test_concurrent_saves_share_commits(self, database_path):
+        """Happy Path: A burst of concurrent saves is coalesced into a few fsyncs"""
+        repository = SqliteReportRepository(database_path, max_batch_delay=0.05)
+        reports = [make_report() for _ in range(20)]
+        threads = [threading.Thread(target=repository.save, args=(report,)) for report in reports]
+        
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            assert repository.count() == 20
+            assert repository.commit_count < 20
+        finally:
+            repository.close()
+    
+    def test_save_all_is_one_commit(self, repository):
+        """Happy Path: A bulk save lands in a single group commit"""
+        reports = [make_report(station=f"STATION-{i:03d}") for i in range(50)]
+        commits_before = repository.commit_count
+        
+        saved = repository.save_all(reports)
+        
+        assert saved == 50
+        assert repository.count() == 50
+        assert repository.commit_count == commits_before + 1
+    
+    def test_runs_in_wal_mode_with_indexes(self, repository, database_path):
+        """Happy Path: The database uses WAL and indexes every lookup column"""
+        connection = sqlite3.connect(database_path)
+        try:
+            mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {row[1] for row in connection.execute("PRAGMA index_list(reports)")}
+        finally:
+            connection.close()
+        
+        assert mode == "wal"
+        assert {
+            "idx_reports_station_id",
+            "idx_reports_ticket_id",
+            "idx_reports_status",
+            "idx_reports_created_at",
+        } <= indexes
+    
+    # ==================== EDGE CASES ====================
+    
+    def test_in_memory_database(self):
+        """Edge Case: ':memory:' works for throwaway repositories"""
+        repository = SqliteReportRepository()
+        try:
+            report = make_report()
+            repository.save(report)
+            assert repository.find_by_id(report.report_id).report_id == report.report_id
+        finally:
+            repository.close()
+    
+    def test_unknown_ticket_returns_none(self, repository):
+        """Edge Case: Unknown tickets are not found"""
+        assert repository.find_by_ticket_id(uuid4()) is None
+    
+    # ==================== ERROR SCENARIOS ====================
+    
+    def test_save_after_close_raises_error(self, database_path):
+        """Error Scenario: A closed repository rejects writes"""
+        repository = SqliteReportRepository(database_path)
+        repository.close()
+        
+        with pytest.raises(RuntimeError, match="closed"):
+            repository.save(make_report())
+    
+    def test_invalid_batch_size_raises_error(self, database_path):
+        """Error Scenario: Batches must hold at least one save"""
+        with pytest.raises(ValueError, match="Batch size must be positive"):
+            SqliteReportRepository(database_path, max_batch_size=0)
+    
+    def test_unexpected_write_error_keeps_the_writer_alive(self, repository, monkeypatch):
+        """Error Scenario: A non-SQLite error fails only its save; the writer keeps committing"""
+        execute = repository._execute
+        
+        def broken(rows):
+            raise TypeError("row cannot be bound")
+        monkeypatch.setattr(repository, "_execute", broken)
+        
+        with pytest.raises(TypeError):
+            repository.save(make_report())
+        
+        monkeypatch.setattr(repository, "_execute", execute)
+        report = make_report()
+        repository.save(report)
+        assert repository.find_by_id(report.report_id) is not None
+    
+    def test_saves_racing_close_never_hang(self, database_path):
+        """Error Scenario: Every save racing close() is either committed or rejected"""
+        for _ in range(20):
+            repository = SqliteReportRepository(database_path)
+            outcomes = []
+            start = threading.Barrier(9)
+            
+            def saver():
+                start.wait()
+                try:
+                    repository.save(make_report())
+                    outcomes.append("saved")
+                except RuntimeError:
+                    outcomes.append("rejected")
+            
+            threads = [threading.Thread(target=saver, daemon=True) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            start.wait()
+            repository.close()
+            for thread in threads:
+                thread.join(timeout=5)
+            
+            assert not any(thread.is_alive() for thread in threads)
+            assert len(outcomes) == 8
@@ -0,0 +1,111 @@
+"""Tests for the append-only event journal"""
+import pytest
+
+from contexts.shared_kernel.infrastructure.event_journal import EventJournal, JournalCorruptionError
+
+
+class TestEventJournal:
+    """Test suite for EventJournal"""
+    
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return tmp_path / "journal"
+    
+    @pytest.fixture
+    def journal(self, directory):
+        journal = EventJournal(directory)
+        yield journal
+        journal.close()
+    
+    # HAPPY PATH
+    def test_append_and_read_in_order(self, journal):
+        journal.append("a", {"n": 1})
+        journal.append("b", {"n": 2})
+        
+        events = list(journal.read())
+        
+        assert [(e.seq, e.event_type, e.data) for e in events] == [(1, "a", {"n": 1}), (2, "b", {"n": 2})]
+    
+    def test_sequence_continues_after_reopen(self, journal, directory):
+        journal.append("a", {})
+        journal.close()
+        
+        reopened = EventJournal(directory)
+        try:
+            assert reopened.append("b", {}) == 2
+            assert [e.seq for e in reopened.read()] == [1, 2]
+        finally:
+            reopened.close()
+    
+    def test_read_after_sequence(self, journal):
+        for n in range(5):
+            journal.append("a", {"n": n})
+        
+        assert [e.seq for e in journal.read(after_seq=3)] == [4, 5]
+    
+    def test_snapshot_then_replay_only_later_events(self, journal):
+        journal.append("a", {})
+        journal.append("a", {})
+        seq = journal.write_snapshot({"state": "two events"})
+        journal.append("b", {})
+        
+        snapshot_seq, state = journal.latest_snapshot()
+        
+        assert snapshot_seq == seq == 2
+        assert state == {"state": "two events"}
+        assert [e.event_type for e in journal.read(snapshot_seq)] == ["b"]
+        assert journal.events_since_snapshot == 1
+    
+    def test_snapshot_compacts_old_segments_and_snapshots(self, journal, directory):
+        for round_number in range(3):
+            journal.append("a", {"round": round_number})
+            journal.write_snapshot({"round": round_number})
+        journal.append("a", {"round": 3})
+        
+        files = sorted(path.name for path in directory.iterdir())
+        
+        assert files == ["segment-000000000004.log", "snapshot-000000000003.snap"]
+    
+    # EDGE CASES
+    def test_torn_tail_is_truncated(self, journal, directory):
+        journal.append("a", {"n": 1})
+        journal.append("a", {"n": 2})
+        journal.close()
+        segment = next(directory.glob("segment-*.log"))
+        segment.write_bytes(segment.read_bytes()[:-3])
+        
+        reopened = EventJournal(directory)
+        try:
+            assert [e.seq for e in reopened.read()] == [1]
+            assert reopened.append("a", {"n": 3}) == 2
+        finally:
+            reopened.close()
+    
+    def test_corrupt_snapshot_is_ignored(self, journal, directory):
+        journal.append("a", {})
+        journal.write_snapshot({"ok": True})
+        snapshot = next(directory.glob("snapshot-*.snap"))
+        snapshot.write_bytes(snapshot.read_bytes()[:-1] + b"X")
+        
+        assert journal.latest_snapshot() is None
+    
+    def test_empty_journal(self, journal):
+        assert journal.last_seq == 0
+        assert list(journal.read()) == []
+        assert journal.latest_snapshot() is None
+    
+    # ERROR SCENARIOS
+    def test_corruption_before_tail_raises_error(self, journal, directory):
+        journal.append("a", {"n": 1})
+        journal.close()
+        reopened = EventJournal(directory)
+        reopened.append("a", {"n": 2})
+        reopened.close()
+        
+        first_segment = sorted(directory.glob("segment-*.log"))[0]
+        data = bytearray(first_segment.read_bytes())
+        data[-2] ^= 0xFF
+        first_segment.write_bytes(bytes(data))
+        
+        with pytest.raises(JournalCorruptionError, match="Corrupt record"):
+            EventJournal(directory)
@@ -0,0 +1,39 @@
+"""Tests for GeoPoint Value Object"""
+import pytest
+from contexts.shared_kernel.common.geo_point import GeoPoint, haversine_meters
+
+
+class TestGeoPoint:
+    """Test suite for GeoPoint value object"""
+    
+    # HAPPY PATH
+    def test_create_valid_point(self):
+        point = GeoPoint(52.5200, 13.4050)
+        assert point.latitude == 52.5200
+        assert point.longitude == 13.4050
+    
+    def test_distance_between_berlin_landmarks(self):
+        alexanderplatz = GeoPoint(52.5219, 13.4132)
+        brandenburger_tor = GeoPoint(52.5163, 13.3777)
+        assert alexanderplatz.distance_to(brandenburger_tor) == pytest.approx(2480, rel=0.02)
+    
+    # ERROR SCENARIOS
+    def test_latitude_out_of_range_raises_error(self):
+        with pytest.raises(ValueError, match="Latitude"):
+            GeoPoint(91.0, 13.4)
+    
+    def test_longitude_out_of_range_raises_error(self):
+        with pytest.raises(ValueError, match="Longitude"):
+            GeoPoint(52.5, -181.0)
+    
+    def test_nan_raises_error(self):
+        with pytest.raises(ValueError, match="must be numbers"):
+            GeoPoint(float("nan"), 13.4)
+    
+    # EDGE CASES
+    def test_distance_to_self_is_zero(self):
+        assert haversine_meters(52.5, 13.4, 52.5, 13.4) == 0
+    
+    def test_bounds_are_inclusive(self):
+        GeoPoint(90, 180)
+        GeoPoint(-90, -180)
@@ -1,6 +1,7 @@
 """Tests for PostalCode Value Object"""
 import pytest
 from contexts.shared_kernel.common.postal_code import PostalCode
+from contexts.shared_kernel.common.region import BERLIN, HAMBURG, MUENCHEN
 
 
 class TestPostalCode:
@@ -54,6 +55,22 @@ class TestPostalCode:
         with pytest.raises(ValueError, match="Berlin postal code"):
             PostalCode("01234")
     
+    def test_brandenburg_postal_code_is_not_berlin(self):
+        with pytest.raises(ValueError, match="Berlin postal code"):
+            PostalCode("15366")  # Hoppegarten, starts with 1 but outside Berlin
+    
+    # REGIONS
+    def test_hamburg_postal_code_valid_for_hamburg(self):
+        postal_code = PostalCode("20095", HAMBURG)
+        assert postal_code.value == "20095"
+    
+    def test_berlin_postal_code_invalid_for_munich(self):
+        with pytest.raises(ValueError, match="München postal code"):
+            PostalCode("10115", MUENCHEN)
+    
+    def test_region_does_not_affect_equality(self):
+        assert PostalCode("10115", BERLIN) == PostalCode("10115")
+    
     # VALUE OBJECT PROPERTIES
     def test_postal_code_is_immutable(self):
         postal_code = PostalCode("10115")
@@ -0,0 +1,98 @@
+"""Tests for ReadWriteLock"""
+import threading
+import time
+
+from contexts.shared_kernel.infrastructure.read_write_lock import ReadWriteLock
+
+
+class TestReadWriteLock:
+    """Test suite for the repository reader/writer lock"""
+    
+    # HAPPY PATH
+    def test_readers_share_the_lock(self):
+        lock = ReadWriteLock()
+        both_inside = threading.Barrier(2, timeout=2)
+        
+        def reader():
+            with lock.read_locked():
+                both_inside.wait()
+        
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not both_inside.broken
+    
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        writer_inside = threading.Event()
+        
+        def writer():
+            with lock.write_locked():
+                writer_inside.set()
+                time.sleep(0.05)
+                events.append("write done")
+        
+        def reader():
+            writer_inside.wait()
+            with lock.read_locked():
+                events.append("read")
+        
+        threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert events == ["write done", "read"]
+    
+    def test_waiting_writer_goes_before_new_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        first_reader_inside = threading.Event()
+        release_first_reader = threading.Event()
+        
+        def first_reader():
+            with lock.read_locked():
+                first_reader_inside.set()
+                release_first_reader.wait()
+        
+        def writer():
+            with lock.write_locked():
+                events.append("write")
+        
+        def late_reader():
+            with lock.read_locked():
+                events.append("late read")
+        
+        threads = [threading.Thread(target=first_reader)]
+        threads[0].start()
+        first_reader_inside.wait()
+        
+        threads.append(threading.Thread(target=writer))
+        threads[1].start()
+        while not lock._writers_waiting:
+            time.sleep(0.001)
+        threads.append(threading.Thread(target=late_reader))
+        threads[2].start()
+        time.sleep(0.02)
+        release_first_reader.set()
+        for thread in threads:
+            thread.join()
+        
+        assert events == ["write", "late read"]
+    
+    # EDGE CASES
+    def test_lock_released_on_error(self):
+        lock = ReadWriteLock()
+        try:
+            with lock.write_locked():
+                raise RuntimeError("save failed")
+        except RuntimeError:
+            pass
+        
+        with lock.read_locked():
+            pass
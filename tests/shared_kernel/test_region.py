@@ -0,0 +1,58 @@
+"""Tests for Region Value Object"""
+import pytest
+from contexts.shared_kernel.common.region import BERLIN, BAYERN, GERMANY, MUENCHEN, Region, get_region
+
+
+class TestRegion:
+    """Test suite for Region value object"""
+    
+    # HAPPY PATH
+    def test_berlin_contains_berlin_postal_codes(self):
+        assert BERLIN.contains_postal_code("10115")
+        assert BERLIN.contains_postal_code("14199")
+    
+    def test_berlin_rejects_brandenburg_postal_code(self):
+        assert not BERLIN.contains_postal_code("15366")
+    
+    def test_germany_contains_leading_zero_postal_code(self):
+        assert GERMANY.contains_postal_code("01067")
+    
+    def test_city_region_matches_on_ort(self):
+        assert MUENCHEN.matches("München", "Bayern")
+        assert not MUENCHEN.matches("Augsburg", "Bayern")
+    
+    def test_state_region_matches_on_bundesland(self):
+        assert BAYERN.matches("Augsburg", "Bayern")
+        assert not BAYERN.matches("Berlin", "Berlin")
+    
+    def test_region_without_names_matches_everything(self):
+        assert GERMANY.matches("Kiel", "Schleswig-Holstein")
+    
+    def test_search_term_only_for_single_name(self):
+        assert BERLIN.search_term == "Berlin"
+        assert GERMANY.search_term is None
+    
+    def test_distance_to_bounds(self):
+        assert BERLIN.distance_to(52.52, 13.405) == 0.0
+        assert BERLIN.distance_to(48.137, 11.575) > 400_000
+    
+    def test_get_region_by_key(self):
+        assert get_region("Berlin") is BERLIN
+    
+    def test_overlapping_postal_ranges(self):
+        assert MUENCHEN.overlaps(BAYERN)
+        assert GERMANY.overlaps(BERLIN)
+        assert not BERLIN.overlaps(BAYERN)
+    
+    # ERROR SCENARIOS
+    def test_unknown_region_raises_error(self):
+        with pytest.raises(ValueError, match="Unknown region"):
+            get_region("atlantis")
+    
+    def test_region_without_ranges_raises_error(self):
+        with pytest.raises(ValueError, match="at least one postal code range"):
+            Region("empty", "Empty", (), (), (), "EMPTY")
+    
+    def test_invalid_range_raises_error(self):
+        with pytest.raises(ValueError, match="Invalid postal code range"):
+            Region("bad", "Bad", (), (), ((20000, 10000),), "BAD")
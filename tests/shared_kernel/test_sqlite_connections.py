@@ -0,0 +1,90 @@
+"""Tests for the SQLite connection pool shared by the repositories"""
+import sqlite3
+import threading
+
+import pytest
+
+from contexts.shared_kernel.infrastructure.sqlite_connections import SqliteConnections
+
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT NOT NULL);"
+
+
+@pytest.fixture
+def connections(tmp_path):
+    connections = SqliteConnections(tmp_path / "pool.sqlite3", SCHEMA, max_readers=4)
+    with connections.write() as connection:
+        connection.execute("INSERT INTO items (name) VALUES ('first')")
+    yield connections
+    connections.close()
+
+
+def count_items(connections):
+    with connections.read() as connection:
+        return connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestSqliteConnections:
+    """Test suite for the bounded reader pool"""
+    
+    # HAPPY PATH
+    def test_short_lived_threads_reuse_readers(self, connections):
+        results = []
+        for _ in range(300):
+            thread = threading.Thread(target=lambda: results.append(count_items(connections)))
+            thread.start()
+            thread.join()
+        
+        assert results == [1] * 300
+        assert connections.open_readers == 1
+    
+    def test_concurrent_readers_stay_within_the_bound(self, connections):
+        # More threads than readers, all inside read() at once as far as the pool allows
+        start = threading.Barrier(32, timeout=5)
+        results = []
+        
+        def reader():
+            start.wait()
+            for _ in range(20):
+                results.append(count_items(connections))
+        
+        threads = [threading.Thread(target=reader) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 32 * 20
+        assert 1 <= connections.open_readers <= 4
+    
+    def test_readers_see_later_commits(self, connections):
+        assert count_items(connections) == 1
+        
+        with connections.write() as connection:
+            connection.execute("INSERT INTO items (name) VALUES ('second')")
+        
+        assert count_items(connections) == 2
+    
+    # EDGE CASES
+    def test_reader_returned_when_the_block_raises(self, connections):
+        with pytest.raises(sqlite3.OperationalError):
+            with connections.read() as connection:
+                connection.execute("SELECT * FROM missing_table")
+        
+        assert count_items(connections) == 1
+        assert connections.open_readers == 1
+    
+    def test_close_releases_every_reader(self, tmp_path):
+        connections = SqliteConnections(tmp_path / "closing.sqlite3", SCHEMA)
+        count_items(connections)
+        
+        connections.close()
+        
+        assert connections.open_readers == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            count_items(connections)
+    
+    # ERROR SCENARIOS
+    def test_pool_size_must_be_positive(self, tmp_path):
+        with pytest.raises(ValueError, match="Reader pool size"):
+            SqliteConnections(tmp_path / "invalid.sqlite3", SCHEMA, max_readers=0)
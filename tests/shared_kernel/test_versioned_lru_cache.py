@@ -0,0 +1,69 @@
+"""Tests for VersionedLruCache"""
+import pytest
+
+from contexts.shared_kernel.infrastructure.versioned_lru_cache import VersionedLruCache
+
+
+class TestVersionedLruCache:
+    """Test suite for the rendered map cache"""
+    
+    # HAPPY PATH
+    def test_same_version_hits_without_building(self):
+        cache = VersionedLruCache()
+        builds = []
+        
+        def build():
+            builds.append(1)
+            return "<html>10178</html>"
+        
+        first = cache.get_or_build("10178", 3, build)
+        second = cache.get_or_build("10178", 3, build)
+        
+        assert first == second == "<html>10178</html>"
+        assert len(builds) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_new_version_rebuilds_only_that_key(self):
+        cache = VersionedLruCache()
+        cache.put("10178", 1, "old")
+        cache.put("10785", 1, "other")
+        
+        assert cache.get("10178", 2) is None
+        assert cache.get_or_build("10178", 2, lambda: "new") == "new"
+        assert cache.get("10785", 1) == "other"
+    
+    def test_least_recently_used_is_evicted(self):
+        cache = VersionedLruCache(max_entries=2)
+        cache.put("a", 1, "A")
+        cache.put("b", 1, "B")
+        cache.get("a", 1)
+        
+        cache.put("c", 1, "C")
+        
+        assert len(cache) == 2
+        assert cache.get("b", 1) is None
+        assert cache.get("a", 1) == "A"
+        assert cache.get("c", 1) == "C"
+    
+    # EDGE CASES
+    def test_stale_build_does_not_replace_newer_entry(self):
+        cache = VersionedLruCache()
+        cache.put("10178", 5, "fresh")
+        
+        cache.put("10178", 4, "stale")
+        
+        assert cache.get("10178", 5) == "fresh"
+    
+    def test_invalidate_drops_one_key(self):
+        cache = VersionedLruCache()
+        cache.put("10178", 1, "A")
+        cache.put("10785", 1, "B")
+        
+        assert cache.invalidate("10178") is True
+        assert cache.invalidate("10178") is False
+        assert cache.get("10785", 1) == "B"
+    
+    # ERROR SCENARIOS
+    def test_invalid_size_raises_error(self):
+        with pytest.raises(ValueError, match="Cache size must be positive"):
+            VersionedLruCache(max_entries=0)